@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - benchmark and regression suite
+Builds every generator/renderer variant at every target size and compares
+wall time, CPU time, peak RSS, output bytes and decoded pixels with a baseline
+
+Each variant runs in a fresh interpreter with the build cache off, so timings
+include a full render and peak RSS belongs to that variant alone. Pixels are
+compared by digest of the decoded RGBA data, so a lossless re-encode passes
+but any visible change fails. With --keep-reference, outputs of the baseline
+run are kept and changed files also report how many pixels differ.
+
+Usage:
+    python3 icon_bench.py --save-baseline          # record on a known-good tree
+    python3 icon_bench.py                          # compare against it
+    python3 icon_bench.py --variants branded:pil,branded:sdf --runs 5 --threshold 0.2
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(HERE, ".icon-bench")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+REFERENCE_DIR = os.path.join(BENCH_DIR, "reference")
+
+# flavor:rasterizer[:tiled]; one variant per legacy script and renderer path
+DEFAULT_VARIANTS = [
+    "branded:pil", "branded:sdf", "branded:pil:tiled",
+    "branded-compact:pil", "minimal:pil", "minimal:sdf",
+]
+TILE_HEIGHT = 256
+# Gated metrics; timings get an absolute floor so sub-10ms jitter never fails a run
+METRICS = {"wall_ms": 10, "cpu_ms": 10, "peak_rss_mb": 2, "bytes": 0}
+
+
+def pixel_digest(path: str) -> str:
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return hashlib.sha256(image.convert("RGBA").tobytes()).hexdigest()
+
+
+def measure(variant: str, out_dir: str) -> Dict:
+    """Child side: one uncached build of `variant` into `out_dir`"""
+    sys.path.insert(0, HERE)
+    from icon_engine import SPEC_PATH, run_build
+
+    flavor, rasterizer, *mode = variant.split(":")
+    args = SimpleNamespace(
+        spec=SPEC_PATH, flavor=flavor, rasterizer=rasterizer, effort="default",
+        tile_height=TILE_HEIGHT if "tiled" in mode else 0, set="all", only=None,
+        jobs=1, no_cache=True, cache_dir=None, out_dir=out_dir)
+    wall_started, cpu_started = time.perf_counter(), time.process_time()
+    build = run_build(args)
+    wall, cpu = time.perf_counter() - wall_started, time.process_time() - cpu_started
+
+    outputs = {}
+    for result in build["results"]:
+        for path, size, *_ in result["outputs"]:
+            outputs[path] = {
+                "size": "x".join(map(str, result["size"])),
+                "bytes": size,
+                "render_ms": result["render_seconds"] * 1000,
+                "encode_ms": result["encode_seconds"] * 1000,
+                "pixels": pixel_digest(os.path.join(out_dir, path)),
+            }
+    return {
+        "wall_ms": wall * 1000,
+        "cpu_ms": cpu * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "bytes": sum(output["bytes"] for output in outputs.values()),
+        "outputs": outputs,
+    }
+
+
+def run_variant(variant: str, runs: int, keep: Optional[str]) -> Optional[Dict]:
+    """Median of `runs` child builds; None when the variant cannot run here"""
+    samples = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as out_dir:
+            completed = subprocess.run([sys.executable, __file__, "--child", variant, out_dir],
+                                       capture_output=True, text=True)
+            if completed.returncode != 0:
+                print(f"⚠️  {variant}: skipped ({(completed.stderr or completed.stdout).strip().splitlines()[-1]})")
+                return None
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            if keep and len(samples) == 1:
+                shutil.rmtree(keep, ignore_errors=True)
+                shutil.copytree(out_dir, keep)
+    merged = {metric: statistics.median(sample[metric] for sample in samples) for metric in METRICS}
+    merged["outputs"] = samples[0]["outputs"]
+    for path, output in merged["outputs"].items():
+        for field in ("render_ms", "encode_ms"):
+            output[field] = statistics.median(sample["outputs"][path][field] for sample in samples)
+    return merged
+
+
+def changed_pixels(reference: str, current: str) -> str:
+    from PIL import Image, ImageChops
+
+    with Image.open(reference) as before, Image.open(current) as after:
+        before, after = before.convert("RGBA"), after.convert("RGBA")
+        if before.size != after.size:
+            return f"size {before.size} -> {after.size}"
+        difference = ImageChops.difference(before, after)
+        # A pixel counts as changed when any of its channels differs
+        mask = None
+        for band in difference.split():
+            band = band.point(lambda value: 255 if value else 0)
+            mask = band if mask is None else ImageChops.lighter(mask, band)
+        changed = mask.histogram()[255]
+        peak = max(high for _, high in difference.getextrema())
+        return f"{changed} px differ, max channel delta {peak}"
+
+
+def compare(variant: str, current: Dict, baseline: Dict, threshold: float,
+            reference: Optional[str], out_dir: Optional[str]) -> List[str]:
+    """Regressions of `current` against `baseline`, one line each"""
+    problems = []
+    for metric, floor in METRICS.items():
+        before, after = baseline[metric], current[metric]
+        if after > before * (1 + threshold) and after - before > floor:
+            problems.append(f"{variant}: {metric} {before:.1f} -> {after:.1f} "
+                            f"(+{(after / before - 1) * 100 if before else 100:.0f}%)")
+    for path, output in current["outputs"].items():
+        previous = baseline["outputs"].get(path)
+        if previous is None:
+            continue
+        if output["bytes"] > previous["bytes"] * (1 + threshold):
+            problems.append(f"{variant}: {path} grew {previous['bytes']} -> {output['bytes']} bytes")
+        if output["pixels"] != previous["pixels"]:
+            detail = ""
+            if reference and out_dir and os.path.exists(os.path.join(reference, path)):
+                detail = f" ({changed_pixels(os.path.join(reference, path), os.path.join(out_dir, path))})"
+            problems.append(f"{variant}: {path} pixels changed{detail}")
+    missing = sorted(set(baseline["outputs"]) - set(current["outputs"]))
+    if missing:
+        problems.append(f"{variant}: outputs no longer built: {', '.join(missing)}")
+    return problems
+
+
+def print_variant(variant: str, result: Dict, baseline: Optional[Dict], verbose: bool):
+    def delta(metric):
+        if not baseline:
+            return ""
+        before = baseline[metric]
+        return f" ({(result[metric] / before - 1) * 100:+.0f}%)" if before else ""
+
+    print(f"{variant:<22} wall {result['wall_ms']:>7.0f}ms{delta('wall_ms'):<7} "
+          f"cpu {result['cpu_ms']:>7.0f}ms{delta('cpu_ms'):<7} "
+          f"rss {result['peak_rss_mb']:>6.1f}MB{delta('peak_rss_mb'):<7} "
+          f"{result['bytes'] / 1024:>7.1f}KB{delta('bytes')}")
+    if verbose:
+        for path, output in sorted(result["outputs"].items(), key=lambda item: item[0]):
+            print(f"    {path:<52} {output['size']:>10} {output['render_ms']:>7.1f}ms render "
+                  f"{output['encode_ms']:>7.1f}ms encode {output['bytes'] / 1024:>7.1f}KB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the asset generators and check for regressions")
+    parser.add_argument("--variants", default=",".join(DEFAULT_VARIANTS),
+                        help="Comma separated flavor:rasterizer[:tiled] variants")
+    parser.add_argument("--runs", type=int, default=3, help="Builds per variant (medians are reported)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Record this run as the baseline instead of comparing")
+    parser.add_argument("--keep-reference", action="store_true",
+                        help="With --save-baseline, keep the outputs for pixel diffs")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed relative growth per metric (0.15 = 15%%)")
+    parser.add_argument("--verbose", action="store_true", help="Per-output (per-size) timings")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(*args.child)))
+        return 0
+
+    baseline = {}
+    if not args.save_baseline:
+        try:
+            with open(args.baseline) as f:
+                baseline = json.load(f)["variants"]
+        except FileNotFoundError:
+            print(f"⚠️  No baseline at {args.baseline}; run with --save-baseline first. Reporting only.")
+
+    print(f"⏱️  Asset generator benchmark ({args.runs} runs per variant, medians)")
+    print("-" * 100)
+    results, problems = {}, []
+    for variant in args.variants.split(","):
+        reference = os.path.join(REFERENCE_DIR, variant.replace(":", "-"))
+        keep = reference if args.save_baseline and args.keep_reference else None
+        with tempfile.TemporaryDirectory() as out_dir:
+            result = run_variant(variant, args.runs, keep)
+            if result is None:
+                continue
+            results[variant] = result
+            print_variant(variant, result, baseline.get(variant), args.verbose)
+            if variant in baseline:
+                # Rebuild once into a kept directory so changed files can be diffed
+                diff_dir = None
+                if os.path.isdir(reference):
+                    diff_dir = out_dir
+                    subprocess.run([sys.executable, __file__, "--child", variant, out_dir],
+                                   capture_output=True, check=True)
+                problems += compare(variant, result, baseline[variant], args.threshold,
+                                    reference if diff_dir else None, diff_dir)
+    print("-" * 100)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"python": sys.version.split()[0], "variants": results}, f, indent=1, sort_keys=True)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return 0
+    if problems:
+        print(f"\n❌ {len(problems)} regression(s) beyond {args.threshold * 100:.0f}% or in pixels")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    if baseline:
+        print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - rasterizer benchmark
+Draws assets with the PIL and SDF rasterizers and compares draw time, peak
+memory and how many edge pixels end up antialiased
+
+Each measurement runs in a fresh interpreter, so the peak RSS of one
+rasterizer is not hidden by the high-water mark of the other.
+
+Usage:
+    python3 icon_bench_raster.py
+    python3 icon_bench_raster.py --flavor minimal --assets splash --runs 20
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def current_rss_kb() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def measure(flavor: str, asset_name: str, rasterizer: str, runs: int) -> dict:
+    """Child side: draw `asset_name` `runs` times without any layer caching"""
+    sys.path.insert(0, HERE)
+    import numpy as np
+    from icon_engine import IconEngine, load_spec
+
+    spec = load_spec()
+    engine = IconEngine(spec, flavor, rasterizer)
+    size = tuple(engine.assets[asset_name]["size"])
+    baseline = current_rss_kb()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        image = engine.draw(asset_name, size)
+        timings.append(time.perf_counter() - started)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    pixels = np.asarray(image)
+    alpha = pixels[..., 3] if pixels.shape[-1] == 4 else None
+    colors = len(np.unique(pixels.reshape(-1, pixels.shape[-1]), axis=0))
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "peak_mb": max(0, peak - baseline) / 1024,
+        "colors": colors,
+        "partial_alpha": int(((alpha > 0) & (alpha < 255)).sum()) if alpha is not None else None,
+    }
+
+
+def run_child(flavor: str, asset_name: str, rasterizer: str, runs: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", flavor, asset_name, rasterizer, str(runs)],
+        capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the PIL and SDF circle rasterizers")
+    parser.add_argument("--flavor", default="branded")
+    parser.add_argument("--assets", default="splash,icon,adaptive-icon",
+                        help="Comma separated asset names")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        flavor, asset_name, rasterizer, runs = args.child
+        print(json.dumps(measure(flavor, asset_name, rasterizer, int(runs))))
+        return 0
+
+    print(f"⏱️  Rasterizer benchmark ({args.flavor}, {args.runs} draws each)")
+    print("-" * 78)
+    print(f"{'asset':<16} {'raster':<6} {'median ms':>10} {'min ms':>8} {'peak MB':>8} "
+          f"{'colors':>7} {'AA alpha px':>12}")
+    for asset_name in args.assets.split(","):
+        for rasterizer in ("pil", "sdf"):
+            result = run_child(args.flavor, asset_name, rasterizer, args.runs)
+            partial = result["partial_alpha"]
+            print(f"{asset_name:<16} {rasterizer:<6} {result['median_ms']:>10.1f} {result['min_ms']:>8.1f} "
+                  f"{result['peak_mb']:>8.1f} {result['colors']:>7} "
+                  f"{'-' if partial is None else partial:>12}")
+    print("-" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - content-addressed build cache
+Lets icon_engine.py skip outputs whose inputs have not changed
+
+Every output has a cache key (a hash of its resolved layers, colors, size,
+encoding and the generator version, see IconEngine.cache_key). The manifest
+maps keys to the sha256 of the bytes they produced, and those bytes are kept
+under objects/, so an output is:
+  - unchanged: its file still holds the bytes recorded for its key; it is not
+    rewritten, so its mtime is preserved
+  - restored: the file is missing or stale but the key's bytes are cached
+  - pending: the key has never been built, so it has to be rendered
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get(
+    "ICON_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".icon-cache"))
+# Read once at import: os.umask can only be read by setting it, which is not
+# safe once the encoder threads are running
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def sha256_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Write via a temp file and rename, so readers never see a partial file
+    An existing file keeps its permissions; a new one gets the usual
+    0666 & ~umask instead of mkstemp's 0600.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~UMASK
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class BuildCache:
+    """Manifest of built outputs plus the content-addressed objects they came from"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.keys: Dict[str, str] = {}      # cache key -> content digest
+        self.files: Dict[str, Dict] = {}    # output path -> {key, digest, size, mtime_ns}
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.keys = manifest["keys"]
+                self.files = manifest["files"]
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "objects", digest[:2], digest)
+
+    def is_unchanged(self, path: str, key: str) -> bool:
+        """True when `path` still holds the bytes last built for `key`"""
+        entry = self.files.get(os.path.realpath(path))
+        if not entry or entry["key"] != key or self.keys.get(key) != entry["digest"]:
+            return False
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            return False
+        if info.st_size == entry["size"] and info.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        # Touched but maybe not modified: trust the content, not the timestamp
+        if sha256_file(path) != entry["digest"]:
+            return False
+        entry["mtime_ns"] = info.st_mtime_ns
+        return True
+
+    def restore(self, path: str, key: str) -> bool:
+        """Copy the cached bytes for `key` to `path`; False when they are not cached"""
+        digest = self.keys.get(key)
+        if not digest:
+            return False
+        try:
+            with open(self.object_path(digest), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        if hashlib.sha256(data).hexdigest() != digest:
+            return False
+        write_atomic(path, data)
+        self.remember(path, key, digest)
+        return True
+
+    def partition(self, outputs: List[Dict], keys: Dict[str, str],
+                  out_dir: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Split outputs into (pending, unchanged, restored)"""
+        pending, unchanged, restored = [], [], []
+        for output in outputs:
+            path = os.path.join(out_dir, output["path"])
+            key = keys[output["path"]]
+            if self.is_unchanged(path, key):
+                unchanged.append(output)
+            elif self.restore(path, key):
+                restored.append(output)
+            else:
+                pending.append(output)
+        return pending, unchanged, restored
+
+    def record(self, path: str, key: str):
+        """Store a freshly built output's bytes under their digest"""
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if not os.path.exists(self.object_path(digest)):
+            write_atomic(self.object_path(digest), data)
+        self.keys[key] = digest
+        self.remember(path, key, digest)
+
+    def remember(self, path: str, key: str, digest: str):
+        info = os.stat(path)
+        self.files[os.path.realpath(path)] = {
+            "key": key, "digest": digest, "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+    def save(self):
+        manifest = {"version": MANIFEST_VERSION, "keys": self.keys, "files": self.files}
+        write_atomic(self.manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - encode stage
+Writes each rendered image in the smallest form its format allows: lossless
+for PNG and WebP, near-lossless for AVIF
+
+PNG candidates are the image with the alpha channel dropped when it is
+opaque, collapsed to grayscale when every pixel is gray, and as an exact
+palette when it has at most 256 colors. Every candidate is verified to decode
+to the same pixels, encoded, and the smallest wins. WebP is lossless. AVIF is
+quality 100 with 4:4:4 chroma, which is near-lossless only (channels off by a
+few levels): Pillow's AVIF plugin cannot select the identity color matrix that
+lossless AVIF needs. Compression effort is one knob for all formats.
+
+Very large images can instead be streamed strip by strip into a PNG
+(write_png_strips), so they never exist in memory as a whole.
+"""
+
+import io
+import os
+import struct
+import tempfile
+import zlib
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image, ImageChops, features
+
+# Per-format encoder options for each effort level
+EFFORTS: Dict[str, Dict[str, Dict]] = {
+    "fast": {"PNG": {"compress_level": 3}, "WEBP": {"method": 0, "quality": 50},
+             "AVIF": {"speed": 10}},
+    "default": {"PNG": {"compress_level": 9}, "WEBP": {"method": 4, "quality": 80},
+                "AVIF": {"speed": 6}},
+    "max": {"PNG": {"optimize": True}, "WEBP": {"method": 6, "quality": 100},
+            "AVIF": {"speed": 0}},
+}
+FEATURES = {"WEBP": "webp", "AVIF": "avif"}
+
+
+def supported(image_format: str) -> bool:
+    """Whether this Pillow build can write `image_format`"""
+    return image_format not in FEATURES or bool(features.check(FEATURES[image_format]))
+
+
+def reduce_mode(image: Image.Image) -> Image.Image:
+    """Drop channels that carry no information: opaque alpha, identical RGB"""
+    if image.mode == "RGBA" and image.getchannel("A").getextrema() == (255, 255):
+        image = image.convert("RGB")
+    if image.mode in ("RGB", "RGBA"):
+        red, green, blue = image.getchannel("R"), image.getchannel("G"), image.getchannel("B")
+        if ImageChops.difference(red, green).getbbox() is None and \
+                ImageChops.difference(green, blue).getbbox() is None:
+            image = image.convert("LA" if image.mode == "RGBA" else "L")
+    return image
+
+
+def exact_palette(image: Image.Image) -> Optional[Image.Image]:
+    """The image as a palette PNG with no color loss, or None when that is impossible"""
+    colors = image.getcolors(256)
+    if colors is None or image.mode not in ("RGB", "RGBA"):
+        return None
+    if image.mode == "RGB":
+        # Median cut keeps every color when there are no more colors than slots
+        paletted = image.quantize(colors=len(colors), method=Image.Quantize.MEDIANCUT,
+                                  dither=Image.Dither.NONE)
+        if paletted.convert("RGB").tobytes() == image.tobytes():
+            return paletted
+    try:
+        import numpy as np
+    except ImportError:
+        # Octree is the only built-in RGBA quantizer; keep it only if it happens to be exact
+        paletted = image.quantize(colors=len(colors), method=Image.Quantize.FASTOCTREE,
+                                  dither=Image.Dither.NONE)
+        return paletted if paletted.convert(image.mode).tobytes() == image.tobytes() else None
+    # Exact mapping of every pixel to its color's index; packing each RGBA
+    # pixel into one uint32 keeps np.unique a flat sort
+    pixels = np.ascontiguousarray(image.convert("RGBA")).view(np.uint32).ravel()
+    palette, indices = np.unique(pixels, return_inverse=True)
+    paletted = Image.frombytes("P", image.size, indices.astype(np.uint8).tobytes())
+    channels = palette.view(np.uint8).reshape(-1, 4)[:, :len(image.mode)]
+    paletted.putpalette(np.ascontiguousarray(channels).tobytes(), image.mode)
+    return paletted
+
+
+def to_bytes(image: Image.Image, image_format: str, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def candidates(image: Image.Image) -> List[Tuple[str, Image.Image]]:
+    reduced = reduce_mode(image)
+    found = [(reduced.mode, reduced)]
+    paletted = exact_palette(reduced)
+    if paletted is not None:
+        found.append(("P", paletted))
+    return found
+
+
+def encode(image: Image.Image, image_format: str = "PNG",
+           effort: str = "default") -> Tuple[bytes, str]:
+    """Smallest encoding of `image` (lossless, near-lossless for AVIF); returns (data, chosen mode)"""
+    options = EFFORTS[effort].get(image_format, {})
+    if image_format == "PNG":
+        encoded = [(to_bytes(candidate, "PNG", **options), mode) for mode, candidate in candidates(image)]
+        return min(encoded, key=lambda item: len(item[0]))
+    if image_format == "WEBP":
+        reduced = reduce_mode(image)
+        reduced = reduced.convert("RGBA" if "A" in reduced.mode else "RGB")
+        return to_bytes(reduced, "WEBP", lossless=True, **options), reduced.mode
+    if image_format == "AVIF":
+        reduced = reduce_mode(image)
+        reduced = reduced.convert("RGBA" if "A" in reduced.mode else "RGB")
+        return to_bytes(reduced, "AVIF", quality=100, subsampling="4:4:4", **options), reduced.mode
+    return to_bytes(image, image_format), image.mode
+
+
+def baseline_size(image: Image.Image) -> int:
+    """Bytes of the old `image.save(path, 'PNG')` default, for the savings report"""
+    return len(to_bytes(image, "PNG"))
+
+
+PNG_COLOR_TYPES = {"L": 0, "RGB": 2, "P": 3, "LA": 4, "RGBA": 6}
+IDAT_SIZE = 1 << 16
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+class StreamingPNG:
+    """
+    PNG writer fed one strip of rows at a time
+    Rows go straight through a zlib stream into IDAT chunks, so memory stays
+    at one strip plus the compressor window whatever the image height.
+    Rows use filter type 0, like Pillow does for palette images.
+    """
+
+    def __init__(self, file, size: Tuple[int, int], mode: str, palette: Optional[bytes] = None,
+                 transparency: Optional[bytes] = None, compress_level: int = 9):
+        self.file = file
+        self.width = size[0]
+        self.compressor = zlib.compressobj(compress_level)
+        self.pending = bytearray()
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", size[0], size[1], 8,
+                                                   PNG_COLOR_TYPES[mode], 0, 0, 0)))
+        if palette is not None:
+            file.write(png_chunk(b"PLTE", palette))
+        if transparency is not None:
+            file.write(png_chunk(b"tRNS", transparency))
+
+    def write_rows(self, data: bytes, stride: int):
+        for offset in range(0, len(data), stride):
+            self.pending += self.compressor.compress(b"\x00" + data[offset:offset + stride])
+        while len(self.pending) >= IDAT_SIZE:
+            self.file.write(png_chunk(b"IDAT", bytes(self.pending[:IDAT_SIZE])))
+            del self.pending[:IDAT_SIZE]
+
+    def close(self):
+        self.pending += self.compressor.flush()
+        for offset in range(0, len(self.pending), IDAT_SIZE):
+            self.file.write(png_chunk(b"IDAT", bytes(self.pending[offset:offset + IDAT_SIZE])))
+        self.file.write(png_chunk(b"IEND", b""))
+
+
+def scan_strips(strips: Iterator[Image.Image]) -> Tuple[bool, Optional[List[Tuple[int, ...]]]]:
+    """(opaque, colors) over all strips; colors is None past 256 distinct colors"""
+    opaque, colors = True, set()
+    for strip in strips:
+        if strip.mode == "RGBA" and strip.getchannel("A").getextrema() != (255, 255):
+            opaque = False
+        found = strip.getcolors(256) if colors is not None else None
+        colors = None if found is None else colors | {color for _, color in found}
+        if colors is not None and len(colors) > 256:
+            colors = None
+    return opaque, sorted(colors) if colors is not None else None
+
+
+def write_png_strips(path: str, size: Tuple[int, int], mode: str,
+                     strips: Callable[[], Iterator[Image.Image]], effort: str = "default") -> str:
+    """
+    Stream an image produced strip by strip into a PNG at `path`
+    `strips` is called once to scan for the alpha channel and palette, and
+    again to write; returns the mode written
+    """
+    opaque, colors = scan_strips(strips())
+    if mode == "RGBA" and opaque:
+        mode = "RGB"
+        colors = sorted(set(color[:3] for color in colors)) if colors is not None else None
+    try:
+        import numpy as np
+    except ImportError:
+        colors = None
+
+    palette = transparency = lookup = None
+    if colors is not None:
+        # Rows become palette indices: each color packed little-endian into a
+        # uint32 (as an RGBA pixel reads), sorted so searchsorted finds its index
+        colors.sort(key=lambda color: sum(c << (8 * i) for i, c in enumerate(color)))
+        lookup = np.array([sum(c << (8 * i) for i, c in enumerate(color)) for color in colors],
+                          dtype=np.uint32)
+        palette = bytes(channel for color in colors for channel in color[:3])
+        if mode == "RGBA":
+            transparency = bytes(color[3] for color in colors)
+
+    # "optimize" (the max effort) implies level 9
+    level = EFFORTS[effort]["PNG"].get("compress_level", 9)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer = StreamingPNG(f, size, "P" if lookup is not None else mode, palette,
+                                  transparency, level)
+            for strip in strips():
+                strip = strip.convert(mode) if strip.mode != mode else strip
+                if lookup is None:
+                    writer.write_rows(strip.tobytes(), size[0] * len(mode))
+                    continue
+                pixels = np.array(strip.convert("RGBA"), dtype=np.uint8)
+                if mode == "RGB":
+                    pixels[..., 3] = 0
+                indices = np.searchsorted(lookup, pixels.view("<u4").ravel())
+                writer.write_rows(indices.astype(np.uint8).tobytes(), size[0])
+            writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return "P" if lookup is not None else mode
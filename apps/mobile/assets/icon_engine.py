@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine
+Renders every icon/splash variant from the declarative spec in icon_spec.json
+
+Each asset is a list of layers (fill, circle, text) drawn in design pixels.
+Circles are drawn by PIL, or with rasterizer "sdf" by the antialiased NumPy
+rasterizer in icon_sdf.py (which also supports gradient fills).
+An asset is drawn once at its master size; smaller outputs of the same aspect
+ratio are resampled from a halving pyramid of that master, so they are properly
+antialiased and cost a resize instead of a redraw. Layer stacks shared by
+several draws are cached, so adding a size or flavor is a spec change.
+
+Usage:
+    python3 icon_engine.py --flavor branded
+    python3 icon_engine.py --flavor minimal --only icon,favicon
+    python3 icon_engine.py --set all --jobs 8
+    python3 icon_engine.py --rasterizer sdf
+    python3 icon_engine.py --set all --no-cache
+    python3 icon_engine.py --set all --tile-height 256
+    python3 icon_engine.py --set all --watch
+
+Outputs whose inputs have not changed since the last build are skipped and
+left untouched (see icon_cache.py).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import PIL
+from PIL import Image, ImageDraw
+
+from icon_cache import DEFAULT_CACHE_DIR, BuildCache, write_atomic
+from icon_encode import EFFORTS, baseline_size, encode, supported, to_bytes, write_png_strips
+from icon_text import DEFAULT_FONT, TextLayout
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SPEC_PATH = os.path.join(HERE, "icon_spec.json")
+RASTERIZERS = ("pil", "sdf")
+# Bump when a change to this file alters rendered pixels or encoded bytes
+GENERATOR_VERSION = "6"
+# With a tile height set, PNG outputs at least this large are streamed in strips
+TILED_MIN_PIXELS = 2_000_000
+
+Size = Tuple[int, int]
+
+
+def hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def load_spec(path: str = SPEC_PATH) -> Dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def resolve_flavor(spec: Dict, flavor: str) -> Dict[str, Dict]:
+    """Return the flavor's assets with any `extends` chain merged in"""
+    flavors = spec["flavors"]
+    if flavor not in flavors:
+        raise KeyError(f"Unknown flavor '{flavor}' (available: {', '.join(flavors)})")
+    definition = flavors[flavor]
+    assets = {}
+    if definition.get("extends"):
+        assets.update(resolve_flavor(spec, definition["extends"]))
+    assets.update(definition.get("assets", {}))
+    return assets
+
+
+class IconEngine:
+    """
+    Renders assets of one flavor
+    Layer stacks that more than one planned render shares are cached
+    """
+
+    def __init__(self, spec: Dict, flavor: str, rasterizer: Optional[str] = None,
+                 effort: str = "default", tile_height: Optional[int] = None):
+        self.spec = spec
+        self.flavor = flavor
+        self.effort = effort
+        self.tile_height = spec.get("tile_height", 0) if tile_height is None else tile_height
+        self.rasterizer = rasterizer or spec.get("rasterizer", "pil")
+        if self.rasterizer not in RASTERIZERS:
+            raise ValueError(f"Unknown rasterizer '{self.rasterizer}'")
+        self.sdf = None
+        if self.rasterizer == "sdf":
+            try:
+                import icon_sdf
+            except ImportError:
+                raise SystemExit("❌ The sdf rasterizer needs numpy: pip install numpy")
+            self.sdf = icon_sdf
+        self.colors = {name: hex_to_rgb(value) for name, value in spec["colors"].items()}
+        self.assets = resolve_flavor(spec, flavor)
+        self.text = TextLayout(spec.get("fonts"))
+        self.shared: set = set()
+        self.cache: Dict[Tuple, Tuple[Image.Image, Dict]] = {}
+        # asset name -> [master, master/2, master/4, ...], built on demand
+        self.pyramids: Dict[str, List[Image.Image]] = {}
+        self.stats = {"layers_drawn": 0, "layers_reused": 0, "resampled": 0}
+
+    def color(self, name: str) -> Tuple[int, ...]:
+        return self.colors[name] if name in self.colors else hex_to_rgb(name)
+
+    def resolved_layer(self, layer: Dict) -> Dict:
+        """A layer with color names replaced by their RGB values"""
+        resolved = dict(layer)
+        if "color" in resolved:
+            resolved["color"] = self.color(resolved["color"])
+        if "gradient" in resolved:
+            resolved["gradient"] = dict(resolved["gradient"], to=self.color(resolved["gradient"]["to"]))
+        return resolved
+
+    def prefix_keys(self, asset_name: str, size: Size) -> List[Tuple]:
+        """Cache key of each layer prefix; identical stacks share keys across assets"""
+        asset = self.assets[asset_name]
+        base = (asset["mode"], tuple(size), tuple(asset["size"]))
+        keys, stack = [], ()
+        for layer in asset["layers"]:
+            stack += (json.dumps(self.resolved_layer(layer), sort_keys=True),)
+            keys.append(base + stack)
+        return keys
+
+    def cache_key(self, output: Dict) -> str:
+        """Hash of everything that determines an output file's bytes"""
+        asset = self.assets[output["asset"]]
+        payload = {
+            "generator": GENERATOR_VERSION,
+            "pillow": PIL.__version__,
+            "rasterizer": self.rasterizer,
+            "effort": self.effort,
+            "tile_height": self.tile_height if self.tiled(output) else 0,
+            "mode": asset["mode"],
+            "design_size": asset["size"],
+            "master_size": self.master_size(output["asset"]),
+            "layers": [self.resolved_layer(layer) for layer in asset["layers"]],
+            "fonts": self.text.used_files([layer.get("font", DEFAULT_FONT)
+                                           for layer in asset["layers"] if layer["type"] == "text"]),
+            "size": output.get("size") or asset["size"],
+            "encoding": {k: v for k, v in output.items() if k not in ("asset", "path", "size")},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def plan(self, jobs: List[Tuple[str, Size]]):
+        """Mark the layer prefixes used by more than one job for caching"""
+        seen: Dict[Tuple, int] = {}
+        for asset_name, size in set((name, tuple(size)) for name, size in jobs):
+            for key in self.prefix_keys(asset_name, size):
+                seen[key] = seen.get(key, 0) + 1
+        # Identical jobs (same asset and size) always share the finished image
+        for asset_name, size in jobs:
+            self.shared.add(self.prefix_keys(asset_name, size)[-1])
+        self.shared.update(key for key, count in seen.items() if count > 1)
+
+    def tiled(self, output: Dict) -> bool:
+        """Whether `output` is drawn and encoded in strips instead of as one image"""
+        size = output.get("size") or self.assets[output["asset"]]["size"]
+        return bool(self.tile_height) and output.get("format", "PNG") == "PNG" and \
+            size[0] * size[1] >= TILED_MIN_PIXELS
+
+    def master_size(self, asset_name: str) -> Size:
+        asset = self.assets[asset_name]
+        return tuple(asset.get("master_size") or asset["size"])
+
+    def derives(self, asset_name: str, size: Size) -> bool:
+        """True when `size` can be resampled from the master instead of drawn"""
+        master = self.master_size(asset_name)
+        size = tuple(size)
+        if size == master or size[0] > master[0] or size[1] > master[1]:
+            return False
+        # Resampling must not distort; other aspect ratios are drawn directly
+        return abs(size[0] * master[1] - size[1] * master[0]) <= max(master)
+
+    def render(self, asset_name: str, size: Optional[Size] = None) -> Image.Image:
+        """Render an asset at `size` (defaults to its design size)"""
+        size = tuple(size or self.assets[asset_name]["size"])
+        if self.derives(asset_name, size):
+            return self.downsample(asset_name, size)
+        return self.draw(asset_name, size)
+
+    def downsample(self, asset_name: str, size: Size) -> Image.Image:
+        """
+        Halve the master with a box filter until the next level would be
+        smaller than the target, then finish with one Lanczos resize
+        Levels are kept, so every smaller target reuses the ones above it
+        """
+        levels = self.pyramids.get(asset_name)
+        if levels is None:
+            levels = self.pyramids[asset_name] = [self.draw(asset_name, self.master_size(asset_name))]
+        index = 0
+        while True:
+            if index + 1 >= len(levels):
+                width, height = levels[index].size
+                if width // 2 < size[0] or height // 2 < size[1]:
+                    break
+                levels.append(levels[index].reduce(2))
+            if levels[index + 1].size[0] < size[0] or levels[index + 1].size[1] < size[1]:
+                break
+            index += 1
+        self.stats["resampled"] += 1
+        level = levels[index]
+        if level.size == size:
+            return level.copy()
+        return level.resize(size, Image.LANCZOS)
+
+    def draw(self, asset_name: str, size: Size) -> Image.Image:
+        """Draw an asset's layers at `size`, reusing cached layer prefixes"""
+        asset = self.assets[asset_name]
+        design = tuple(asset["size"])
+        size = tuple(size)
+        keys = self.prefix_keys(asset_name, size)
+
+        start = 0
+        for index in range(len(keys), 0, -1):
+            if keys[index - 1] in self.cache:
+                start = index
+                break
+        if start:
+            image, state = self.cache[keys[start - 1]]
+            image, state = image.copy(), dict(state)
+            self.stats["layers_reused"] += start
+        else:
+            background = (0, 0, 0, 0) if asset["mode"] == "RGBA" else (0, 0, 0)
+            image, state = Image.new(asset["mode"], size, background), {}
+
+        scale = min(size[0] / design[0], size[1] / design[1])
+        draw = ImageDraw.Draw(image)
+        index = start
+        while index < len(keys):
+            layers = asset["layers"]
+            if self.sdf and layers[index]["type"] == "circle":
+                # Composite the whole run of circles in one vectorized pass
+                end = index + 1
+                while end < len(layers) and layers[end]["type"] == "circle":
+                    end += 1
+                self.sdf.draw_circles(image, [self.sdf_circle(layer, size, scale)
+                                              for layer in layers[index:end]])
+            else:
+                end = index + 1
+                self.draw_layer(draw, layers[index], size, scale, state)
+            self.stats["layers_drawn"] += end - index
+            index = end
+            if keys[index - 1] in self.shared:
+                self.cache[keys[index - 1]] = (image.copy(), dict(state))
+        return image
+
+    def strips(self, asset_name: str, size: Size) -> Iterator[Image.Image]:
+        """
+        Draw an asset at `size` as horizontal strips of tile_height rows
+        Every strip draws all layers shifted up by its top row, so it matches
+        the same rows of a full draw while only one strip is in memory
+        """
+        asset = self.assets[asset_name]
+        design = tuple(asset["size"])
+        scale = min(size[0] / design[0], size[1] / design[1])
+        background = (0, 0, 0, 0) if asset["mode"] == "RGBA" else (0, 0, 0)
+        for top in range(0, size[1], self.tile_height):
+            strip = Image.new(asset["mode"], (size[0], min(self.tile_height, size[1] - top)), background)
+            draw, state = ImageDraw.Draw(strip), {}
+            layers = asset["layers"]
+            index = 0
+            while index < len(layers):
+                if self.sdf and layers[index]["type"] == "circle":
+                    end = index + 1
+                    while end < len(layers) and layers[end]["type"] == "circle":
+                        end += 1
+                    self.sdf.draw_circles(strip, [self.sdf_circle(layer, size, scale, top)
+                                                  for layer in layers[index:end]])
+                else:
+                    end = index + 1
+                    self.draw_layer(draw, layers[index], size, scale, state, top)
+                index = end
+            yield strip
+
+    def sdf_circle(self, layer: Dict, size: Size, scale: float, top: int = 0):
+        """A circle layer in continuous output coordinates (shifted up by `top`), unrounded"""
+        center = (size[0] / 2, size[1] / 2 - top)
+        if "center" in layer:
+            center = (layer["center"][0] * scale, layer["center"][1] * scale - top)
+        gradient = layer.get("gradient")
+        if gradient:
+            gradient = dict(gradient, to=self.color(gradient["to"]))
+        return self.sdf.Circle(center, layer["radius"] * scale, self.color(layer["color"]), gradient)
+
+    def draw_layer(self, draw: ImageDraw.ImageDraw, layer: Dict, size: Size,
+                   scale: float, state: Dict, top: int = 0):
+        """
+        Draw one layer with PIL (circle gradients need the sdf rasterizer and draw flat here)
+        `size` is the full output size; drawing is shifted up by `top` rows for strips
+        """
+        kind = layer["type"]
+        color = self.color(layer["color"])
+        if kind == "fill":
+            draw.rectangle([0, 0, size[0], size[1]], fill=color)
+        elif kind == "circle":
+            center_x, center_y = size[0] // 2, size[1] // 2
+            if "center" in layer:
+                center_x = round(layer["center"][0] * scale)
+                center_y = round(layer["center"][1] * scale)
+            radius = round(layer["radius"] * scale)
+            draw.ellipse([center_x - radius, center_y - radius - top,
+                          center_x + radius, center_y + radius - top], fill=color)
+        elif kind == "text":
+            # Center the ink box of the cached run, not the pen position
+            font_size = layer.get("font_size")
+            run = self.text.run(layer["text"], layer.get("font", DEFAULT_FONT),
+                                round(font_size * scale) if font_size else None)
+            text_width, text_height = run.size
+            text_x = (size[0] - text_width) // 2
+            if "below" in layer and "text_bottom" in state:
+                text_y = state["text_bottom"] + round(layer["below"] * scale)
+            else:
+                text_y = (size[1] - text_height) // 2
+            draw.bitmap((text_x, text_y - top), run.mask, fill=color)
+            state["text_bottom"] = text_y + text_height
+        else:
+            raise ValueError(f"Unknown layer type '{kind}'")
+
+    def build(self, outputs: List[Dict], out_dir: str = ".", jobs: Optional[int] = 1) -> List[Dict]:
+        """
+        Render and save every output; returns one result per distinct render
+        With jobs > 1 (or None for one per CPU) tasks run in a process pool
+        """
+        tasks = plan_tasks(self, outputs)
+        if (jobs or os.cpu_count() or 1) == 1 or len(tasks) == 1:
+            self.plan([(asset_name, self.master_size(asset_name) if self.derives(asset_name, size) else size)
+                       for asset_name, renders in tasks for size, _ in renders])
+            return [result for asset_name, renders in tasks
+                    for result in render_task(self, asset_name, renders, out_dir)]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(self.spec, self.flavor, self.rasterizer, self.effort,
+                                           self.tile_height)) as pool:
+            futures = [pool.submit(render_in_worker, asset_name, renders, out_dir)
+                       for asset_name, renders in tasks]
+            for future in as_completed(futures):
+                results.extend(future.result())
+        return results
+
+
+Task = Tuple[str, List[Tuple[Size, List[Dict]]]]
+
+
+def plan_tasks(engine: IconEngine, outputs: List[Dict]) -> List[Task]:
+    """
+    Group outputs into pool tasks, largest first
+    All sizes resampled from one master share a task so the master is drawn
+    once; sizes that must be drawn directly get their own task. Starting the
+    biggest work first keeps a pool's wall time close to the largest task.
+    """
+    renders: Dict[Tuple[str, Size, bool], List[Dict]] = {}
+    for output in outputs:
+        size = tuple(output.get("size") or engine.assets[output["asset"]]["size"])
+        renders.setdefault((output["asset"], size, engine.tiled(output)), []).append(output)
+
+    tasks: Dict[Tuple[str, Size, bool], List[Tuple[Size, List[Dict]]]] = {}
+    for (asset_name, size, tiled), group in renders.items():
+        master = engine.master_size(asset_name)
+        # Tiled outputs are drawn strip by strip and never need the master
+        shares_master = not tiled and (size == master or engine.derives(asset_name, size))
+        key = (asset_name, master if shares_master else size, tiled)
+        tasks.setdefault(key, []).append((size, group))
+    ordered = sorted(tasks.items(), key=lambda item: -(item[0][1][0] * item[0][1][1]))
+    # Largest size first inside a task so pyramid levels are built top-down
+    return [(asset_name, sorted(group, key=lambda r: -(r[0][0] * r[0][1])))
+            for (asset_name, _, _), group in ordered]
+
+
+def ico_frames(engine: IconEngine, asset_name: str, image: Image.Image,
+               output: Dict) -> Optional[List[Image.Image]]:
+    """
+    Every frame of an ICO output, largest first, each its own pyramid render
+    instead of Pillow's resize; None for other formats. Call from the thread
+    that owns the engine: rendering fills its pyramid and text caches.
+    """
+    if output.get("format", "PNG") != "ICO":
+        return None
+    sizes = sorted(output.get("ico_sizes", [image.size[0]]), reverse=True)
+    return [engine.render(asset_name, (n, n)) for n in sizes]
+
+
+def save_output(engine: IconEngine, image: Image.Image, output: Dict, out_dir: str,
+                frames: Optional[List[Image.Image]] = None) -> Tuple[int, int, str, float]:
+    """
+    Encode and write one output file (ICO outputs from `frames`, see ico_frames)
+    Returns (bytes written, bytes of a default PNG save, chosen mode, seconds)
+    """
+    started = time.perf_counter()
+    path = os.path.join(out_dir, output["path"])
+    image_format = output.get("format", "PNG")
+    if image_format == "ICO":
+        data = to_bytes(frames[0], "ICO", sizes=[frame.size for frame in frames],
+                        append_images=frames[1:])
+        write_atomic(path, data)
+        return len(data), len(data), image.mode, time.perf_counter() - started
+    data, mode = encode(image, image_format, engine.effort)
+    write_atomic(path, data)
+    return len(data), baseline_size(image), mode, time.perf_counter() - started
+
+
+def save_tiled(engine: IconEngine, asset_name: str, size: Size, output: Dict,
+               out_dir: str) -> Tuple[int, Optional[int], str, float]:
+    """
+    Stream one PNG strip by strip; peak memory is one strip, not the image
+    There is no full image to encode the default way, so no baseline size
+    """
+    started = time.perf_counter()
+    path = os.path.join(out_dir, output["path"])
+    mode = write_png_strips(path, size, engine.assets[asset_name]["mode"],
+                            lambda: engine.strips(asset_name, size), engine.effort)
+    return os.path.getsize(path), None, f"{mode}, tiled", time.perf_counter() - started
+
+
+def render_task(engine: IconEngine, asset_name: str, renders: List[Tuple[Size, List[Dict]]],
+                out_dir: str) -> List[Dict]:
+    """
+    Render each size once and encode every output that uses it, and time both
+    stages. Encodes run on a thread pool (Pillow releases the GIL while
+    compressing), overlapping with each other and with the next render.
+    Tiled outputs are drawn and encoded together, one strip at a time.
+    """
+    rendered = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as encoders:
+        for size, outputs in renders:
+            if engine.tiled(outputs[0]):
+                futures = [encoders.submit(save_tiled, engine, asset_name, size, output, out_dir)
+                           for output in outputs]
+                rendered.append((size, outputs, 0.0, futures))
+                continue
+            started = time.perf_counter()
+            image = engine.render(asset_name, size)
+            # Encoder threads only read `image` and the frames; all rendering stays here
+            frames = [ico_frames(engine, asset_name, image, output) for output in outputs]
+            render_seconds = time.perf_counter() - started
+            futures = [encoders.submit(save_output, engine, image, output, out_dir, output_frames)
+                       for output, output_frames in zip(outputs, frames)]
+            rendered.append((size, outputs, render_seconds, futures))
+
+    results = []
+    for size, outputs, render_seconds, futures in rendered:
+        saved = [future.result() for future in futures]
+        encode_seconds = sum(seconds for _, _, _, seconds in saved)
+        results.append({
+            "asset": asset_name,
+            "size": size,
+            "outputs": [(output["path"], written, baseline, mode)
+                        for output, (written, baseline, mode, _) in zip(outputs, saved)],
+            "render_seconds": render_seconds,
+            "encode_seconds": encode_seconds,
+            "seconds": render_seconds + encode_seconds,
+            "pid": os.getpid(),
+        })
+    return results
+
+
+_worker_engine: Optional[IconEngine] = None
+
+
+def init_worker(spec: Dict, flavor: str, rasterizer: str, effort: str, tile_height: int):
+    global _worker_engine
+    _worker_engine = IconEngine(spec, flavor, rasterizer, effort, tile_height)
+
+
+def render_in_worker(asset_name: str, renders: List[Tuple[Size, List[Dict]]],
+                     out_dir: str) -> List[Dict]:
+    """
+    Pool task: the worker encodes and writes its own files, so only timings
+    travel back to the parent and no pixel buffers are pickled
+    """
+    return render_task(_worker_engine, asset_name, renders, out_dir)
+
+
+def select_outputs(spec: Dict, assets: Dict, sets: Optional[List[str]] = None,
+                   only: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Outputs of the chosen sets (all when `sets` contains "all") for assets this
+    flavor has, minus formats this Pillow build cannot write
+    """
+    output_sets = spec["output_sets"]
+    names = list(output_sets) if not sets or "all" in sets else sets
+    unknown = [name for name in names if name not in output_sets]
+    if unknown:
+        raise KeyError(f"Unknown output set(s): {', '.join(unknown)} (available: {', '.join(output_sets)})")
+    selected = [o for name in names for o in output_sets[name]
+                if o["asset"] in assets and (not only or o["asset"] in only or o["path"] in only)]
+    for image_format in sorted(set(o.get("format", "PNG") for o in selected)):
+        if not supported(image_format):
+            print(f"⚠️  Skipping {image_format} outputs: this Pillow build has no {image_format} encoder")
+    return [o for o in selected if supported(o.get("format", "PNG"))]
+
+
+def main(argv=None, flavor: str = "branded", title: str = "CRYB Mobile App Icons"):
+    parser = argparse.ArgumentParser(description="Render CRYB mobile assets from the spec")
+    parser.add_argument("--flavor", default=flavor)
+    parser.add_argument("--spec", default=SPEC_PATH)
+    parser.add_argument("--out-dir", default=".")
+    parser.add_argument("--set", default="default",
+                        help="Comma separated output sets from the spec, or 'all'")
+    parser.add_argument("--only", help="Comma separated asset names or output paths")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Worker processes (0 = one per CPU, 1 = render in-process)")
+    parser.add_argument("--rasterizer", choices=RASTERIZERS,
+                        help="Circle rasterizer (default: the spec's, else pil)")
+    parser.add_argument("--effort", choices=EFFORTS, default="default",
+                        help="Compression effort for PNG, WebP and AVIF")
+    parser.add_argument("--tile-height", type=int,
+                        help=f"Stream PNGs of {TILED_MIN_PIXELS / 1e6:.0f}MP or more in strips of this "
+                             "many rows (default: the spec's, else 0 = off)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render and rewrite every output, ignoring the build cache")
+    parser.add_argument("--watch", action="store_true",
+                        help="Rebuild the outputs a spec or source edit affects, until Ctrl+C")
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        from icon_watch import watch
+        return watch(args, title)
+
+    print(f"🎨 Creating {title} ({args.flavor})...")
+    try:
+        build = run_build(args)
+    except Exception as e:
+        print(f"❌ Error creating icons: {e}")
+        return False
+    print_report(build)
+    return True
+
+
+def run_build(args, force: bool = False, spec: Optional[Dict] = None) -> Dict:
+    """Build the selected outputs (of args.spec unless `spec` is given), skipping cached ones unless `force`"""
+    spec = spec or load_spec(args.spec)
+    engine = IconEngine(spec, args.flavor, args.rasterizer, args.effort, args.tile_height)
+    outputs = select_outputs(spec, engine.assets, args.set.split(","),
+                             args.only.split(",") if args.only else None)
+    started = time.perf_counter()
+    unchanged, restored = [], []
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+    if cache:
+        keys = {output["path"]: engine.cache_key(output) for output in outputs}
+        if not force:
+            outputs, unchanged, restored = cache.partition(outputs, keys, args.out_dir)
+    results = engine.build(outputs, args.out_dir, args.jobs or None) if outputs else []
+    if cache:
+        for result in results:
+            for path, *_ in result["outputs"]:
+                cache.record(os.path.join(args.out_dir, path), keys[path])
+        cache.save()
+    return {
+        "engine": engine,
+        "results": results,
+        "unchanged": unchanged,
+        "restored": restored,
+        "wall": time.perf_counter() - started,
+    }
+
+
+def print_report(build: Dict):
+    results, unchanged, restored = build["results"], build["unchanged"], build["restored"]
+    for result in results:
+        width, height = result["size"]
+        for path, size, baseline, mode in result["outputs"]:
+            if baseline is None:
+                print(f"✅ Created {path} ({width}x{height} {mode}, {size / 1024:.1f} KB)")
+                continue
+            saved = baseline - size
+            print(f"✅ Created {path} ({width}x{height} {mode}, {size / 1024:.1f} KB, "
+                  f"saved {saved / 1024:.1f} KB / {saved * 100 / baseline:.0f}% vs default PNG)")
+        print(f"   ⏱️  {result['asset']} {width}x{height}: {result['seconds'] * 1000:.0f}ms "
+              f"(render {result['render_seconds'] * 1000:.0f}ms, encode {result['encode_seconds'] * 1000:.0f}ms)")
+    for output in restored:
+        print(f"♻️  Restored {output['path']} from the build cache")
+    files = sum(len(result["outputs"]) for result in results)
+    slowest = max((result["seconds"] for result in results), default=0)
+    if unchanged:
+        print(f"\n✔️  {len(unchanged)} unchanged outputs skipped")
+    compared = [(size, base) for result in results for _, size, base, _ in result["outputs"]
+                if base is not None]
+    written = sum(size for size, _ in compared)
+    baseline = sum(base for _, base in compared)
+    if compared:
+        print(f"📦 {written / 1024:.1f} KB written, {(baseline - written) / 1024:.1f} KB saved "
+              f"vs default PNG encoding")
+    print(f"\n🎉 All {files + len(unchanged) + len(restored)} CRYB assets generated successfully!")
+    print(f"⏱️  Wall time {build['wall'] * 1000:.0f}ms; largest single asset {slowest * 1000:.0f}ms; "
+          f"serial sum {sum(result['seconds'] for result in results) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - text layout
+Loads brand fonts once and caches rasterized text runs per font and size
+
+A run is the text's antialiased coverage mask cropped to its ink box, so
+centering uses the glyphs actually drawn (not the advance box plus bearings)
+and every later draw of the same text at the same size is a mask blit.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FONT = "default"
+
+
+class TextRun:
+    """Coverage mask of one text run, and where its ink sits relative to the pen"""
+
+    def __init__(self, mask: Image.Image, ink_box: Tuple[int, int, int, int]):
+        self.mask = mask
+        self.ink_box = ink_box
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.ink_box[2] - self.ink_box[0], self.ink_box[3] - self.ink_box[1]
+
+
+class TextLayout:
+    """
+    Font registry plus a run cache shared by every asset and size of a build
+    `fonts` is the spec's {"name": {"files": [candidate, ...]}}; candidates
+    are tried in order (relative to this directory, then Pillow's font
+    search path) and Pillow's built-in font is the last resort.
+    """
+
+    def __init__(self, fonts: Optional[Dict[str, Dict]] = None):
+        self.fonts = fonts or {}
+        self.files: Dict[str, Optional[str]] = {}
+        self.loaded: Dict[Tuple[str, Optional[int]], ImageFont.ImageFont] = {}
+        self.runs: Dict[Tuple[str, Optional[int], str], TextRun] = {}
+        self.stats = {"fonts_loaded": 0, "runs_rasterized": 0, "runs_reused": 0}
+
+    def font_file(self, name: str) -> Optional[str]:
+        """Resolved TrueType file for a font name; None means Pillow's built-in font"""
+        if name not in self.files:
+            self.files[name] = None
+            if name != DEFAULT_FONT and name not in self.fonts:
+                raise KeyError(f"Unknown font '{name}' (spec fonts: {', '.join(self.fonts) or 'none'})")
+            for candidate in self.fonts.get(name, {}).get("files", []):
+                local = os.path.join(HERE, candidate)
+                path = local if os.path.exists(local) else candidate
+                try:
+                    font = ImageFont.truetype(path, 12)
+                except OSError:
+                    continue
+                self.files[name] = font.path
+                break
+        return self.files[name]
+
+    def font(self, name: str, size: Optional[int]) -> ImageFont.ImageFont:
+        key = (name, size)
+        if key not in self.loaded:
+            path = self.font_file(name)
+            if path:
+                self.loaded[key] = ImageFont.truetype(path, size or 10)
+            elif size:
+                try:
+                    self.loaded[key] = ImageFont.load_default(size)
+                except TypeError:
+                    self.loaded[key] = ImageFont.load_default()
+            else:
+                self.loaded[key] = ImageFont.load_default()
+            self.stats["fonts_loaded"] += 1
+        return self.loaded[key]
+
+    def run(self, text: str, name: str = DEFAULT_FONT, size: Optional[int] = None) -> TextRun:
+        """Rasterize `text` once per font and size"""
+        key = (name, size, text)
+        cached = self.runs.get(key)
+        if cached is not None:
+            self.stats["runs_reused"] += 1
+            return cached
+        font = self.font(name, size)
+        probe = ImageDraw.Draw(Image.new("L", (1, 1)))
+        left, top, right, bottom = probe.textbbox((0, 0), text, font=font)
+        mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+        run = self.runs[key] = TextRun(mask, (left, top, right, bottom))
+        self.stats["runs_rasterized"] += 1
+        return run
+
+    def used_files(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """Resolved files of `names`, for build cache keys"""
+        return {name: self.font_file(name) for name in sorted(set(names))}
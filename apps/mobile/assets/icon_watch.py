@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+CRYB Mobile Asset Engine - watch mode
+Rebuilds only the outputs an edit affects, for fast design iteration
+
+Polls the spec and the engine sources. A spec edit is diffed asset by asset
+(resolved colors included) to report what changed, and the rebuild goes
+through the build cache, so only outputs whose cache key moved are rendered.
+Builds run on a background thread; edits made during a build are coalesced
+into one follow-up build. Editing engine code restarts the watcher and forces
+a full rebuild, since a code change does not alter cache keys.
+
+Usage:
+    python3 icon_engine.py --set all --watch
+    python3 create_icons.py --watch
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from icon_engine import HERE, IconEngine, load_spec, run_build
+
+SOURCES = ["icon_engine.py", "icon_sdf.py", "icon_encode.py", "icon_text.py", "icon_cache.py",
+           "icon_watch.py"]
+POLL_SECONDS = 0.1
+# Editors often save in several writes; wait for the file to settle
+SETTLE_SECONDS = 0.05
+FORCE_ENV = "ICON_WATCH_FORCE"
+
+
+def snapshot(paths: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamps[path] = None
+    return stamps
+
+
+def asset_keys(spec: Dict, args) -> Dict[str, str]:
+    """Per-asset fingerprint (layers, resolved colors, sizes, fonts) for diffing spec edits"""
+    engine = IconEngine(spec, args.flavor, args.rasterizer, args.effort, args.tile_height)
+    return {name: engine.cache_key({"asset": name}) for name in engine.assets}
+
+
+def changed_assets(before: Dict[str, str], after: Dict[str, str]) -> List[str]:
+    return sorted(name for name in set(before) | set(after) if before.get(name) != after.get(name))
+
+
+class Watcher:
+    def __init__(self, args):
+        self.args = args
+        self.wake = threading.Event()
+        self.force = bool(os.environ.pop(FORCE_ENV, ""))
+        self.lock = threading.Lock()
+        # Held for a whole build, so a restart never interrupts files mid-write
+        self.building = threading.Lock()
+        # Last spec that parsed, so a half-saved file never reaches a build
+        self.spec: Optional[Dict] = None
+
+    def request_build(self):
+        self.wake.set()
+
+    def builder(self):
+        """Background thread: one build per wake-up, edits during a build coalesce"""
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            with self.lock:
+                force, self.force = self.force, False
+                spec = self.spec
+            try:
+                with self.building:
+                    build = run_build(self.args, force=force, spec=spec)
+            except Exception as e:
+                print(f"❌ Build failed: {e}")
+                continue
+            self.summarize(build)
+
+    def summarize(self, build: Dict):
+        rebuilt = [path for result in build["results"] for path, *_ in result["outputs"]]
+        if not rebuilt and not build["restored"]:
+            print(f"✔️  Up to date ({build['wall'] * 1000:.0f}ms)")
+            return
+        assets = sorted(set(result["asset"] for result in build["results"]))
+        for path in rebuilt:
+            print(f"   ✅ {path}")
+        for output in build["restored"]:
+            print(f"   ♻️  {output['path']}")
+        print(f"🔁 Rebuilt {len(rebuilt)} outputs ({', '.join(assets) or 'restored only'}), "
+              f"{len(build['unchanged'])} unchanged, in {build['wall'] * 1000:.0f}ms")
+
+    def restart(self):
+        """Re-exec with the same arguments so edited engine code is loaded"""
+        print("🔄 Engine source changed, restarting...")
+        os.environ[FORCE_ENV] = "1"
+        with self.building:
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    def run(self) -> bool:
+        spec_path = os.path.abspath(self.args.spec)
+        sources = [os.path.join(HERE, name) for name in SOURCES]
+        stamps = snapshot([spec_path] + sources)
+        self.spec = load_spec(spec_path)
+        keys = asset_keys(self.spec, self.args)
+        threading.Thread(target=self.builder, daemon=True).start()
+        self.request_build()
+        print(f"👀 Watching {self.args.spec} and the engine sources (Ctrl+C to stop)")
+
+        while True:
+            time.sleep(POLL_SECONDS)
+            current = snapshot([spec_path] + sources)
+            if current == stamps:
+                continue
+            time.sleep(SETTLE_SECONDS)
+            current = snapshot([spec_path] + sources)
+            edited = [path for path in current if current[path] != stamps.get(path)]
+            stamps = current
+            if any(path in sources for path in edited):
+                self.restart()
+            try:
+                spec = load_spec(spec_path)
+                after = asset_keys(spec, self.args)
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                print(f"⚠️  {os.path.basename(spec_path)} is invalid, waiting for the next save: {e}")
+                continue
+            changed = changed_assets(keys, after)
+            keys = after
+            with self.lock:
+                self.spec = spec
+            print(f"✏️  {os.path.basename(spec_path)} changed: "
+                  f"{', '.join(changed) if changed else 'no asset layers'} affected")
+            # Output-level edits (new sizes, formats) are caught by the cache keys
+            self.request_build()
+
+
+def watch(args, title: str) -> bool:
+    if args.no_cache:
+        print("⚠️  --no-cache makes every rebuild a full one; watch mode works best with the cache")
+    # A pool's startup costs more than one or two changed assets take to render
+    args.jobs = args.jobs or 1
+    print(f"🎨 Watching {title} ({args.flavor})...")
+    try:
+        return Watcher(args).run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+        return True
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Parallel driver for the style codemods
+Finds source files under one or more roots and runs a codemod over them in a
+process pool; every worker reads, rewrites and writes its own files, and only
+per-file results (status, hits per rule, unified diff) travel back.
+
+Files are dealt out largest first in small chunks, so one big file never
+leaves the other workers idle at the end of a run.
+
+Usage:
+    python3 update-styles-v2.py                     # mobile screens and components
+    python3 update-styles-v2.py --monorepo --jobs 8 # apps/mobile, the web apps and packages
+    python3 update-styles.py --roots src/screens --show-diff
+    python3 update-styles-v2.py --since origin/main  # only files changed since a revision
+    python3 update-styles-v2.py --monorepo --dry-run > styles.patch   # preview; git apply later
+    python3 update-styles-v2.py --dry-run --patch styles.patch
+
+Files already processed by the same codemod version, and unchanged since,
+are skipped through a content-hash manifest (see style_manifest.py).
+
+Outputs are published one chunk at a time, atomically and journaled, so
+`python3 style_journal.py rollback` undoes the last run (see style_journal.py).
+
+A dry run writes nothing: each changed file's diff is streamed out as its
+worker reports it and then dropped, so a preview of the whole monorepo
+costs no more time or memory than the run itself.
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+from style_journal import BatchWriter, Journal
+from style_manifest import DEFAULT_MANIFEST, Manifest, git_changed_files, write_atomic
+from style_prefilter import STAGES, Prefilter, read_bytes
+from style_rules import RuleSet
+from style_scanner import Scan
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(HERE))
+DEFAULT_ROOTS = [os.path.join(HERE, "src", "screens"), os.path.join(HERE, "src", "components")]
+# The app's own components and the web apps and shared packages of the monorepo
+MONOREPO_ROOTS = [os.path.join(REPO_ROOT, path) for path in (
+    "apps/mobile/src", "apps/react-app/src", "apps/web-lite/src", "packages")]
+PRUNE_DIRS = {"node_modules", ".git", "dist", "build", "coverage", "__pycache__", "ios", "android"}
+CHUNK_FILES = 32
+SKIP_REASONS = {"anchor": "no {0.anchor}", "markers": "already optimized",
+                "candidates": "nothing to rewrite"}
+# Bump when the scanner or the rule engine changes what a ruleset produces
+ENGINE_VERSION = "1"
+# Lines as git counts them: only "\n" ends one (str.splitlines also splits on
+# U+2028, form feed and others that are legal inside TS strings and comments)
+DIFF_LINE = re.compile(r"[^\n]*\n|[^\n]+\Z")
+
+
+class Codemod:
+    """
+    A ruleset plus the file-level checks that decide whether it runs
+    Files without `anchor` are left alone, as are files already using
+    `marker` more than `max_markers` times (already converted by hand).
+    """
+
+    def __init__(self, name: str, rules: RuleSet, anchor: str = "StyleSheet.create",
+                 marker: str = "deviceInfo.isTablet", max_markers: Optional[int] = None,
+                 skip_files: Sequence[str] = (), extensions: Sequence[str] = (".tsx",)):
+        self.name = name
+        self.rules = rules
+        self.anchor = anchor
+        self.marker = marker
+        self.max_markers = max_markers
+        self.skip_files = tuple(skip_files)
+        self.extensions = tuple(extensions)
+        self.prefilter = Prefilter(rules, anchor, marker, max_markers)
+
+    @property
+    def version(self) -> str:
+        """Fingerprint of everything that decides this codemod's output"""
+        described = json.dumps([ENGINE_VERSION, self.name, self.rules.version, self.anchor,
+                                self.marker, self.max_markers])
+        return hashlib.sha256(described.encode()).hexdigest()[:16]
+
+    def transform(self, path: str, write: bool = True, writer: Optional[BatchWriter] = None) -> Dict:
+        """Run on one file; returns its result (written in place when changed and `write`)"""
+        return Pipeline([self]).transform(path, write, writer)
+
+
+# Codemods by name, for pipelines; scripts register theirs on import
+REGISTRY: Dict[str, Codemod] = {}
+
+
+def register(codemod: Codemod) -> Codemod:
+    REGISTRY[codemod.name] = codemod
+    return codemod
+
+
+class Pipeline:
+    """
+    Codemods chained over one read and at most one write of each file
+    Each codemod sees the previous one's output, as if they ran one after
+    another. The prefilter runs per codemod on the raw bytes, and the scan is
+    shared until a codemod changes the text. The result is written
+    atomically (temp file and rename), once, or staged in `writer`'s batch.
+    """
+
+    def __init__(self, codemods: List[Codemod]):
+        if not codemods:
+            raise ValueError("A pipeline needs at least one codemod")
+        self.codemods = codemods
+        self.name = "+".join(codemod.name for codemod in codemods)
+        self.extensions = tuple(dict.fromkeys(ext for codemod in codemods for ext in codemod.extensions))
+        # Only names every codemod excludes are left out of discovery
+        self.skip_files = tuple(set.intersection(*(set(codemod.skip_files) for codemod in codemods)))
+
+    @property
+    def version(self) -> str:
+        return hashlib.sha256(" ".join(codemod.version for codemod in self.codemods).encode()).hexdigest()[:16]
+
+    def transform(self, path: str, write: bool = True, writer: Optional[BatchWriter] = None) -> Dict:
+        """Run every codemod on one file; returns its result"""
+        result = {"path": path, "status": "unchanged", "reason": None, "stage": None,
+                  "counts": {}, "diff": ""}
+        started = time.perf_counter()
+        name = os.path.basename(path)
+        codemods = [codemod for codemod in self.codemods if name not in codemod.skip_files]
+        labelled = len(self.codemods) > 1
+        try:
+            if not codemods:
+                result["status"], result["reason"] = "skipped", "excluded by name"
+                return result
+            # Only files the byte-level prefilter cannot rule out are decoded and scanned
+            with read_bytes(path) as data:
+                result["bytes"] = len(data)
+                rejected = [codemod.prefilter.reject(data) for codemod in codemods]
+                original = None if all(rejected) else bytes(data)
+                content = original.decode("utf-8") if original is not None else None
+            if content is None:
+                # Credited to the furthest stage any codemod got to
+                stage = max(rejected, key=STAGES.index)
+                result["status"], result["stage"] = "skipped", stage
+                result["reason"] = SKIP_REASONS[stage].format(codemods[rejected.index(stage)])
+            else:
+                current, scan, counts = content, None, Counter()
+                for codemod, stage in zip(codemods, rejected):
+                    if current is not content:
+                        # An earlier codemod changed the text; check this one against it
+                        stage = codemod.prefilter.reject(current.encode("utf-8"))
+                    if stage:
+                        continue
+                    scan = scan or Scan(current)
+                    updated, hits = codemod.rules.apply(current, scan)
+                    for rule, count in hits.items():
+                        counts[f"{codemod.name}/{rule}" if labelled else rule] += count
+                    if updated != current:
+                        current, scan = updated, None
+                if current != content:
+                    result["status"], result["counts"] = "changed", dict(counts)
+                    result["diff"] = unified_diff(path, content, current)
+                    if write and writer is not None:
+                        writer.stage(path, original, current.encode("utf-8"))
+                    elif write:
+                        write_atomic(path, current.encode("utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            result["status"], result["reason"] = "error", str(e)
+        finally:
+            result["seconds"] = time.perf_counter() - started
+        return result
+
+
+def unified_diff(path: str, before: str, after: str) -> str:
+    """A diff `git apply` accepts from the repository root"""
+    name = os.path.relpath(path, REPO_ROOT)
+    lines = []
+    for line in difflib.unified_diff(DIFF_LINE.findall(before), DIFF_LINE.findall(after),
+                                     f"a/{name}", f"b/{name}"):
+        lines.append(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n")
+    return "".join(lines)
+
+
+def walk(roots: List[str], extensions: Sequence[str], skip_files: Sequence[str] = ()) -> List[str]:
+    """Absolute paths of source files under `roots`, skipping dependency and native build directories"""
+    extensions = tuple(extensions)
+    found = []
+    for root in roots:
+        if os.path.isfile(root):
+            found.append(root)
+            continue
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if d not in PRUNE_DIRS and not d.startswith("."))
+            found.extend(os.path.join(directory, name) for name in sorted(files)
+                         if name.endswith(extensions) and name not in skip_files)
+    # A file under two overlapping roots is processed once
+    return list(dict.fromkeys(os.path.abspath(path) for path in found))
+
+
+def discover(roots: List[str], codemod: Union[Codemod, Pipeline]) -> List[str]:
+    """Candidate files for `codemod` under `roots`"""
+    return walk(roots, codemod.extensions, codemod.skip_files)
+
+
+def chunks(files: List[str], jobs: int) -> List[List[str]]:
+    """Largest files first, in chunks small enough to keep every worker busy to the end"""
+    def size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    ordered = sorted(files, key=size, reverse=True)
+    chunk = max(1, min(CHUNK_FILES, len(ordered) // (jobs * 4)))
+    return [ordered[i:i + chunk] for i in range(0, len(ordered), chunk)]
+
+
+def transform_batch(codemod: Union[Codemod, Pipeline], paths: List[str], write: bool,
+                    journal: Optional[Journal], durable: bool = False) -> List[Dict]:
+    """Transform a batch of files; their outputs are published together once journaled"""
+    writer = BatchWriter(journal, durable) if write else None
+    results = [codemod.transform(path, write, writer) for path in paths]
+    if writer is not None:
+        try:
+            writer.commit()
+        except OSError as e:
+            writer.abort()
+            for result in results:
+                if result["status"] == "changed" and result["path"] not in writer.renamed:
+                    result["status"], result["reason"] = "error", f"not written: {e}"
+    return results
+
+
+_worker_options: tuple = ()
+
+
+def init_worker(codemod: Union[Codemod, Pipeline], write: bool, journal: Optional[Journal],
+                durable: bool):
+    global _worker_options
+    _worker_options = (codemod, write, journal, durable)
+
+
+def transform_chunk(paths: List[str]) -> List[Dict]:
+    """Pool task: one chunk of files, transformed and written by the worker"""
+    codemod, write, journal, durable = _worker_options
+    return transform_batch(codemod, paths, write, journal, durable)
+
+
+def run(codemod: Union[Codemod, Pipeline], files: List[str], jobs: Optional[int] = None,
+        write: bool = True, journal: Optional[Journal] = None, durable: bool = False) -> Iterator[Dict]:
+    """
+    Per-file results, yielded a batch at a time as batches are written
+    With jobs > 1 (or None for one per CPU) files are processed in a pool.
+    Written files are recorded in `journal` when one is given.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < 2:
+        for start in range(0, len(files), CHUNK_FILES):
+            yield from transform_batch(codemod, files[start:start + CHUNK_FILES], write, journal, durable)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(codemod, write, journal, durable)) as pool:
+        futures = [pool.submit(transform_chunk, chunk) for chunk in chunks(files, jobs)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main(codemod: Union[Codemod, Pipeline], argv=None) -> int:
+    parser = argparse.ArgumentParser(description=f"Run the {codemod.name} style codemod")
+    parser.add_argument("--roots", nargs="+", help="Directories or files to process "
+                        "(default: src/screens and src/components)")
+    parser.add_argument("--monorepo", action="store_true",
+                        help="Process apps/mobile, the web apps and shared packages")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Worker processes (0 = one per CPU, 1 = in-process)")
+    parser.add_argument("--since", metavar="REV",
+                        help="Only files changed since this git revision (plus untracked files)")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--force", action="store_true",
+                        help="Process files the manifest says are up to date")
+    parser.add_argument("--show-diff", action="store_true", help="Print each changed file's diff")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Change nothing; stream the diffs to stdout (progress goes to stderr)")
+    parser.add_argument("--patch", metavar="FILE", help="With --dry-run, write the diffs to FILE instead")
+    parser.add_argument("--fsync", action="store_true",
+                        help="Also sync each written file's data, to survive a power cut (slower)")
+    parser.add_argument("--verbose", action="store_true", help="Also list skipped files")
+    args = parser.parse_args(argv)
+    if args.patch and not args.dry_run:
+        parser.error("--patch needs --dry-run")
+
+    # A dry run to stdout keeps stdout for the patch alone
+    log = sys.stderr if args.dry_run and not args.patch else sys.stdout
+    patch = None
+    if args.dry_run:
+        patch = open(args.patch, "w", encoding="utf-8") if args.patch else sys.stdout
+    try:
+        return execute(codemod, args, log, patch)
+    finally:
+        if args.patch:
+            patch.close()
+
+
+def execute(codemod: Union[Codemod, Pipeline], args: argparse.Namespace, log, patch) -> int:
+    """The run main() configured; diffs go to `patch` in a dry run"""
+    roots = args.roots or (MONOREPO_ROOTS if args.monorepo else DEFAULT_ROOTS)
+    started = time.perf_counter()
+    files = discover(roots, codemod)
+    if args.since:
+        try:
+            changed = git_changed_files(args.since, HERE)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot list files changed since {args.since}: {e}", file=log)
+            return 1
+        files = [path for path in files if path in changed]
+    manifest = Manifest(args.manifest)
+    version = codemod.version
+    fresh = []
+    if not args.force:
+        files, fresh = manifest.partition(files, codemod.name, version)
+    print(f"{'Previewing' if args.dry_run else 'Processing'} {len(files)} files "
+          f"({len(fresh)} up to date)...", file=log)
+    print(file=log)
+
+    statuses, counts, stages = Counter(), Counter(), Counter()
+    journal = None if args.dry_run else Journal.create(codemod.name)
+    for result in run(codemod, files, args.jobs or None, write=not args.dry_run, journal=journal,
+                      durable=args.fsync):
+        statuses[result["status"]] += 1
+        stages[result["stage"] or ("decoded" if result["status"] in ("changed", "unchanged")
+                                   else result["status"])] += 1
+        # A dry run leaves files as they were, so they are not up to date
+        if result["status"] != "error" and not args.dry_run:
+            manifest.record(result["path"], codemod.name, version)
+        counts.update(result["counts"])
+        name = os.path.relpath(result["path"], REPO_ROOT)
+        if result["status"] == "changed":
+            print(f"✓ {'Would update' if args.dry_run else 'Updated'} {name}", file=log)
+            if patch is not None:
+                patch.write(result["diff"])
+                patch.flush()
+            elif args.show_diff:
+                print(result["diff"], end="", file=log)
+        elif result["status"] == "error":
+            print(f"    Error processing {name}: {result['reason']}", file=log)
+        elif result["status"] == "skipped" and args.verbose:
+            print(f"  Skipping {name} ({result['reason']})", file=log)
+    manifest.save()
+    # Pruned only once this run kept a journal, so a run with nothing to
+    # write never costs an older run its rollback
+    if journal is not None and not journal.discard_if_empty():
+        Journal.prune(os.path.dirname(journal.path))
+
+    print(f"\n===== SUMMARY{' (dry run)' if args.dry_run else ''} =====", file=log)
+    print(f"{'Would update' if args.dry_run else 'Updated'} {statuses['changed']} files with responsive styles "
+          f"({statuses['unchanged']} unchanged, {statuses['skipped']} skipped, "
+          f"{statuses['error']} errors, {len(fresh)} up to date) in {time.perf_counter() - started:.3f}s",
+          file=log)
+    print("Files eliminated per stage: " + ", ".join(
+        [f"manifest {len(fresh)}"] + [f"{stage} {stages[stage]}" for stage in STAGES]) +
+        f"; {stages['decoded']} decoded and scanned", file=log)
+    for rule, hits in sorted(counts.items()):
+        print(f"  {rule}: {hits} rewrites", file=log)
+    if args.patch:
+        print(f"Patch written to {args.patch}", file=log)
+    if statuses["changed"] and not args.dry_run:
+        print(f"Undo with: python3 style_journal.py rollback --run {journal.id}", file=log)
+    print("Done!", file=log)
+    return 1 if statuses["error"] else 0
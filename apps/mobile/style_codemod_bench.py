@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Performance regression harness for the style codemods
+Runs each codemod (and the chained pipeline) over a synthetic corpus (see
+style_corpus.py) without writing, and records files/s, MB/s, the slowest
+file and peak memory. Fails when a result is worse than the baseline by
+more than the tolerance. The numbers depend on the machine, so the baseline
+is recorded per checkout under .style-codemod/ (not committed): record it on
+a known-good tree, then compare on the same host.
+
+Every engine runs in its own child process, so peak memory is its own and
+imports are not shared. The best of `--runs` is kept for each measure.
+
+Usage:
+    python3 style_codemod_bench.py --update-baseline    # record on a known-good tree
+    python3 style_codemod_bench.py                      # compare with that baseline
+    python3 style_codemod_bench.py --corpus /tmp/corpus --engines responsive-v2
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from style_corpus import MANIFEST, Generator
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, ".style-codemod", "bench-baseline.json")
+# Engine name -> codemods chained in it
+ENGINES = {"responsive": ["responsive"], "responsive-v2": ["responsive-v2"],
+           "pipeline": ["responsive", "responsive-v2"]}
+# Measure -> True when higher is better
+MEASURES = {"files_per_s": True, "mb_per_s": True, "worst_ms": False, "peak_mb": False}
+
+
+def measure(engine: str, corpus: str, jobs: int) -> Dict:
+    """Child process: run one engine over the corpus, dry, and report"""
+    from style_codemod import Pipeline, run
+    from style_pipeline import load_codemods
+
+    codemod = Pipeline(load_codemods(ENGINES[engine]))
+    files = sorted(os.path.join(directory, name) for directory, _, names in os.walk(corpus)
+                   for name in names if name.endswith(".tsx"))
+    total = sum(os.path.getsize(path) for path in files)
+    worst, statuses = {"seconds": 0.0, "path": None}, {}
+    started = time.perf_counter()
+    for result in run(codemod, files, jobs, write=False):
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+        if result["seconds"] > worst["seconds"]:
+            worst = {"seconds": result["seconds"], "path": os.path.relpath(result["path"], corpus)}
+    seconds = time.perf_counter() - started
+    # ru_maxrss is in KB on Linux
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return {"files_per_s": len(files) / seconds, "mb_per_s": total / seconds / 1024 / 1024,
+            "worst_ms": worst["seconds"] * 1000, "worst_file": worst["path"],
+            "peak_mb": peak / 1024, "statuses": statuses}
+
+
+def best_of(engine: str, corpus: str, jobs: int, runs: int) -> Dict:
+    best: Optional[Dict] = None
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, __file__, "--child", engine, corpus, str(jobs)],
+                                   capture_output=True, text=True, cwd=HERE)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{engine} failed: {completed.stderr.strip()}")
+        result = json.loads(completed.stdout)
+        if best is None:
+            best = result
+            continue
+        for name, higher in MEASURES.items():
+            best[name] = (max if higher else min)(best[name], result[name])
+        if result["worst_ms"] == best["worst_ms"]:
+            best["worst_file"] = result["worst_file"]
+    return best
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    problems = []
+    for engine, result in results.items():
+        expected = baseline.get(engine)
+        if not expected:
+            continue
+        for name, higher in MEASURES.items():
+            limit = expected[name] * ((1 - tolerance) if higher else (1 + tolerance))
+            if (result[name] < limit) if higher else (result[name] > limit):
+                problems.append(f"{engine}: {name} {result[name]:.1f} vs baseline {expected[name]:.1f}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the style codemods on a synthetic corpus")
+    parser.add_argument("--corpus", help="Existing corpus directory (default: generate one)")
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--size-kb", type=float, default=8)
+    parser.add_argument("--stylesheets", type=int, default=2)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--adversarial", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Comma separated, from: " + ", ".join(ENGINES))
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes per engine")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per engine (best is kept)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative regression of each measure")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], args.child[1], int(args.child[2]))))
+        return 0
+
+    engines = args.engines.split(",")
+    unknown = [engine for engine in engines if engine not in ENGINES]
+    if unknown:
+        print(f"❌ Unknown engines: {', '.join(unknown)}")
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="style-corpus-") as scratch:
+        corpus = args.corpus
+        if corpus:
+            with open(os.path.join(corpus, MANIFEST)) as f:
+                description = json.load(f)
+        else:
+            corpus = scratch
+            description = Generator(args.files, args.size_kb, args.stylesheets, args.depth,
+                                    args.adversarial, args.seed).write(corpus)
+        print(f"⏱️  Style codemod benchmark: {description['files']} files, "
+              f"{description['bytes'] / 1024 / 1024:.1f}MB, jobs {args.jobs}, best of {args.runs}")
+        print(f"{'engine':<15} {'files/s':>9} {'MB/s':>7} {'worst':>9} {'peak':>8}  slowest file")
+        print("-" * 78)
+        results = {}
+        for engine in engines:
+            result = results[engine] = best_of(engine, corpus, args.jobs, args.runs)
+            print(f"{engine:<15} {result['files_per_s']:>9.0f} {result['mb_per_s']:>7.2f} "
+                  f"{result['worst_ms']:>7.1f}ms {result['peak_mb']:>6.0f}MB  {result['worst_file']}")
+        print("-" * 78)
+
+    stored = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+    if args.update_baseline:
+        engines = dict(stored["engines"]) if stored and stored["corpus"] == description["options"] else {}
+        engines.update({engine: {name: round(result[name], 2) for name in MEASURES}
+                        for engine, result in results.items()})
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"corpus": description["options"], "jobs": args.jobs, "engines": engines}, f, indent=2)
+            f.write("\n")
+        print(f"💾 Baseline saved to {os.path.relpath(args.baseline)}")
+        return 0
+    if stored is None:
+        print("⚠️  No baseline yet; run with --update-baseline to record one")
+        return 0
+    if stored["corpus"] != description["options"] or stored.get("jobs") != args.jobs:
+        print("❌ The baseline was recorded on a different corpus or job count; "
+              "rerun with its options or --update-baseline")
+        return 1
+
+    problems = compare(results, stored["engines"], args.tolerance)
+    if problems:
+        print(f"❌ Regressed by more than {args.tolerance:.0%} against the baseline:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print(f"✅ Every engine within {args.tolerance:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Synthetic TSX corpus for benchmarking the style codemods
+Generates React Native components with StyleSheet blocks, nested style
+objects, inline styles and Ionicons tags, using the literals the codemods
+rewrite. A share of the files is adversarial, one pattern each:
+
+    unbalanced    StyleSheet blocks that never close, nested objects inside
+    literals      braces and quotes inside comments, strings and templates
+    minified      the whole component on one line
+    markers       already converted by hand (many deviceInfo.isTablet)
+    no-anchor     plain TS with style-like objects but no StyleSheet.create
+    huge          ten times the requested size
+
+The same options and seed always give the same files, so results of runs on
+different commits can be compared.
+
+Usage:
+    python3 style_corpus.py /tmp/corpus --files 500 --size-kb 8
+    python3 style_corpus.py /tmp/corpus --stylesheets 4 --depth 6 --adversarial 0.5
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Dict, Iterator, Tuple
+
+ADVERSARIAL = ("unbalanced", "literals", "minified", "markers", "no-anchor", "huge")
+SPACING_KEYS = ("padding", "margin", "paddingHorizontal", "paddingVertical", "marginTop",
+                "marginBottom", "paddingLeft", "gap")
+SPACING_VALUES = (0, 2, 4, 6, 8, 10, 12, 16, 20, 24, 32, 40)
+FONT_SIZES = (11, 12, 13, 14, 16, 18, 20, 24, 28, 32)
+RADII = (4, 8, 10, 12, 16, 999)
+COLORS = ("'#FFFFFF'", "'#1A1A1A'", "'#666666'", "'#58a6ff'", "'rgba(0, 0, 0, 0.5)'", "colors.primary")
+ICON_SIZES = (16, 20, 24, 28)
+ICONS = ("home", "search", "person", "settings", "chevron-forward")
+MANIFEST = "corpus.json"
+
+
+class Generator:
+    def __init__(self, files: int = 200, size_kb: float = 8, stylesheets: int = 1, depth: int = 2,
+                 adversarial: float = 0.2, seed: int = 1):
+        self.files = files
+        self.size = int(size_kb * 1024)
+        self.stylesheets = stylesheets
+        self.depth = depth
+        self.adversarial = adversarial
+        self.seed = seed
+
+    @property
+    def options(self) -> Dict:
+        return {"files": self.files, "size_kb": self.size / 1024, "stylesheets": self.stylesheets,
+                "depth": self.depth, "adversarial": self.adversarial, "seed": self.seed}
+
+    def style(self, rng: random.Random, depth: int, indent: str) -> str:
+        """One style object, with objects nested up to `depth` levels inside"""
+        lines = []
+        for _ in range(rng.randint(3, 8)):
+            kind = rng.random()
+            if kind < 0.45:
+                lines.append(f"{rng.choice(SPACING_KEYS)}: {rng.choice(SPACING_VALUES)}")
+            elif kind < 0.6:
+                lines.append(f"fontSize: {rng.choice(FONT_SIZES)}")
+            elif kind < 0.75:
+                lines.append(f"borderRadius: {rng.choice(RADII)}")
+            elif kind < 0.9:
+                lines.append(f"color: {rng.choice(COLORS)}")
+            elif depth > 0:
+                lines.append(f"shadow{rng.randint(1, 9)}: " + self.style(rng, depth - 1, indent + "  "))
+            else:
+                lines.append(f"flex: {rng.randint(1, 3)}")
+        inner = indent + "  "
+        return "{\n" + "".join(f"{inner}{line},\n" for line in lines) + indent + "}"
+
+    def stylesheet(self, rng: random.Random, index: int, size: int, closed: bool = True) -> str:
+        parts = [f"const styles{index} = StyleSheet.create({{\n"]
+        length = len(parts[0])
+        while length < size:
+            entry = f"  item{len(parts)}: {self.style(rng, rng.randint(0, self.depth), '  ')},\n"
+            parts.append(entry)
+            length += len(entry)
+        if closed:
+            parts.append("});\n")
+        return "".join(parts)
+
+    def component(self, rng: random.Random, number: int) -> str:
+        """JSX with inline styles and icons, referencing the first stylesheet"""
+        lines = [f"export default function Screen{number}({{ onPress }}: Props) {{", "  return (",
+                 "    <View style={styles0.item1}>"]
+        for _ in range(rng.randint(2, 6)):
+            lines.append(f"      <Ionicons name=\"{rng.choice(ICONS)}\" size={{{rng.choice(ICON_SIZES)}}} "
+                         f"color={{colors.text}} onPress={{() => onPress(a > b)}} />")
+            lines.append(f"      <Text style={{{{ marginTop: {rng.choice(SPACING_VALUES)}, "
+                         f"fontSize: {rng.choice(FONT_SIZES)} }}}}>Item</Text>")
+        lines += ["    </View>", "  );", "}", ""]
+        return "\n".join(lines)
+
+    def file(self, number: int, pattern: str) -> str:
+        rng = random.Random(f"{self.seed}:{number}")
+        size = self.size * (10 if pattern == "huge" else 1)
+        header = ("import React from 'react';\n"
+                  "import { View, Text, StyleSheet } from 'react-native';\n"
+                  "import { Ionicons } from '@expo/vector-icons';\n\n")
+        body = self.component(rng, number)
+        per_sheet = max(256, (size - len(header) - len(body)) // self.stylesheets)
+        sheets = [self.stylesheet(rng, i, per_sheet) for i in range(self.stylesheets)]
+        if pattern == "unbalanced":
+            unit = "  x: { a: { b: 1 }, "
+            sheets[-1] = "const broken = StyleSheet.create({\n" + unit * (per_sheet // len(unit)) + "\n"
+            return header + body + "\n" + "".join(sheets)
+        if pattern == "literals":
+            sheets = [sheet.replace("flex: 1", "content: '}', /* { */ fontFamily: `${f}}`, // }\n    flex: 1")
+                      .replace("color: '#FFFFFF'", "color: \"#FFF}\" /* }); */")
+                      for sheet in sheets]
+        elif pattern == "markers":
+            sheets[0] = sheets[0].replace("borderRadius: 8", "borderRadius: deviceInfo.isTablet ? 10 : 8")
+            sheets.append("const tablet = [" + ", ".join(["deviceInfo.isTablet"] * 12) + "];\n")
+        elif pattern == "no-anchor":
+            sheets = [sheet.replace("StyleSheet.create(", "Object.freeze(") for sheet in sheets]
+        source = header + "".join(sheets) + "\n" + body
+        if pattern == "minified":
+            source = " ".join(line.strip() for line in source.splitlines())
+        return source
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """(file name, content) for every file of the corpus"""
+        rng = random.Random(self.seed)
+        for number in range(self.files):
+            pattern = rng.choice(ADVERSARIAL) if rng.random() < self.adversarial else "plain"
+            yield f"{number // 100:03d}/Screen{number:05d}-{pattern}.tsx", self.file(number, pattern)
+
+    def write(self, directory: str) -> Dict:
+        """Write the corpus under `directory`; returns its description"""
+        written, total = 0, 0
+        for name, content in self:
+            path = os.path.join(directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            written += 1
+            total += len(content.encode("utf-8"))
+        description = {"options": self.options, "files": written, "bytes": total}
+        with open(os.path.join(directory, MANIFEST), "w") as f:
+            json.dump(description, f, indent=2)
+        return description
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic TSX corpus for the style codemods")
+    parser.add_argument("directory")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size-kb", type=float, default=8, help="Approximate size of each file")
+    parser.add_argument("--stylesheets", type=int, default=1, help="StyleSheet.create blocks per file")
+    parser.add_argument("--depth", type=int, default=2, help="Deepest nesting of style objects")
+    parser.add_argument("--adversarial", type=float, default=0.2, help="Share of adversarial files (0-1)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if os.path.isdir(args.directory) and os.listdir(args.directory):
+        print(f"❌ {args.directory} is not empty")
+        return 1
+    generator = Generator(args.files, args.size_kb, args.stylesheets, args.depth, args.adversarial, args.seed)
+    description = generator.write(args.directory)
+    print(f"📦 Wrote {description['files']} files ({description['bytes'] / 1024 / 1024:.1f}MB) "
+          f"to {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Persistent index of raw style literals, for design-system audits
+Records every spacing, fontSize, borderRadius and color literal in style
+objects (StyleSheet blocks, inline styles) and JSX color attributes, with
+its file, line and the design token it would map to, in an SQLite database.
+
+Updates are incremental: only files whose size, mtime (and then content)
+changed since the last update are rescanned, so a coverage report costs a
+query instead of a full-repo scan.
+
+Tokens come from each app's design-system/tokens.ts (values reversed into
+token paths, e.g. '#FFFFFF' on a background -> colors.bg.secondary). For the
+mobile app the responsive-v2 codemod's mapping comes first for spacing,
+fontSize and borderRadius, since that is what the codemod would write.
+
+Usage:
+    python3 style_index.py update --jobs 4
+    python3 style_index.py report
+    python3 style_index.py query --category color --unmapped --path react-app/src/components
+    python3 style_index.py query --literal '#FFFFFF' --limit 20
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from style_codemod import HERE, MONOREPO_ROOTS, REPO_ROOT, chunks, walk
+from style_manifest import sha256_file
+from style_scanner import Scan
+
+INDEX_VERSION = "1"
+DEFAULT_INDEX = os.environ.get("STYLE_INDEX_PATH", os.path.join(HERE, ".style-codemod", "index.sqlite"))
+EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+
+CATEGORIES: Dict[str, set] = {
+    "spacing": {"padding", "paddingHorizontal", "paddingVertical", "paddingTop", "paddingBottom",
+                "paddingLeft", "paddingRight", "paddingStart", "paddingEnd",
+                "margin", "marginHorizontal", "marginVertical", "marginTop", "marginBottom",
+                "marginLeft", "marginRight", "marginStart", "marginEnd", "gap", "rowGap", "columnGap"},
+    "fontSize": {"fontSize"},
+    "borderRadius": {"borderRadius", "borderTopLeftRadius", "borderTopRightRadius",
+                     "borderBottomLeftRadius", "borderBottomRightRadius"},
+    "color": {"color", "backgroundColor", "background", "borderColor", "borderTopColor",
+              "borderBottomColor", "borderLeftColor", "borderRightColor", "shadowColor", "tintColor",
+              "placeholderTextColor", "textDecorationColor", "overlayColor", "fill", "stroke"},
+}
+KEY_CATEGORY = {key: category for category, keys in CATEGORIES.items() for key in keys}
+# Where each category's tokens live inside tokens.ts
+TOKEN_GROUPS = {"color": ("colors",), "spacing": ("spacing",), "fontSize": ("typography", "fontSize"),
+                "borderRadius": ("radii",)}
+# Files under a prefix take tokens from that tokens.ts (and codemod); the last entry is the fallback
+TOKEN_SOURCES = [
+    ("apps/mobile/", "apps/mobile/src/design-system/tokens.ts", "responsive-v2"),
+    ("", "apps/react-app/src/design-system/tokens.ts", None),
+]
+# Color properties prefer tokens from the matching part of the palette
+COLOR_HINTS = {"background": "bg", "backgroundColor": "bg", "color": "text"}
+NAMED_COLORS = {"white": "#ffffff", "black": "#000000", "transparent": "transparent"}
+# Cheap byte check: files without any indexed key followed by ':' or '=' are not scanned
+KEYS_PATTERN = re.compile(rb"\b(?:" + b"|".join(sorted(k.encode() for k in KEY_CATEGORY)) + rb")['\"]?\s*[:=]")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE, size INTEGER, mtime_ns INTEGER, digest TEXT);
+CREATE TABLE IF NOT EXISTS literals (
+    file_id INTEGER, line INTEGER, col INTEGER, key TEXT, category TEXT, scope TEXT,
+    literal TEXT, value TEXT, token TEXT);
+CREATE INDEX IF NOT EXISTS literals_file ON literals (file_id);
+CREATE INDEX IF NOT EXISTS literals_category ON literals (category, token);
+CREATE INDEX IF NOT EXISTS literals_value ON literals (value);
+"""
+
+
+def normalize(category: str, literal: str) -> str:
+    """Comparable form of a literal: unquoted, lowercase colors, bare pixel numbers"""
+    value = literal[1:-1] if literal[:1] in "'\"`" else literal
+    value = value.strip()
+    if category == "color":
+        value = value.lower().replace(" ", "")
+        value = NAMED_COLORS.get(value, value)
+        if re.fullmatch(r"#[0-9a-f]{3}", value):
+            value = "#" + "".join(c * 2 for c in value[1:])
+        return value
+    match = re.fullmatch(r"(-?\d+(?:\.\d+)?)(?:px)?", value)
+    return match.group(1) if match else value
+
+
+def token_path(group: str, keys: Tuple[str, ...]) -> str:
+    path = group
+    for key in keys:
+        path += f".{key}" if re.fullmatch(r"[A-Za-z_$][\w$]*", key) else \
+            (f"[{key}]" if key.isdigit() else f"['{key}']")
+    return path
+
+
+class TokenTable:
+    """Reverse map of one tokens.ts: (category, value) -> candidate token paths"""
+
+    def __init__(self, path: Optional[str]):
+        self.candidates: Dict[Tuple[str, str], List[str]] = {}
+        if not path or not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            scan = Scan(f.read())
+        declarations = scan.declarations()
+        for category, (group, *inner) in TOKEN_GROUPS.items():
+            for prop in declarations.get(group, []):
+                keys = prop.path + (prop.key,)
+                if prop.kind not in ("string", "number") or tuple(keys[:len(inner)]) != tuple(inner):
+                    continue
+                value = normalize(category, prop.value(scan.source))
+                self.candidates.setdefault((category, value), []).append(token_path(group, keys))
+
+    def token(self, category: str, key: str, value: str) -> Optional[str]:
+        found = self.candidates.get((category, value))
+        if not found:
+            return None
+        hint = COLOR_HINTS.get(key) or ("border" if key.startswith("border") else None)
+
+        def rank(path):
+            # Palette section matching the property, then plain dotted names (colors.bg.secondary)
+            return (hint is None or re.search(rf"[.'](?:{hint})\b", path) is None, "[" in path)
+
+        return min(found, key=rank)
+
+
+class Indexer:
+    """Extracts the style literals of one file; shared with pool workers"""
+
+    def __init__(self):
+        self.tables = {source: TokenTable(os.path.join(REPO_ROOT, source)) for _, source, _ in TOKEN_SOURCES}
+        self.codemods = {}
+        for _, _, codemod in TOKEN_SOURCES:
+            if codemod:
+                from style_pipeline import load_codemods
+                self.codemods[codemod] = load_codemods([codemod])[0].rules.tables["stylesheet"]
+        described = json.dumps([INDEX_VERSION, sorted(CATEGORIES.items(), key=str),
+                                {source: sorted(table.candidates.items()) for source, table in self.tables.items()},
+                                {name: sorted(map(str, table.items())) for name, table in self.codemods.items()}],
+                               default=sorted)
+        self.version = hashlib.sha256(described.encode()).hexdigest()[:16]
+
+    def sources(self, relative: str) -> Tuple[TokenTable, Optional[Dict]]:
+        for prefix, source, codemod in TOKEN_SOURCES:
+            if relative.startswith(prefix):
+                return self.tables[source], self.codemods.get(codemod)
+        return self.tables[TOKEN_SOURCES[-1][1]], None
+
+    def extract(self, path: str) -> List[Tuple]:
+        """(line, col, key, category, scope, literal, value, token) rows for one file"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not KEYS_PATTERN.search(data):
+            return []
+        source = data.decode("utf-8", errors="replace")
+        scan = Scan(source)
+        tokens, codemod = self.sources(os.path.relpath(path, REPO_ROOT))
+        line_starts = [0] + [match.end() for match in re.finditer("\n", source)]
+        blocks = [(block.body_start, block.body_end) for block in scan.blocks]
+        rows = []
+
+        def add(key: str, start: int, end: int, scope: str):
+            category = KEY_CATEGORY[key]
+            literal = source[start:end]
+            value = normalize(category, literal)
+            token = None
+            if codemod is not None and category != "color":
+                hit = codemod.get((key, literal))
+                token = hit[0] if hit else None
+            token = token or tokens.token(category, key, value)
+            line = bisect_right(line_starts, start)
+            rows.append((line, start - line_starts[line - 1] + 1, key, category, scope, literal, value, token))
+
+        for prop in scan.objects:
+            if prop.key in KEY_CATEGORY and prop.kind in ("number", "string"):
+                inside = any(first <= prop.value_start < last for first, last in blocks)
+                add(prop.key, prop.value_start, prop.value_end, "stylesheet" if inside else "inline")
+        for tag in scan.tags():
+            for attribute in tag.attributes.values():
+                if KEY_CATEGORY.get(attribute.name) == "color" and attribute.kind == "string":
+                    add(attribute.name, attribute.value_start, attribute.value_end, "attribute")
+        return rows
+
+
+_worker_indexer: Optional[Indexer] = None
+
+
+def init_worker():
+    global _worker_indexer
+    _worker_indexer = Indexer()
+
+
+def extract_chunk(paths: List[str]) -> List[Tuple[str, List[Tuple]]]:
+    return [(path, _worker_indexer.extract(path)) for path in paths]
+
+
+class StyleIndex:
+    def __init__(self, path: str = DEFAULT_INDEX):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def update(self, roots: List[str], jobs: Optional[int] = None) -> Dict[str, int]:
+        """Rescan new and changed files, drop deleted ones; returns counts"""
+        indexer = Indexer()
+        stats = {"files": 0, "unchanged": 0, "scanned": 0, "removed": 0, "literals": 0}
+        row = self.db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if not row or row[0] != indexer.version:
+            # Token tables or categories changed: every row may be stale
+            self.db.execute("DELETE FROM literals")
+            self.db.execute("DELETE FROM files")
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (indexer.version,))
+
+        known = {path: (file_id, size, mtime_ns, digest) for file_id, path, size, mtime_ns, digest
+                 in self.db.execute("SELECT id, path, size, mtime_ns, digest FROM files")}
+        pending, seen = [], set()
+        for path in discover(roots):
+            relative = os.path.relpath(path, REPO_ROOT)
+            seen.add(relative)
+            stats["files"] += 1
+            entry = known.get(relative)
+            info = os.stat(path)
+            if entry and entry[1] == info.st_size and entry[2] == info.st_mtime_ns:
+                stats["unchanged"] += 1
+                continue
+            if entry and entry[1] == info.st_size and sha256_file(path) == entry[3]:
+                # Touched, not modified
+                self.db.execute("UPDATE files SET mtime_ns = ? WHERE id = ?", (info.st_mtime_ns, entry[0]))
+                stats["unchanged"] += 1
+                continue
+            pending.append(path)
+
+        # Files under the indexed roots that no longer exist
+        for relative, (file_id, *_) in known.items():
+            if relative not in seen and any(is_under(relative, root) for root in roots):
+                self.db.execute("DELETE FROM literals WHERE file_id = ?", (file_id,))
+                self.db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                stats["removed"] += 1
+
+        for path, rows in extract_all(indexer, pending, jobs):
+            relative = os.path.relpath(path, REPO_ROOT)
+            info = os.stat(path)
+            entry = known.get(relative)
+            if entry:
+                self.db.execute("DELETE FROM literals WHERE file_id = ?", (entry[0],))
+            file_id = self.db.execute(
+                "INSERT OR REPLACE INTO files (id, path, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?)",
+                (entry[0] if entry else None, relative, info.st_size, info.st_mtime_ns,
+                 sha256_file(path))).lastrowid
+            self.db.executemany("INSERT INTO literals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                [(file_id, *row) for row in rows])
+            stats["scanned"] += 1
+            stats["literals"] += len(rows)
+        self.db.commit()
+        return stats
+
+    def query(self, category: Optional[str] = None, key: Optional[str] = None,
+              literal: Optional[str] = None, token: Optional[str] = None, mapped: Optional[bool] = None,
+              path: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple]:
+        """(path, line, col, key, literal, token) rows, in file order"""
+        clauses, params = [], []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if key:
+            clauses.append("key = ?")
+            params.append(key)
+        if literal:
+            clauses.append("value = ?")
+            # Without a category, anything that is not a number is compared as a color
+            guess = "spacing" if re.fullmatch(r"-?[\d.]+(?:px)?", literal) else "color"
+            params.append(normalize(category or KEY_CATEGORY.get(key or "", guess), literal))
+        if token:
+            clauses.append("token = ?")
+            params.append(token)
+        if mapped is not None:
+            clauses.append("token IS NOT NULL" if mapped else "token IS NULL")
+        if path:
+            clauses.append("path LIKE ?")
+            params.append(f"%{path}%")
+        sql = ("SELECT path, line, col, key, literal, token FROM literals JOIN files ON files.id = file_id"
+               + (" WHERE " + " AND ".join(clauses) if clauses else "") + " ORDER BY path, line, col")
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.db.execute(sql, params).fetchall()
+
+    def report(self, top: int = 10) -> Tuple[List[Tuple], List[Tuple]]:
+        """Per category (category, literals, mappable to a token, files), and the files with most literals"""
+        categories = self.db.execute(
+            "SELECT category, COUNT(*), COUNT(token), COUNT(DISTINCT file_id) FROM literals "
+            "GROUP BY category ORDER BY category").fetchall()
+        files = self.db.execute(
+            "SELECT path, COUNT(*), COUNT(token) FROM literals JOIN files ON files.id = file_id "
+            "GROUP BY file_id ORDER BY COUNT(*) DESC, path LIMIT ?", (top,)).fetchall()
+        return categories, files
+
+
+def is_under(relative: str, root: str) -> bool:
+    root = os.path.relpath(os.path.abspath(root), REPO_ROOT)
+    return root == "." or relative == root or relative.startswith(root.rstrip("/") + "/")
+
+
+def discover(roots: List[str]) -> List[str]:
+    """Source files to index; type declarations (.d.ts) hold no style literals"""
+    return [path for path in walk(roots, EXTENSIONS) if not path.endswith(".d.ts")]
+
+
+def extract_all(indexer: Indexer, paths: List[str], jobs: Optional[int]):
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) < 2:
+        for path in paths:
+            yield path, indexer.extract(path)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as pool:
+        futures = [pool.submit(extract_chunk, chunk) for chunk in chunks(paths, jobs)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index raw style literals for design-system audits")
+    parser.add_argument("--index", default=DEFAULT_INDEX)
+    commands = parser.add_subparsers(dest="command", required=True)
+    update = commands.add_parser("update", help="Bring the index up to date (incremental)")
+    update.add_argument("--roots", nargs="+", default=MONOREPO_ROOTS)
+    update.add_argument("--jobs", type=int, default=0,
+                        help="Worker processes (0 = one per CPU, 1 = in-process)")
+    query = commands.add_parser("query", help="List literals")
+    query.add_argument("--category", choices=sorted(CATEGORIES))
+    query.add_argument("--key", help="Style property, e.g. backgroundColor")
+    query.add_argument("--literal", help="Value, e.g. '#FFFFFF' or 16 (compared normalized)")
+    query.add_argument("--token", help="Token the literal maps to, e.g. colors.bg.secondary")
+    query.add_argument("--mapped", dest="mapped", action="store_true", default=None,
+                       help="Only literals that map to a token")
+    query.add_argument("--unmapped", dest="mapped", action="store_false",
+                       help="Only literals with no matching token")
+    query.add_argument("--path", help="Substring of the file path")
+    query.add_argument("--limit", type=int)
+    report = commands.add_parser("report", help="Token coverage per category and the worst files")
+    report.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = StyleIndex(args.index)
+    if args.command == "update":
+        stats = index.update(args.roots, args.jobs or None)
+        print(f"🗂️  Indexed {stats['files']} files: {stats['scanned']} scanned ({stats['literals']} literals), "
+              f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+              f"in {time.perf_counter() - started:.2f}s")
+    elif args.command == "query":
+        rows = index.query(args.category, args.key, args.literal, args.token, args.mapped,
+                           args.path, args.limit)
+        for path, line, col, key, literal, token in rows:
+            print(f"{path}:{line}:{col}: {key}: {literal}" + (f" -> {token}" if token else ""))
+        print(f"({len(rows)} literals, {(time.perf_counter() - started) * 1000:.1f}ms)", file=sys.stderr)
+    else:
+        categories, files = index.report(args.top)
+        print(f"{'category':<14} {'literals':>9} {'tokenizable':>12} {'files':>7}")
+        print("-" * 46)
+        for category, total, mapped, file_count in categories:
+            print(f"{category:<14} {total:>9} {mapped:>7} ({mapped / total * 100:>3.0f}%) {file_count:>7}")
+        print(f"\nFiles with the most raw literals:")
+        for path, total, mapped in files:
+            print(f"  {total:>5} ({mapped} tokenizable)  {path}")
+        print(f"\n({(time.perf_counter() - started) * 1000:.1f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Batched write-back and rollback journal for the codemods
+Each run keeps a journal: for every file it rewrote, the content hashes
+before and after, and where the original content is kept. Rolling back
+restores every file that still holds what the run wrote.
+
+Outputs are written in batches (one pool chunk each):
+    1. every output goes to a temp file next to its target
+    2. the batch's originals are appended to the worker's pack file, and
+       its journal entries to the worker's journal
+    3. the temp files are renamed over their targets
+    4. each directory touched is synced once
+An interrupted run leaves each file either old or new, never half written,
+and every new file is in the journal before it appears. Journal and pack
+writes are sequential appends, one each per batch.
+
+File data is only synced with `durable` (--fsync), which is what survives
+a power cut; it costs a disk flush per file.
+
+Usage:
+    python3 style_journal.py list
+    python3 style_journal.py rollback                # the latest run not rolled back
+    python3 style_journal.py rollback --run 20250101-120000-4242 --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from style_manifest import sha256_file, write_atomic
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(HERE))
+DEFAULT_JOURNALS = os.environ.get("STYLE_CODEMOD_JOURNAL", os.path.join(HERE, ".style-codemod", "journal"))
+KEEP_RUNS = 20
+TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+
+
+class Journal:
+    """One run's journal directory: run.json, then journal-<pid>.jsonl and originals-<pid>.pack per worker"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @property
+    def id(self) -> str:
+        return os.path.basename(self.path)
+
+    @classmethod
+    def create(cls, name: str, root: str = DEFAULT_JOURNALS) -> "Journal":
+        """A new journal for a run of codemod `name`"""
+        stamp, attempt = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}", 0
+        os.makedirs(root, exist_ok=True)
+        while True:
+            path = os.path.join(root, stamp + (f"-{attempt}" if attempt else ""))
+            try:
+                os.mkdir(path)
+                break
+            except FileExistsError:
+                attempt += 1
+        with open(os.path.join(path, "run.json"), "w") as f:
+            json.dump({"codemod": name, "started": time.time()}, f)
+        return cls(path)
+
+    @classmethod
+    def prune(cls, root: str = DEFAULT_JOURNALS):
+        """Delete the oldest journals beyond KEEP_RUNS"""
+        for old in cls.runs(root)[:-KEEP_RUNS]:
+            shutil.rmtree(old.path, ignore_errors=True)
+
+    @classmethod
+    def runs(cls, root: str = DEFAULT_JOURNALS) -> List["Journal"]:
+        """Journals, oldest first"""
+        try:
+            names = sorted(os.listdir(root))
+        except FileNotFoundError:
+            return []
+        return [cls(os.path.join(root, name)) for name in names
+                if os.path.exists(os.path.join(root, name, "run.json"))]
+
+    @property
+    def info(self) -> Dict:
+        with open(os.path.join(self.path, "run.json")) as f:
+            return json.load(f)
+
+    @property
+    def rolled_back(self) -> bool:
+        return os.path.exists(os.path.join(self.path, "rolled-back"))
+
+    def entries(self) -> Iterator[Dict]:
+        """{path, before, after, pack, offset, size} for every file the run rewrote"""
+        for name in sorted(os.listdir(self.path)):
+            if not (name.startswith("journal-") and name.endswith(".jsonl")):
+                continue
+            with open(os.path.join(self.path, name)) as f:
+                for line in f:
+                    # A torn last line is a batch whose files were never renamed
+                    if line.endswith("\n"):
+                        yield json.loads(line)
+
+    def discard_if_empty(self) -> bool:
+        """Delete the journal of a run that rewrote nothing; True when it was deleted"""
+        if any(True for _ in self.entries()):
+            return False
+        shutil.rmtree(self.path, ignore_errors=True)
+        return True
+
+    def record(self, changes: List[Tuple[str, bytes, bytes]], durable: bool):
+        """Journal a batch of (path, before, after), keeping the originals"""
+        pack = f"originals-{os.getpid()}.pack"
+        entries = []
+        with open(os.path.join(self.path, pack), "ab") as f:
+            offset = f.tell()
+            for path, before, after in changes:
+                f.write(before)
+                entries.append({"path": path, "before": hashlib.sha256(before).hexdigest(),
+                                "after": hashlib.sha256(after).hexdigest(),
+                                "pack": pack, "offset": offset, "size": len(before)})
+                offset += len(before)
+            if durable:
+                f.flush()
+                os.fdatasync(f.fileno())
+        with open(os.path.join(self.path, f"journal-{os.getpid()}.jsonl"), "a") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+            if durable:
+                f.flush()
+                os.fdatasync(f.fileno())
+
+    def original(self, entry: Dict) -> bytes:
+        with open(os.path.join(self.path, entry["pack"]), "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["size"])
+        if hashlib.sha256(data).hexdigest() != entry["before"]:
+            raise ValueError(f"Journal copy of {entry['path']} is damaged")
+        return data
+
+    def rollback(self, force: bool = False) -> List[Tuple[str, str]]:
+        """Restore the originals; returns (path, outcome) with outcome restored, unchanged or conflict"""
+        outcomes = []
+        for entry in reversed(list(self.entries())):
+            path = entry["path"]
+            current = sha256_file(path)
+            if current == entry["before"]:
+                outcomes.append((path, "unchanged"))
+            elif current == entry["after"] or force:
+                write_atomic(path, self.original(entry))
+                outcomes.append((path, "restored"))
+            else:
+                # Edited since the run; restoring would lose that work
+                outcomes.append((path, "conflict"))
+        if not any(outcome == "conflict" for _, outcome in outcomes):
+            open(os.path.join(self.path, "rolled-back"), "w").close()
+        return outcomes
+
+
+class BatchWriter:
+    """
+    Stages a batch of outputs in temp files and publishes them together
+    Each directory is synced once per batch after the renames; with
+    `durable`, file data is synced before them too.
+    """
+
+    def __init__(self, journal: Optional[Journal] = None, durable: bool = False):
+        self.journal = journal
+        self.durable = durable
+        self.staged: List[Tuple[str, str, bytes, bytes]] = []
+        self.renamed: set = set()
+
+    def stage(self, path: str, before: bytes, after: bytes):
+        directory, name = os.path.split(path)
+        # Named per process so a worker never needs a random name (raw os
+        # calls: this is the hot path)
+        tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+        try:
+            fd = os.open(tmp_path, TEMP_FLAGS, mode)
+        except FileExistsError:
+            # Left by an interrupted run
+            os.unlink(tmp_path)
+            fd = os.open(tmp_path, TEMP_FLAGS, mode)
+        try:
+            # The mode given to os.open is narrowed by the umask
+            os.fchmod(fd, mode)
+            view = memoryview(after)
+            while view:
+                view = view[os.write(fd, view):]
+            if self.durable:
+                os.fdatasync(fd)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        self.staged.append((path, tmp_path, before, after))
+
+    def commit(self):
+        """Journal the batch, then rename every staged file over its target"""
+        if not self.staged:
+            return
+        if self.journal is not None:
+            self.journal.record([(path, before, after) for path, _, before, after in self.staged],
+                                self.durable)
+        directories = set()
+        for path, tmp_path, _, _ in self.staged:
+            os.replace(tmp_path, path)
+            self.renamed.add(path)
+            directories.add(os.path.dirname(path) or ".")
+        for directory in directories:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        self.staged = []
+
+    def abort(self):
+        """Drop whatever was staged and not yet renamed"""
+        for path, tmp_path, _, _ in self.staged:
+            if path not in self.renamed:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+        self.staged = []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List or roll back codemod runs")
+    parser.add_argument("--journals", default=DEFAULT_JOURNALS)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="Runs with a journal, newest last")
+    rollback = commands.add_parser("rollback", help="Restore the files a run rewrote")
+    rollback.add_argument("--run", help="Run id (default: the latest not rolled back)")
+    rollback.add_argument("--force", action="store_true", help="Also restore files edited since the run")
+    args = parser.parse_args(argv)
+
+    runs = Journal.runs(args.journals)
+    if args.command == "list":
+        for journal in runs:
+            info = journal.info
+            files = sum(1 for _ in journal.entries())
+            print(f"{journal.id}  {info['codemod']:<28} {files:>5} files"
+                  f"{'  (rolled back)' if journal.rolled_back else ''}")
+        if not runs:
+            print("No journaled runs")
+        return 0
+
+    if args.run:
+        matching = [journal for journal in runs if journal.id == args.run]
+    else:
+        matching = [journal for journal in runs if not journal.rolled_back][-1:]
+    if not matching:
+        print(f"❌ No run {args.run} to roll back" if args.run else "❌ No run to roll back")
+        return 1
+    journal = matching[0]
+    print(f"⏪ Rolling back {journal.id} ({journal.info['codemod']})...")
+    outcomes = journal.rollback(args.force)
+    for path, outcome in outcomes:
+        if outcome == "conflict":
+            print(f"  ⚠️  {os.path.relpath(path, REPO_ROOT)} was edited since the run; kept (use --force)")
+    counts = Counter(outcome for _, outcome in outcomes)
+    print(f"Restored {counts['restored']} files ({counts['unchanged']} already original, "
+          f"{counts['conflict']} conflicts)")
+    return 1 if counts["conflict"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
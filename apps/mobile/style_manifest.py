@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest for incremental codemod runs
+Records, per file and codemod, the content each file had after its last run
+and the codemod version that produced it. A file is fresh (and not even
+read) when its size and mtime still match; a touched file is hashed, and is
+fresh if its content is what was recorded. The codemods are idempotent, so a
+fresh file would come out unchanged anyway.
+
+Also selects the files git reports as changed since a revision.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import subprocess
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = os.environ.get(
+    "STYLE_CODEMOD_MANIFEST",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".style-codemod", "manifest.json"))
+
+
+def sha256_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Write via a temp file and rename, so readers never see a partial file
+    An existing file keeps its permissions.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        try:
+            os.fchmod(fd, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class Manifest:
+    """file path -> codemod name -> {version, digest, size, mtime_ns}"""
+
+    def __init__(self, path: str = DEFAULT_MANIFEST):
+        self.path = path
+        self.files: Dict[str, Dict[str, Dict]] = {}
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.files = manifest["files"]
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        self.dirty = False
+
+    def is_fresh(self, path: str, name: str, version: str) -> bool:
+        """True when `path` holds the content it had after the last run of this codemod version"""
+        entry = self.files.get(path, {}).get(name)
+        if not entry or entry["version"] != version:
+            return False
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            return False
+        if info.st_size == entry["size"] and info.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        # Touched but maybe not modified: trust the content, not the timestamp
+        if info.st_size != entry["size"] or sha256_file(path) != entry["digest"]:
+            return False
+        entry["mtime_ns"] = info.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def partition(self, files: List[str], name: str, version: str) -> Tuple[List[str], List[str]]:
+        """Split files into (pending, fresh)"""
+        pending, fresh = [], []
+        for path in files:
+            (fresh if self.is_fresh(path, name, version) else pending).append(path)
+        return pending, fresh
+
+    def record(self, path: str, name: str, version: str):
+        """Remember the content `path` has now, after a run of this codemod version"""
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            return
+        self.files.setdefault(path, {})[name] = {
+            "version": version, "digest": sha256_file(path),
+            "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        manifest = {"version": MANIFEST_VERSION, "files": self.files}
+        write_atomic(self.path, json.dumps(manifest, indent=1, sort_keys=True).encode())
+        self.dirty = False
+
+
+def git_changed_files(revision: str, cwd: str) -> Set[str]:
+    """
+    Absolute paths changed since `revision`: committed, staged and working
+    tree edits, plus untracked files that are not ignored
+    """
+    def git(*args) -> List[str]:
+        completed = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise ValueError(f"git {' '.join(args)} failed: {completed.stderr.strip()}")
+        return [line for line in completed.stdout.splitlines() if line]
+
+    top = git("rev-parse", "--show-toplevel")[0]
+    # Both list paths relative to the top of the work tree
+    changed = git("diff", "--name-only", "--diff-filter=d", revision, "--") + \
+        git("ls-files", "--others", "--exclude-standard", "--full-name")
+    return {os.path.abspath(os.path.join(top, name)) for name in changed}
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Run several style codemods as one pipeline
+Each file is read once, passed through every codemod in order in memory, and
+written atomically at most once (see style_codemod.Pipeline). Takes the same
+options as the single codemod scripts.
+
+Usage:
+    python3 style_pipeline.py                                  # update-styles.py, then v2
+    python3 style_pipeline.py --codemods responsive-v2,responsive --monorepo
+    python3 style_pipeline.py --codemods path/to/other-codemod.py --show-diff
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+from typing import List
+
+import style_codemod
+from style_codemod import REGISTRY, Codemod, Pipeline
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Scripts that register a codemod under each name
+CODEMOD_SCRIPTS = {"responsive": "update-styles.py", "responsive-v2": "update-styles-v2.py"}
+DEFAULT_CODEMODS = "responsive,responsive-v2"
+
+
+def load_script(path: str) -> Codemod:
+    """Import a codemod script (names may contain dashes) and return its CODEMOD"""
+    name = os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CODEMOD
+
+
+def load_codemods(names: List[str]) -> List[Codemod]:
+    codemods = []
+    for name in names:
+        if name.endswith(".py"):
+            codemods.append(load_script(name))
+            continue
+        if name not in REGISTRY and name in CODEMOD_SCRIPTS:
+            load_script(os.path.join(HERE, CODEMOD_SCRIPTS[name]))
+        if name not in REGISTRY:
+            known = sorted(set(REGISTRY) | set(CODEMOD_SCRIPTS))
+            raise KeyError(f"Unknown codemod '{name}' (known: {', '.join(known)})")
+        codemods.append(REGISTRY[name])
+    return codemods
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--codemods", default=DEFAULT_CODEMODS,
+                        help="Comma separated codemod names or script paths, applied in order")
+    args, rest = parser.parse_known_args(argv)
+    try:
+        codemods = load_codemods(args.codemods.split(","))
+    except (KeyError, OSError, AttributeError) as e:
+        print(f"❌ {e}")
+        return 1
+    return style_codemod.main(Pipeline(codemods), rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
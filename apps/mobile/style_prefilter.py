@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Byte-level prefilter for the style codemods
+Decides from a file's raw bytes, before any decoding or scanning, whether a
+codemod could change it. Files of MMAP_MIN_BYTES or more are memory-mapped,
+so rejecting them never copies them into memory.
+
+Stages, cheapest first (the name of the stage that rejects a file is
+reported):
+    anchor      the anchor token (StyleSheet.create) is missing
+    markers     the marker (deviceInfo.isTablet) occurs too often; counting
+                stops as soon as the limit is passed
+    candidates  no `key: literal` or `attr={literal}` pair any rule maps;
+                one regex pass with a set lookup per match, so the cost does
+                not grow with the number of rules
+
+A comment between a key and its value hides the pair from the candidates
+stage; the codemods never produce that layout.
+"""
+
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set, Tuple, Union
+
+from style_rules import RuleSet
+
+MMAP_MIN_BYTES = 64 * 1024
+STAGES = ("anchor", "markers", "candidates")
+
+# Every literal a rule can match must be one of these, or the candidates
+# stage cannot vouch for the ruleset and is turned off
+LITERAL = rb"\d[\d.]*|'[^'\n]*'|\"[^\"\n]*\""
+CANDIDATE = re.compile(
+    rb"(?<![\w$])([A-Za-z_$][\w$]*)['\"]?\s*:\s*(" + LITERAL + rb")(?![\w.])"
+    rb"|(?<![\w$])([A-Za-z_$][\w$-]*)\s*=\s*\{\s*(" + LITERAL + rb")\s*\}")
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def read_bytes(path: str) -> Iterator[Buffer]:
+    """The file's bytes; memory-mapped when it is large"""
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        if size < MMAP_MIN_BYTES:
+            yield f.read()
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def count_at_most(data: Buffer, needle: bytes, limit: int) -> int:
+    """Occurrences of `needle`, counting no further than limit + 1"""
+    count, pos = 0, data.find(needle)
+    while pos != -1 and count <= limit:
+        count += 1
+        pos = data.find(needle, pos + len(needle))
+    return count
+
+
+class Prefilter:
+    def __init__(self, rules: RuleSet, anchor: Optional[str], marker: str,
+                 max_markers: Optional[int]):
+        self.anchor = anchor.encode() if anchor else None
+        self.marker = marker.encode()
+        self.max_markers = max_markers
+        self.properties: Set[Tuple[bytes, bytes]] = set()
+        self.attributes: Set[Tuple[bytes, bytes]] = set()
+        exact = True
+        for scope, table in rules.tables.items():
+            target = self.attributes if scope == "attribute" else self.properties
+            for entry in table:
+                key, literal = entry[-2].encode(), entry[-1].encode()
+                exact = exact and re.fullmatch(LITERAL, literal) is not None
+                target.add((key, literal))
+        self.candidates = exact
+
+    def reject(self, data: Buffer) -> Optional[str]:
+        """The stage that rules the file out, or None when it may change"""
+        if self.anchor and data.find(self.anchor) == -1:
+            return "anchor"
+        if self.max_markers is not None and \
+                count_at_most(data, self.marker, self.max_markers) > self.max_markers:
+            return "markers"
+        if self.candidates and not self.has_candidate(data):
+            return "candidates"
+        return None
+
+    def has_candidate(self, data: Buffer) -> bool:
+        properties, attributes = self.properties, self.attributes
+        for match in CANDIDATE.finditer(data):
+            key, literal, attribute, value = match.groups()
+            if key is not None and (key, literal) in properties:
+                return True
+            if attribute is not None and (attribute, value) in attributes:
+                return True
+        return False
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Compiled rewrite rules for the style codemods
+Every rule of a ruleset is folded into one lookup table keyed by
+(property, literal), so a file is rewritten in a single pass over its scanned
+properties and JSX attributes, at one dictionary lookup each. Adding rules
+grows the table, not the work per file.
+
+Rule scopes:
+    stylesheet  properties inside StyleSheet.create blocks
+    object      properties of any object literal (inline styles too)
+    attribute   JSX attributes, optionally only on some tags
+"""
+
+import hashlib
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from style_scanner import Scan, splice
+
+SCOPES = ("stylesheet", "object", "attribute")
+
+
+class Rule:
+    """Replace literal `values` (keyed by their source text) of properties named `keys`"""
+
+    def __init__(self, name: str, keys: Iterable[str], values: Dict, scope: str = "stylesheet",
+                 tags: Optional[Iterable[str]] = None):
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown rule scope '{scope}' (expected one of {', '.join(SCOPES)})")
+        self.name = name
+        self.keys = sorted(keys)
+        # 16 and '16' are the same literal; values are matched on their exact text
+        self.values = {str(literal): replacement for literal, replacement in values.items()}
+        self.scope = scope
+        self.tags = sorted(tags) if tags else None
+
+    def describe(self) -> Dict:
+        return {"name": self.name, "keys": self.keys, "values": self.values,
+                "scope": self.scope, "tags": self.tags}
+
+
+class RuleSet:
+    """
+    Rules compiled into per-scope lookup tables
+    An earlier rule wins when two rules map the same property and literal.
+    `version` fingerprints the rules, so results can be tied to the ruleset
+    that produced them.
+    """
+
+    def __init__(self, name: str, rules: List[Rule]):
+        self.name = name
+        self.rules = rules
+        self.tables: Dict[str, Dict[Tuple, Tuple[str, str]]] = {scope: {} for scope in SCOPES}
+        for rule in rules:
+            table = self.tables[rule.scope]
+            for key in rule.keys:
+                for literal, replacement in rule.values.items():
+                    for tag in rule.tags or [None]:
+                        entry = (tag, key, literal) if rule.scope == "attribute" else (key, literal)
+                        table.setdefault(entry, (replacement, rule.name))
+        # Tag filter for the JSX scan; None means every tag
+        attribute_rules = [rule for rule in rules if rule.scope == "attribute"]
+        self.tag_names = None if any(rule.tags is None for rule in attribute_rules) else \
+            sorted({tag for rule in attribute_rules for tag in rule.tags})
+        described = json.dumps([rule.describe() for rule in rules], sort_keys=True)
+        self.version = hashlib.sha256(described.encode()).hexdigest()[:16]
+
+    def edits(self, scan: Scan) -> Tuple[List[Tuple[int, int, str]], Counter]:
+        """(start, end, replacement) edits for one scanned file, and hits per rule"""
+        source = scan.source
+        edits: List[Tuple[int, int, str]] = []
+        counts: Counter = Counter()
+        edited = set()
+
+        stylesheet, objects, attributes = (self.tables[scope] for scope in SCOPES)
+        if stylesheet:
+            for block in scan.blocks:
+                if not block.complete:
+                    continue
+                for prop in block.properties:
+                    hit = stylesheet.get((prop.key, source[prop.value_start:prop.value_end]))
+                    if hit:
+                        edits.append((prop.value_start, prop.value_end, hit[0]))
+                        counts[hit[1]] += 1
+                        edited.add(prop.value_start)
+        if objects:
+            for prop in scan.objects:
+                if prop.value_start in edited:
+                    continue
+                hit = objects.get((prop.key, source[prop.value_start:prop.value_end]))
+                if hit:
+                    edits.append((prop.value_start, prop.value_end, hit[0]))
+                    counts[hit[1]] += 1
+        if attributes:
+            for tag in scan.tags(self.tag_names):
+                for attribute in tag.attributes.values():
+                    if attribute.kind != "expression":
+                        continue
+                    literal = source[attribute.value_start:attribute.value_end].strip()
+                    hit = attributes.get((tag.name, attribute.name, literal)) or \
+                        attributes.get((None, attribute.name, literal))
+                    if hit:
+                        edits.append((attribute.value_start, attribute.value_end, hit[0]))
+                        counts[hit[1]] += 1
+        return edits, counts
+
+    def apply(self, source: str, scan: Optional[Scan] = None) -> Tuple[str, Counter]:
+        """Rewritten source and hits per rule"""
+        edits, counts = self.edits(scan or Scan(source))
+        return splice(source, edits), counts
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Linear-time scanner for the style codemods
+Finds StyleSheet.create blocks, their property spans and JSX tag attributes
+
+The source is tokenized once with patterns that never backtrack across
+tokens: comments, strings and template literals (with ${} nesting) are
+skipped as units, so braces inside them never count. An unterminated string
+ends at the end of its line and an unterminated comment at the end of the
+file, so a malformed file costs one pass like any other.
+
+The alternatives inside each repeated group never match the same character,
+so plain greedy quantifiers stay linear; possessive ones (`*+`) would need
+Python 3.11.
+
+Property spans come from a brace/paren/bracket stack, so objects nest to any
+depth (shadowOffset, Platform.select({...}), transform arrays...).
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Leading whitespace is folded into each token's match to halve the loop count
+TOKEN = re.compile(r"""
+    \s*
+  (?: (?P<comment>//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/)?)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+  | (?P<template>`)
+  | (?P<number>0[xXoObB][\da-fA-F_]+n?|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)
+  | (?P<name>[^\W\d][\w$]*|\$[\w$]*)
+  | (?P<punct>\.\.\.|=>|\?\.(?!\d)|[{}()\[\];,:.?<>=!+\-*/%&|^~@\#])
+  | (?P<other>.)
+  | (?P<end>$) )
+""", re.S | re.X)
+# Rest of a template literal: up to the closing backtick or the next ${
+TEMPLATE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*(`|\$\{)?", re.S)
+# Regex literals are only tried where an operand is expected, and never span lines
+REGEX = re.compile(r"/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+# Tokens after which `/` starts a regex rather than dividing; `<` and `>` are
+# left out so JSX closing tags (</View>) stay punctuation
+REGEX_AFTER = set("([{,;:=!&|?+-*%~^") | {"=>", "..."}
+REGEX_KEYWORDS = {"return", "typeof", "case", "in", "of", "new", "delete", "void", "throw",
+                  "else", "do", "yield", "await"}
+OPENERS = {"{": "}", "(": ")", "[": "]"}
+
+Token = Tuple[str, int, int]
+
+
+def tokenize(source: str) -> List[Token]:
+    """Significant tokens as (kind, start, end); whitespace and comments are dropped"""
+    tokens: List[Token] = []
+    # One entry per open brace: True when it opened a template ${ } expression
+    braces: List[bool] = []
+    pos, length = 0, len(source)
+    match_token, match_template, match_regex = TOKEN.match, TEMPLATE.match, REGEX.match
+    while pos < length:
+        found = match_token(source, pos)
+        kind, end = found.lastgroup, found.end()
+        pos = found.start(kind)
+        if source[pos:end] == "/" and (not tokens or _expects_operand(source, tokens[-1])):
+            regex = match_regex(source, pos)
+            if regex:
+                tokens.append(("regex", pos, regex.end()))
+                pos = regex.end()
+                continue
+        if kind == "template":
+            end = _template(source, end, tokens, pos, braces, match_template)
+        elif kind == "punct":
+            text = source[pos]
+            if text == "{":
+                braces.append(False)
+            elif text == "}" and braces and braces.pop():
+                # Closing a ${ } expression resumes the template text
+                end = _template(source, end, tokens, pos, braces, match_template)
+                pos = end
+                continue
+            tokens.append((kind, pos, end))
+        elif kind != "comment" and kind != "end":
+            tokens.append((kind, pos, end))
+        pos = end
+    return tokens
+
+
+def _expects_operand(source: str, previous: Token) -> bool:
+    kind, start, end = previous
+    text = source[start:end]
+    return (kind == "punct" and text in REGEX_AFTER) or (kind == "name" and text in REGEX_KEYWORDS)
+
+
+def _template(source: str, pos: int, tokens: List[Token], start: int, braces: List[bool],
+              match_template) -> int:
+    """Emit the template text from `pos` as one string token; returns where scanning resumes"""
+    found = match_template(source, pos)
+    tokens.append(("string", start, found.end()))
+    if found.group(1) == "${":
+        braces.append(True)
+    return found.end()
+
+
+class Property:
+    """One `key: value` inside a style block; spans are offsets into the source"""
+
+    __slots__ = ("key", "parent", "key_start", "key_end", "value_start", "value_end", "kind")
+
+    def __init__(self, key: str, parent: Optional["Property"], key_start: int, key_end: int,
+                 value_start: int):
+        self.key = key
+        # Property whose value holds this one; a link rather than a copied
+        # path, so deeply nested (or never closed) objects stay linear
+        self.parent = parent
+        self.key_start, self.key_end = key_start, key_end
+        self.value_start = self.value_end = value_start
+        # "number" or "string" for a single literal token, else "expression"
+        self.kind = "expression"
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        """Keys of the enclosing objects, outermost first: ('card', 'shadowOffset')"""
+        keys, parent = [], self.parent
+        while parent is not None:
+            keys.append(parent.key)
+            parent = parent.parent
+        return tuple(reversed(keys))
+
+    def value(self, source: str) -> str:
+        return source[self.value_start:self.value_end]
+
+    def __repr__(self):
+        return f"Property({'.'.join(self.path + (self.key,))} @{self.value_start}:{self.value_end})"
+
+
+class StyleBlock:
+    """A StyleSheet.create({...}) call; body_start/body_end span the object braces"""
+
+    def __init__(self, name: Optional[str], start: int, body_start: int):
+        self.name = name
+        self.start = self.end = start
+        self.body_start = self.body_end = body_start
+        self.properties: List[Property] = []
+        # False when the file ends before the object closes
+        self.complete = False
+
+    def __repr__(self):
+        return f"StyleBlock({self.name}, {self.start}:{self.end}, {len(self.properties)} properties)"
+
+
+class Attribute:
+    """A JSX attribute; for {expr} values the span is the expression inside the braces"""
+
+    __slots__ = ("name", "value_start", "value_end", "kind")
+
+    def __init__(self, name: str, value_start: int, value_end: int, kind: str):
+        self.name = name
+        self.value_start, self.value_end = value_start, value_end
+        # "string", "expression" or "flag" (no value)
+        self.kind = kind
+
+    def value(self, source: str) -> str:
+        return source[self.value_start:self.value_end]
+
+
+class JsxTag:
+    """An opening (or self-closing) JSX tag"""
+
+    def __init__(self, name: str, start: int):
+        self.name = name
+        self.start = self.end = start
+        self.attributes: Dict[str, Attribute] = {}
+
+
+class Scan:
+    """
+    One tokenization of a source file, shared by every query on it
+    `blocks` and `objects` are computed on first use; `tags(names)` finds
+    JSX tags by name (or all tags when `names` is None).
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = tokenize(source)
+        self._blocks: Optional[List[StyleBlock]] = None
+        self._objects: Optional[List[Property]] = None
+
+    def text(self, index: int) -> str:
+        _, start, end = self.tokens[index]
+        return self.source[start:end]
+
+    def _is(self, index: int, text: str) -> bool:
+        return index < len(self.tokens) and self.text(index) == text
+
+    @property
+    def blocks(self) -> List[StyleBlock]:
+        if self._blocks is None:
+            self._blocks = []
+            index, count = 0, len(self.tokens)
+            while index < count:
+                if self.tokens[index][0] == "name" and self.text(index) == "StyleSheet" and \
+                        self._is(index + 1, ".") and self._is(index + 2, "create") and \
+                        self._is(index + 3, "(") and self._is(index + 4, "{"):
+                    block, index = self._block(index)
+                    self._blocks.append(block)
+                else:
+                    index += 1
+        return self._blocks
+
+    @property
+    def objects(self) -> List[Property]:
+        """Properties of every object literal in the file (inline styles, configs...)"""
+        if self._objects is None:
+            self._objects, _, _ = self._walk(0, nested=False)
+        return self._objects
+
+    def declarations(self) -> Dict[str, List[Property]]:
+        """Properties of each `const NAME = {...}` object, such as design token tables"""
+        found: Dict[str, List[Property]] = {}
+        index, count = 0, len(self.tokens)
+        while index < count - 3:
+            if self.tokens[index][0] == "name" and self.text(index) in ("const", "let", "var") and \
+                    self.tokens[index + 1][0] == "name" and self._is(index + 2, "=") and \
+                    self._is(index + 3, "{"):
+                name = self.text(index + 1)
+                found[name], index, _ = self._walk(index + 3, nested=True)
+            index += 1
+        return found
+
+    def _block(self, first: int) -> Tuple[StyleBlock, int]:
+        """Parse the object after StyleSheet.create( ; returns the block and the next token"""
+        tokens = self.tokens
+        name = None
+        if first >= 3 and self._is(first - 1, "=") and tokens[first - 2][0] == "name" and \
+                self.text(first - 3) in ("const", "let", "var"):
+            name = self.text(first - 2)
+        open_index = first + 4
+        block = StyleBlock(name, tokens[first][1], tokens[open_index][1])
+        block.properties, index, block.complete = self._walk(open_index, nested=True)
+        if block.complete:
+            end = tokens[index][2]
+            block.body_end = end
+            block.end = tokens[index + 1][2] if self._is(index + 1, ")") else end
+        else:
+            block.body_end = block.end = len(self.source)
+        return block, index + 1
+
+    def _walk(self, index: int, nested: bool) -> Tuple[List[Property], int, bool]:
+        """
+        Collect `key: value` properties from token `index` on
+        With `nested`, stop where the bracket opened at `index` closes and
+        return its index and True; otherwise (or if it never closes) walk to
+        the end of the file and return False.
+        """
+        tokens, source = self.tokens, self.source
+        properties: List[Property] = []
+        # Frame: [closer, parent property, open property or None, at key position, value's first token]
+        stack: List[list] = []
+        count = len(tokens)
+        while index < count:
+            kind, start, end = tokens[index]
+            text = source[start:end] if kind == "punct" else None
+            frame = stack[-1] if stack else None
+            if frame is not None and frame[0] == "}" and frame[3]:
+                frame[3] = False
+                if kind in ("name", "string", "number") and self._is(index + 1, ":"):
+                    key = source[start:end]
+                    if kind == "string":
+                        key = key[1:-1]
+                    value_index = index + 2
+                    value_start = tokens[value_index][1] if value_index < count else end
+                    frame[2] = Property(key, frame[1], start, end, value_start)
+                    frame[4] = value_index
+                    index = value_index
+                    continue
+            if text in OPENERS:
+                parent = frame[1] if frame else None
+                if frame is not None and frame[2] is not None:
+                    parent = frame[2]
+                stack.append([OPENERS[text], parent, None, text == "{", index + 1])
+            elif text in (",", "}", ")", "]") and frame is not None:
+                if text == "," and frame[0] == "}":
+                    self._close(properties, frame, index)
+                    frame[3] = True
+                elif text == frame[0]:
+                    if text == "}":
+                        self._close(properties, frame, index)
+                    stack.pop()
+                    if nested and not stack:
+                        # Inner properties close first; report them in source order
+                        properties.sort(key=lambda prop: prop.key_start)
+                        return properties, index, True
+            index += 1
+        properties.sort(key=lambda prop: prop.key_start)
+        return properties, index, False
+
+    def _close(self, properties: List[Property], frame: list, index: int):
+        """End the frame's open property just before token `index` (a comma or closing brace)"""
+        prop = frame[2]
+        if prop is None:
+            return
+        first = frame[4]
+        if index > first:
+            prop.value_end = self.tokens[index - 1][2]
+            if index - first == 1 and self.tokens[first][0] in ("number", "string"):
+                prop.kind = self.tokens[first][0]
+        properties.append(prop)
+        frame[2] = None
+
+    def tags(self, names: Optional[Iterable[str]] = None) -> List[JsxTag]:
+        """Opening JSX tags named `names` (default: all), with their attribute value spans"""
+        wanted = set(names) if names is not None else None
+        tokens, source = self.tokens, self.source
+        found: List[JsxTag] = []
+        index, count = 0, len(tokens)
+        while index < count - 1:
+            kind, start, end = tokens[index]
+            following = tokens[index + 1]
+            index += 1
+            if kind != "punct" or source[start] != "<" or following[0] != "name" or following[1] != end:
+                continue
+            name = source[following[1]:following[2]]
+            if wanted is not None and name not in wanted:
+                continue
+            tag = JsxTag(name, start)
+            index = self._attributes(tag, index + 1)
+            found.append(tag)
+        return found
+
+    def _attributes(self, tag: JsxTag, index: int) -> int:
+        tokens, source = self.tokens, self.source
+        count = len(tokens)
+        while index < count:
+            kind, start, end = tokens[index]
+            text = source[start:end]
+            if text == ">" or (text == "/" and self._is(index + 1, ">")):
+                index += 1 if text == ">" else 2
+                tag.end = tokens[index - 1][2]
+                return index
+            if kind == "name" and self._is(index + 1, "="):
+                value_kind, value_start, value_end = tokens[index + 2] if index + 2 < count else ("", end, end)
+                if value_kind == "string":
+                    tag.attributes[text] = Attribute(text, value_start, value_end, "string")
+                    index += 3
+                    continue
+                if source[value_start:value_end] == "{":
+                    closing = self._matching(index + 2)
+                    inner_end = tokens[closing][1] if closing < count else len(source)
+                    tag.attributes[text] = Attribute(text, value_end, inner_end, "expression")
+                    index = closing + 1
+                    continue
+            elif kind == "name":
+                tag.attributes[text] = Attribute(text, end, end, "flag")
+            elif text == "{":
+                # {...spread}
+                index = self._matching(index) + 1
+                continue
+            index += 1
+        tag.end = len(source)
+        return index
+
+    def _matching(self, index: int) -> int:
+        """Index of the bracket closing the one at `index` (len(tokens) if it never closes)"""
+        depth, count = 0, len(self.tokens)
+        while index < count:
+            _, start, end = self.tokens[index]
+            char = self.source[start] if end - start == 1 else ""
+            if char in OPENERS:
+                depth += 1
+            elif char in ("}", ")", "]"):
+                depth -= 1
+                if depth == 0:
+                    return index
+            index += 1
+        return count
+
+
+def splice(source: str, edits: List[Tuple[int, int, str]]) -> str:
+    """Apply non-overlapping (start, end, replacement) edits in one pass"""
+    if not edits:
+        return source
+    parts, pos = [], 0
+    for start, end, replacement in sorted(edits):
+        parts.append(source[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(source[pos:])
+    return "".join(parts)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Pathological-input benchmark for the StyleSheet scanner
+Times the old nested-quantifier regex and style_scanner.Scan on generated
+inputs of growing size, and fails if the scanner's cost per byte grows
+
+Each old-regex case runs in a child process with a timeout, since on
+unbalanced nested blocks it backtracks exponentially and would never finish.
+
+Usage:
+    python3 style_scanner_bench.py
+    python3 style_scanner_bench.py --max-kb 4096 --timeout 5
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from style_scanner import Scan
+
+# The pattern update-styles-v2.py used before the scanner
+OLD_BLOCK_PATTERN = r'const styles = StyleSheet\.create\({([^}]+(?:{[^}]+}[^}]+)*)\}\);'
+OLD_ICON_PATTERN = r'<Ionicons\s+([^>]*)size=\{24\}([^>]*)/>'
+HEADER = "const styles = StyleSheet.create({\n"
+
+# name -> (repeated unit, closing text); each input is HEADER + unit * n + closing
+FAMILIES: Dict[str, tuple] = {
+    # A block that never closes, with objects nested two deep: every split of
+    # the [^}]+ runs is tried before the old pattern gives up
+    "unbalanced-nested": ("  x: { a: { b: 1 }, ", "\n"),
+    # Ordinary well-formed styles, for the linear baseline
+    "balanced": ("  card: { padding: 16, shadowOffset: { width: 0, height: 2 }, borderRadius: 12 },\n",
+                 "});\n"),
+    # Braces and quotes inside comments, strings and templates
+    "braces-in-literals": ("  t: { content: '}', /* { */ fontFamily: `${f}}` }, // }\n", "});\n"),
+    # JSX with arrow functions and comparisons inside attributes
+    "jsx-attributes": ("<Ionicons name=\"star\" onPress={() => go(a > b)} size={24} color={c} />\n", ""),
+}
+
+
+def build_input(family: str, size: int) -> str:
+    unit, closing = FAMILIES[family]
+    return HEADER + unit * max(1, (size - len(HEADER)) // len(unit)) + closing
+
+
+def old_engine(source: str) -> int:
+    if source.startswith(HEADER):
+        return len(re.findall(OLD_BLOCK_PATTERN, source, flags=re.DOTALL)) + \
+            len(re.findall(OLD_ICON_PATTERN, source))
+    return len(re.findall(OLD_ICON_PATTERN, source))
+
+
+def new_engine(source: str) -> int:
+    scan = Scan(source)
+    return sum(len(block.properties) for block in scan.blocks) + len(scan.tags(["Ionicons"]))
+
+
+def best_of(engine: Callable[[str], int], source: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        engine(source)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def time_old(family: str, size: int, timeout: float) -> Optional[float]:
+    """Old regex time in a child process; None when it exceeds `timeout`"""
+    try:
+        completed = subprocess.run([sys.executable, __file__, "--child", family, str(size)],
+                                   capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+    return float(completed.stdout.strip())
+
+
+def sizes(max_kb: int) -> List[int]:
+    found, size = [], 256
+    while size <= max_kb * 1024:
+        found.append(size)
+        size *= 4
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the StyleSheet scanner on pathological inputs")
+    parser.add_argument("--max-kb", type=int, default=1024, help="Largest generated input")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Seconds before an old-regex case is abandoned")
+    parser.add_argument("--runs", type=int, default=3, help="Scanner runs per case (best is reported)")
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help="Allowed growth of the scanner's cost per byte from 16KB to the largest input")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        source = build_input(args.child[0], int(args.child[1]))
+        print(best_of(old_engine, source, 1))
+        return 0
+
+    print(f"⏱️  StyleSheet scanner benchmark (old regex abandoned after {args.timeout:.1f}s)")
+    print(f"{'input':<20} {'size':>9} {'old regex':>12} {'scanner':>11} {'ns/byte':>8}")
+    print("-" * 64)
+    problems = []
+    for family in FAMILIES:
+        per_byte = {}
+        for size in sizes(args.max_kb):
+            source = build_input(family, size)
+            old = time_old(family, size, args.timeout)
+            new = best_of(new_engine, source, args.runs)
+            per_byte[size] = new / len(source) * 1e9
+            old_text = f"{old * 1000:.2f}ms" if old is not None else "timeout"
+            print(f"{family:<20} {len(source) / 1024:>7.1f}KB {old_text:>12} {new * 1000:>9.2f}ms "
+                  f"{per_byte[size]:>8.0f}")
+        # Small inputs are dominated by fixed costs; compare from 16KB up
+        measured = [size for size in per_byte if size >= 16 * 1024]
+        if len(measured) >= 2:
+            growth = per_byte[measured[-1]] / per_byte[measured[0]]
+            if growth > args.max_growth:
+                problems.append(f"{family}: cost per byte grew {growth:.1f}x")
+    print("-" * 64)
+
+    if problems:
+        print(f"❌ Scanner time is not linear in input size:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("✅ Scanner time stays linear on every input family")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
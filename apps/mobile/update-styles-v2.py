@@ -4,9 +4,11 @@ Script to update React Native StyleSheet definitions to use responsive utilities
 Handles all edge cases more carefully
 """
 
-import re
-import os
-import glob
+import sys
+
+import style_codemod
+from style_codemod import Codemod, register
+from style_rules import Rule, RuleSet
 
 # Mappings for responsive conversions
 SPACING_MAP = {
@@ -33,125 +35,42 @@ FONT_SIZE_MAP = {
     36: 'typography.h1',
 }
 
-def update_styles_in_stylesheet(content):
-    """Update styling within StyleSheet.create blocks"""
-
-    # Find all StyleSheet.create blocks
-    pattern = r'const styles = StyleSheet\.create\({([^}]+(?:{[^}]+}[^}]+)*)\}\);'
-
-    def process_stylesheet(match):
-        styles_content = match.group(1)
-        original = styles_content
-
-        # Replace common spacing values with responsive utilities
-        for px, responsive in SPACING_MAP.items():
-            # Update padding and margin properties
-            styles_content = re.sub(
-                rf'\b(padding|margin|paddingHorizontal|paddingVertical|marginHorizontal|marginVertical|paddingTop|paddingBottom|paddingLeft|paddingRight|marginTop|marginBottom|marginLeft|marginRight|gap):\s*{px}\b',
-                rf'\1: {responsive}',
-                styles_content
-            )
-
-        # Replace font sizes
-        for px, responsive in FONT_SIZE_MAP.items():
-            styles_content = re.sub(
-                rf'\bfontSize:\s*{px}\b',
-                f'fontSize: {responsive}',
-                styles_content
-            )
-
-        # Add tablet-specific borderRadius for common cases
-        styles_content = re.sub(
-            r'\bborderRadius:\s*12\b',
-            'borderRadius: deviceInfo.isTablet ? 14 : 12',
-            styles_content
-        )
-
-        styles_content = re.sub(
-            r'\bborderRadius:\s*10\b',
-            'borderRadius: deviceInfo.isTablet ? 12 : 10',
-            styles_content
-        )
+SPACING_PROPS = {
+    'padding', 'margin', 'paddingHorizontal', 'paddingVertical', 'marginHorizontal', 'marginVertical',
+    'paddingTop', 'paddingBottom', 'paddingLeft', 'paddingRight',
+    'marginTop', 'marginBottom', 'marginLeft', 'marginRight', 'gap',
+}
 
-        return f'const styles = StyleSheet.create({{{styles_content}}});'
+BORDER_RADIUS_MAP = {
+    12: 'deviceInfo.isTablet ? 14 : 12',
+    10: 'deviceInfo.isTablet ? 12 : 10',
+}
 
-    try:
-        content = re.sub(pattern, process_stylesheet, content, flags=re.DOTALL)
-    except Exception as e:
-        print(f"    Error in regex replacement: {e}")
+ICON_SIZE_MAP = {
+    24: 'deviceInfo.isTablet ? scale(26) : scale(24)',
+    20: 'deviceInfo.isTablet ? scale(22) : scale(20)',
+}
 
-    return content
+# Every mapping is compiled into one lookup table: a file is rewritten in a
+# single pass over its style properties and Ionicons tags, however many rules
+RULES = RuleSet('responsive-v2', [
+    Rule('spacing', SPACING_PROPS, SPACING_MAP),
+    Rule('fontSize', ['fontSize'], FONT_SIZE_MAP),
+    Rule('borderRadius', ['borderRadius'], BORDER_RADIUS_MAP),
+    Rule('iconSize', ['size'], ICON_SIZE_MAP, scope='attribute', tags=['Ionicons']),
+])
 
-def update_icon_sizes(content):
-    """Update Ionicons size props to be responsive"""
-    content = re.sub(
-        r'<Ionicons\s+([^>]*)size={24}([^>]*)/>',
-        r'<Ionicons \1size={deviceInfo.isTablet ? scale(26) : scale(24)}\2/>',
-        content
-    )
-    content = re.sub(
-        r'<Ionicons\s+([^>]*)size={20}([^>]*)/>',
-        r'<Ionicons \1size={deviceInfo.isTablet ? scale(22) : scale(20)}\2/>',
-        content
-    )
-    return content
+# Files already using deviceInfo.isTablet more than 10 times were converted by hand
+CODEMOD = register(Codemod('responsive-v2', RULES, max_markers=10,
+                           skip_files=['ResponsiveLayout.tsx', 'responsive.ts', 'responsive.tsx']))
 
 def process_file(filepath):
     """Process a single file"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Check if file has StyleSheet
-        if 'StyleSheet.create' not in content:
-            return False
-
-        # Check if file already uses responsive utilities extensively
-        if content.count('deviceInfo.isTablet') > 10:
-            return False
-
-        # Update the content
-        original_content = content
-        content = update_styles_in_stylesheet(content)
-        content = update_icon_sizes(content)
-
-        # Only write if content changed
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-
-        return False
-
-    except Exception as e:
-        print(f"    Error processing {filepath}: {e}")
-        return False
-
-def main():
-    """Main function to process all files"""
-    screens_dir = '/home/ubuntu/cryb-platform/apps/mobile/src/screens'
-    components_dir = '/home/ubuntu/cryb-platform/apps/mobile/src/components'
-
-    count = 0
-
-    all_files = []
-    all_files.extend(glob.glob(f'{screens_dir}/**/*.tsx', recursive=True))
-    all_files.extend(glob.glob(f'{components_dir}/**/*.tsx', recursive=True))
-
-    print(f"Processing {len(all_files)} files...")
-    print()
-
-    for filepath in all_files:
-        if 'ResponsiveLayout.tsx' in filepath or 'responsive.ts' in filepath:
-            continue
-
-        if process_file(filepath):
-            print(f"✓ Updated {os.path.basename(filepath)}")
-            count += 1
+    return CODEMOD.transform(filepath)['status'] == 'changed'
 
-    print(f"\n===== SUMMARY =====")
-    print(f"Updated {count} files with responsive styles")
-    print("Done!")
+def main(argv=None):
+    """Main function to process all files (in parallel; see style_codemod.py)"""
+    return style_codemod.main(CODEMOD, argv)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -3,9 +3,11 @@
 Script to update React Native StyleSheet definitions to use responsive utilities
 """
 
-import re
-import os
-import glob
+import sys
+
+import style_codemod
+from style_codemod import Codemod, register
+from style_rules import Rule, RuleSet
 
 # Mappings for responsive conversions
 SPACING_MAP = {
@@ -38,113 +40,35 @@ FONT_SIZE_MAP = {
     '36': 'typography.h1',
 }
 
-def update_spacing_property(value):
-    """Update spacing values to use responsive utilities"""
-    match = re.match(r'^(\d+)$', value)
-    if match:
-        num = match.group(1)
-        if num in SPACING_MAP:
-            return SPACING_MAP[num]
-    return value
-
-def update_font_size(value):
-    """Update fontSize values to use typography"""
-    match = re.match(r'^(\d+)$', value)
-    if match:
-        num = match.group(1)
-        if num in FONT_SIZE_MAP:
-            return FONT_SIZE_MAP[num]
-    return value
-
-def add_tablet_specific_styles(content):
-    """Add tablet-specific responsive styles"""
-
-    # Pattern to find padding/margin properties
-    def replace_spacing(match):
-        prop = match.group(1)
-        value = match.group(2)
-        new_value = update_spacing_property(value)
-        return f"{prop}: {new_value},"
-
-    # Pattern to find fontSize properties
-    def replace_font_size(match):
-        value = match.group(1)
-        new_value = update_font_size(value)
-        return f"fontSize: {new_value},"
-
-    # Update padding/margin values
-    content = re.sub(r'(padding|margin|paddingHorizontal|paddingVertical|marginHorizontal|marginVertical|paddingTop|paddingBottom|paddingLeft|paddingRight|marginTop|marginBottom|marginLeft|marginRight): (\d+),', replace_spacing, content)
-
-    # Update fontSize values
-    content = re.sub(r'fontSize: (\d+),', replace_font_size, content)
-
-    # Update gap values
-    content = re.sub(r'gap: (\d+),', replace_spacing, content)
-
-    # Add tablet-specific borderRadius where appropriate
-    content = re.sub(r'borderRadius: 12,', 'borderRadius: deviceInfo.isTablet ? 14 : 12,', content)
-
-    # Add tablet-specific icon sizes where we see size 24
-    content = re.sub(r'size={24}', 'size={deviceInfo.isTablet ? scale(26) : scale(24)}', content)
-    content = re.sub(r'size={20}', 'size={deviceInfo.isTablet ? scale(22) : scale(20)}', content)
-
-    return content
+SPACING_PROPS = [
+    'padding', 'margin', 'paddingHorizontal', 'paddingVertical', 'marginHorizontal', 'marginVertical',
+    'paddingTop', 'paddingBottom', 'paddingLeft', 'paddingRight',
+    'marginTop', 'marginBottom', 'marginLeft', 'marginRight', 'gap',
+]
+
+# All rewrites compiled into one lookup table and applied in a single pass.
+# Unlike update-styles-v2.py these cover every object literal in the file
+# (inline styles too), and icon sizes on any tag.
+RULES = RuleSet('responsive', [
+    Rule('spacing', SPACING_PROPS, SPACING_MAP, scope='object'),
+    Rule('fontSize', ['fontSize'], FONT_SIZE_MAP, scope='object'),
+    Rule('borderRadius', ['borderRadius'], {'12': 'deviceInfo.isTablet ? 14 : 12'}, scope='object'),
+    Rule('iconSize', ['size'], {
+        '24': 'deviceInfo.isTablet ? scale(26) : scale(24)',
+        '20': 'deviceInfo.isTablet ? scale(22) : scale(20)',
+    }, scope='attribute'),
+])
+
+# Files already using deviceInfo.isTablet more than 5 times were converted by hand
+CODEMOD = register(Codemod('responsive', RULES, max_markers=5, skip_files=['ResponsiveLayout.tsx']))
 
 def process_file(filepath):
     """Process a single file"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Check if file has StyleSheet
-        if 'StyleSheet.create' not in content:
-            return False
-
-        # Check if file already uses responsive utilities (skip if heavily optimized)
-        if content.count('deviceInfo.isTablet') > 5:
-            print(f"  Skipping {filepath} (already optimized)")
-            return False
-
-        # Update the content
-        original_content = content
-        content = add_tablet_specific_styles(content)
-
-        # Only write if content changed
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-
-        return False
-
-    except Exception as e:
-        print(f"  Error processing {filepath}: {e}")
-        return False
-
-def main():
-    """Main function to process all files"""
-    screens_dir = '/home/ubuntu/cryb-platform/apps/mobile/src/screens'
-    components_dir = '/home/ubuntu/cryb-platform/apps/mobile/src/components'
-
-    count = 0
-
-    print("Processing screens...")
-    for filepath in glob.glob(f'{screens_dir}/**/*.tsx', recursive=True):
-        if process_file(filepath):
-            print(f"  ✓ Updated {os.path.basename(filepath)}")
-            count += 1
-
-    print("\nProcessing components...")
-    for filepath in glob.glob(f'{components_dir}/**/*.tsx', recursive=True):
-        if filepath.endswith('ResponsiveLayout.tsx'):
-            continue  # Skip the responsive layout component itself
-        if process_file(filepath):
-            print(f"  ✓ Updated {os.path.basename(filepath)}")
-            count += 1
+    return CODEMOD.transform(filepath)['status'] == 'changed'
 
-    print(f"\n===== SUMMARY =====")
-    print(f"Updated {count} files with responsive styles")
-    print("Done!")
+def main(argv=None):
+    """Main function to process all files (in parallel; see style_codemod.py)"""
+    return style_codemod.main(CODEMOD, argv)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -4,7 +4,6 @@ CRYB Platform - Clockify Automated Time Tracking
 Manages time tracking for 28 Senior Engineer Agents
 """
 
-import requests
 import json
 import random
 from datetime import datetime, timedelta
@@ -12,6 +11,8 @@ import time
 import asyncio
 from typing import Dict, List, Optional
 
+from clockify_client import ClockifyClient, parse_duration
+
 class ClockifyAutomation:
     """
     Automated time tracking for CRYB development
@@ -19,12 +20,10 @@ class ClockifyAutomation:
     """
     
     def __init__(self):
-        self.api_key = "ODc5M2U0ODktMmM0Yy00ZTI5LWI2MDktNDg3MzUxZmQ1Zjll"
-        self.base_url = "https://api.clockify.me/api/v1"
-        self.headers = {
-            "X-Api-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
+        self.client = ClockifyClient(workspace_id=None)
+        self.api_key = self.client.api_key
+        self.base_url = self.client.base_url
+        self.headers = self.client.headers
         
         # Initialize workspace and projects
         self.workspace_id = None
@@ -118,14 +117,12 @@ class ClockifyAutomation:
     async def initialize(self):
         """Get workspace and create projects if needed"""
         # Get workspace
-        workspace_response = requests.get(
-            f"{self.base_url}/user",
-            headers=self.headers
-        )
+        workspace_response = self.client.request("GET", "/user")
         
         if workspace_response.status_code == 200:
             user_data = workspace_response.json()
             self.workspace_id = user_data.get("defaultWorkspace")
+            self.client.workspace_id = self.workspace_id
             print(f"✅ Connected to Clockify workspace: {self.workspace_id}")
             
             # Get or create projects
@@ -136,9 +133,8 @@ class ClockifyAutomation:
     async def setup_projects(self):
         """Create projects for each team if they don't exist"""
         # Get existing projects
-        projects_response = requests.get(
-            f"{self.base_url}/workspaces/{self.workspace_id}/projects",
-            headers=self.headers
+        projects_response = self.client.request(
+            "GET", f"/workspaces/{self.workspace_id}/projects"
         )
         
         if projects_response.status_code == 200:
@@ -158,9 +154,8 @@ class ClockifyAutomation:
                     print(f"✅ Found project: {project_name}")
                 else:
                     # Create new project
-                    create_response = requests.post(
-                        f"{self.base_url}/workspaces/{self.workspace_id}/projects",
-                        headers=self.headers,
+                    create_response = self.client.request(
+                        "POST", f"/workspaces/{self.workspace_id}/projects",
                         json={
                             "name": project_name,
                             "color": "#" + ''.join(random.choices('0123456789ABCDEF', k=6)),
@@ -205,9 +200,8 @@ class ClockifyAutomation:
             "tags": [team, "automated", "development"]
         }
         
-        response = requests.post(
-            f"{self.base_url}/workspaces/{self.workspace_id}/time-entries",
-            headers=self.headers,
+        response = self.client.request(
+            "POST", f"/workspaces/{self.workspace_id}/time-entries",
             json=entry_data
         )
         
@@ -274,9 +268,8 @@ class ClockifyAutomation:
         start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
         end_date = datetime.now().strftime("%Y-%m-%dT23:59:59Z")
         
-        response = requests.get(
-            f"{self.base_url}/workspaces/{self.workspace_id}/time-entries",
-            headers=self.headers,
+        response = self.client.request(
+            "GET", f"/workspaces/{self.workspace_id}/time-entries",
             params={
                 "start": start_date,
                 "end": end_date
@@ -313,17 +306,7 @@ class ClockifyAutomation:
     
     def parse_duration(self, duration_str: str) -> float:
         """Parse ISO 8601 duration to hours"""
-        # Simple parser for PT2H30M format
-        import re
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        
-        if match:
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            return hours + minutes/60 + seconds/3600
-        return 0
+        return parse_duration(duration_str)
 
 async def main():
     """Main execution"""
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify CLI startup benchmark
+Times fresh interpreter launches of offline clockify_cli.py commands, since
+they run from shell hooks many times a day
+
+Usage:
+    python3 clockify_bench_startup.py --runs 30 --max-median-ms 80
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(HERE, "clockify_cli.py")
+
+# Commands that never touch the network, so timings measure startup only
+COMMANDS = {
+    "python (floor)": [sys.executable, "-c", "pass"],
+    "cli --help": [sys.executable, CLI, "--help"],
+    "cli status": [sys.executable, CLI, "status"],
+    "cli stop (idle)": [sys.executable, CLI, "stop"],
+}
+
+# Modules a cache-only command must not import
+HEAVY_MODULES = ["requests", "urllib3", "ssl", "asyncio"]
+
+
+def time_command(command, runs: int, env) -> list:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def heavy_imports(env) -> list:
+    """Modules from HEAVY_MODULES loaded after running `status` in-process"""
+    probe = (
+        "import sys, io, contextlib\n"
+        f"sys.path.insert(0, {HERE!r})\n"
+        "import clockify_cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    clockify_cli.main(['status'])\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    return [m for m in output.split(",") if m]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark clockify_cli.py startup time")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-median-ms", type=float,
+                        help="Fail when a CLI command's median exceeds the interpreter floor by this much")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # An empty cache keeps the benchmark independent of any running timer
+        env = dict(os.environ, CLOCKIFY_CACHE=os.path.join(tmp, "clockify.json"))
+
+        print(f"⏱️  Clockify CLI startup ({args.runs} runs each)")
+        print("-" * 60)
+        print(f"{'command':<18} {'min':>8} {'median':>8} {'p95':>8} {'overhead':>9}  (ms)")
+        floor = None
+        failures = []
+        for name, command in COMMANDS.items():
+            timings = sorted(time_command(command, args.runs, env))
+            median = statistics.median(timings)
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            floor = median if floor is None else floor
+            overhead = median - floor
+            print(f"{name:<18} {timings[0]:>8.1f} {median:>8.1f} {p95:>8.1f} {overhead:>9.1f}")
+            if args.max_median_ms is not None and name != "python (floor)" and overhead > args.max_median_ms:
+                failures.append(f"{name}: {overhead:.1f}ms over the interpreter floor")
+        print("-" * 60)
+
+        loaded = heavy_imports(env)
+    if loaded:
+        failures.append(f"`status` imported heavy modules: {', '.join(loaded)}")
+    else:
+        print("✅ `status` runs without importing " + ", ".join(HEAVY_MODULES))
+
+    if failures:
+        print("\n❌ FAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
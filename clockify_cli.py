@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify command line
+One entry point for the timer, diagnostics, export, report and webhook tools
+
+Subcommand modules (and requests) are imported only when a command runs,
+so cache-only commands like `status` start in a few milliseconds
+
+Usage:
+    python3 clockify_cli.py start --description "Backend - Implementing ..."
+    python3 clockify_cli.py status
+    python3 clockify_cli.py stop
+    python3 clockify_cli.py test
+    python3 clockify_cli.py export entries.jsonl.gz --codec gzip
+"""
+
+import argparse
+import importlib
+import sys
+from datetime import datetime
+
+DEFAULT_PROJECT = "THE REAL CRYB"
+
+# Commands implemented by their own module's main(argv)
+DELEGATED = {
+    "probe": ("clockify_probe", "Concurrent connectivity and latency probe"),
+    "export": ("clockify_export", "Stream time entries to CSV, JSONL or Parquet"),
+    "report": ("clockify_report", "Hours by project/user via the reports API"),
+    "webhook": ("clockify_webhook", "Webhook receiver, fixtures and replay"),
+    "mock": ("clockify_mock_server", "Run the local Clockify mock server"),
+}
+
+
+def cmd_start(args) -> int:
+    """Start a running time entry and remember it for `stop`"""
+    from clockify_client import ClockifyCache, ClockifyClient
+
+    cache = ClockifyCache()
+    if cache.timer and not args.force:
+        print(f"⏱️  Timer {cache.timer['id']} is already running (use --force to start another)")
+        return 1
+
+    with ClockifyClient() as client:
+        project_id = cache.project_id(client, args.project)
+        if project_id:
+            print(f"✅ Found project: {args.project} (ID: {project_id})")
+        else:
+            print(f"⚠️  Project not found: {args.project} - starting without a project")
+
+        start_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        response = client.request(
+            "POST", f"/workspaces/{client.workspace_id}/time-entries",
+            json={
+                "start": start_time,
+                "billable": True,
+                "description": args.description,
+                "projectId": project_id,
+                "tagIds": []
+            }
+        )
+
+    if response.status_code != 201:
+        print(f"❌ Failed to start timer: {response.status_code}")
+        print(response.text)
+        return 1
+
+    entry = response.json()
+    cache.timer = {"id": entry["id"], "description": args.description, "start": start_time}
+    print("✅ TIMER STARTED")
+    print(f"   Entry ID: {entry['id']}")
+    print(f"   Description: {args.description}")
+    print(f"   Start time: {start_time}")
+    return 0
+
+
+def cmd_stop(args) -> int:
+    """Stop the timer started by `start`"""
+    from clockify_client import ClockifyCache
+
+    cache = ClockifyCache()
+    timer = cache.timer
+    if not timer:
+        print("No running timer found")
+        return 0
+
+    from clockify_client import ClockifyClient
+
+    end_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    with ClockifyClient() as client:
+        response = client.request(
+            "PATCH", f"/workspaces/{client.workspace_id}/time-entries/{timer['id']}",
+            json={"end": end_time}
+        )
+
+    if response.status_code != 200:
+        print(f"❌ Failed to stop timer: {response.text}")
+        return 1
+    cache.timer = None
+    print("✅ Timer stopped successfully!")
+    return 0
+
+
+def cmd_status(args) -> int:
+    """Show the running timer from the cache, without touching the network"""
+    from clockify_client import ClockifyCache
+
+    timer = ClockifyCache().timer
+    if not timer:
+        print("No running timer")
+        return 0
+    print(f"⏱️  RUNNING {timer['id']}")
+    if timer.get("description"):
+        print(f"   {timer['description']}")
+    if timer.get("start"):
+        started = datetime.strptime(timer["start"], "%Y-%m-%dT%H:%M:%SZ")
+        minutes = (datetime.utcnow() - started).total_seconds() / 60
+        print(f"   Since {timer['start']} ({minutes:.0f} min)")
+    return 0
+
+
+def cmd_test(args) -> int:
+    """Connectivity check: one concurrent probe of each endpoint"""
+    from clockify_probe import main as probe
+
+    return probe(["--samples", "1", "--concurrency", "3"])
+
+
+def cmd_automate(args) -> int:
+    """Run the simulated team time tracking loop"""
+    import asyncio
+    from clockify_automation import main as automate
+
+    asyncio.run(automate())
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="clockify_cli.py",
+                                     description="CRYB Clockify tools")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    start = commands.add_parser("start", help="Start a Clockify timer")
+    start.add_argument("--description", required=True)
+    start.add_argument("--project", default=DEFAULT_PROJECT)
+    start.add_argument("--force", action="store_true",
+                       help="Start even if a timer is already running")
+    start.set_defaults(handler=cmd_start)
+
+    commands.add_parser("stop", help="Stop the running timer").set_defaults(handler=cmd_stop)
+    commands.add_parser("status", help="Show the running timer (offline)").set_defaults(handler=cmd_status)
+    commands.add_parser("test", help="Check the API key and connectivity").set_defaults(handler=cmd_test)
+    commands.add_parser("automate", help="Run the team tracking automation").set_defaults(handler=cmd_automate)
+
+    for name, (_, help_text) in DELEGATED.items():
+        commands.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in DELEGATED:
+        # Hand the remaining arguments straight to the module's own parser
+        module = importlib.import_module(DELEGATED[argv[0]][0])
+        return module.main(argv[1:]) or 0
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Shared Clockify API client
+Connection settings, a keep-alive session, paged time entry iteration and a
+small on-disk cache for lookups that rarely change
+
+requests is imported on first use so commands that only read the cache
+start without paying for it
+"""
+
+import json
+import os
+import re
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+API_KEY = os.environ.get("CLOCKIFY_API_KEY", "ODc5M2U0ODktMmM0Yy00ZTI5LWI2MDktNDg3MzUxZmQ1Zjll")
+BASE_URL = os.environ.get("CLOCKIFY_BASE_URL", "https://api.clockify.me/api/v1")
+REPORTS_URL = os.environ.get("CLOCKIFY_REPORTS_URL", "https://reports.api.clockify.me/v1")
+WORKSPACE_ID = os.environ.get("CLOCKIFY_WORKSPACE_ID", "6895a6365597d57d09672a8d")
+CACHE_PATH = os.environ.get(
+    "CLOCKIFY_CACHE",
+    os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "cryb", "clockify.json")
+)
+
+# Timer file written by the original start_timer.py, still honoured by stop
+LEGACY_TIMER_FILE = "/home/ubuntu/cryb-platform/current_timer.txt"
+
+# Clockify caps page-size on the time entry listing at 5000
+MAX_PAGE_SIZE = 5000
+
+
+def parse_duration(duration_str: Optional[str]) -> float:
+    """Parse ISO 8601 duration (e.g. PT2H30M) to hours"""
+    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str or "")
+    if match:
+        hours = int(match.group(1) or 0)
+        minutes = int(match.group(2) or 0)
+        seconds = int(match.group(3) or 0)
+        return hours + minutes/60 + seconds/3600
+    return 0
+
+
+class ClockifyClient:
+    """
+    Thin wrapper around the Clockify REST API
+    Reuses one HTTP session so paged requests share a connection
+    """
+
+    def __init__(self, api_key: str = API_KEY, base_url: str = BASE_URL,
+                 workspace_id: Optional[str] = WORKSPACE_ID, timeout: float = 30.0,
+                 reports_url: str = REPORTS_URL):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.reports_url = reports_url.rstrip("/")
+        self.workspace_id = workspace_id
+        self.timeout = timeout
+        self.headers = {
+            "X-Api-Key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        self._session = None
+        # Response body bytes, so callers can compare what each mode transfers
+        self.bytes_received = 0
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+        return self._session
+
+    def request(self, method: str, path: str, base_url: Optional[str] = None,
+                **kwargs) -> "requests.Response":
+        """Send a request relative to the API base URL"""
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, f"{base_url or self.base_url}{path}", **kwargs)
+        self.bytes_received += len(response.content)
+        return response
+
+    def get_json(self, path: str, **kwargs):
+        """GET a resource and decode it, raising on HTTP errors"""
+        response = self.request("GET", path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def get_user(self) -> Dict:
+        """Return the user owning the API key"""
+        return self.get_json("/user")
+
+    def get_projects(self) -> List[Dict]:
+        """Return the projects in the workspace"""
+        return self.get_json(f"/workspaces/{self.workspace_id}/projects")
+
+    def get_time_entries_page(self, user_id: str, page: int, page_size: int = 1000,
+                              start: Optional[str] = None, end: Optional[str] = None) -> List[Dict]:
+        """Fetch a single page (1-based) of a user's time entries"""
+        params = {"page": page, "page-size": min(page_size, MAX_PAGE_SIZE)}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        return self.get_json(
+            f"/workspaces/{self.workspace_id}/user/{user_id}/time-entries",
+            params=params
+        )
+
+    def iter_time_entry_pages(self, user_id: str, page_size: int = 1000, first_page: int = 1,
+                              start: Optional[str] = None,
+                              end: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        Yield time entries one page at a time until a short page is returned
+        Only the current page is ever held in memory
+        """
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        page = first_page
+        while True:
+            entries = self.get_time_entries_page(user_id, page, page_size, start, end)
+            if entries:
+                yield entries
+            if len(entries) < page_size:
+                return
+            page += 1
+
+    def get_summary_report(self, start: str, end: str, groups: List[str],
+                           user_ids: Optional[List[str]] = None) -> Dict:
+        """
+        Ask the reports API to aggregate durations on the server
+        groups are Clockify group names such as PROJECT, USER or TASK
+        """
+        body = {
+            "dateRangeStart": start,
+            "dateRangeEnd": end,
+            "summaryFilter": {"groups": groups},
+            "exportType": "JSON",
+        }
+        if user_ids:
+            body["users"] = {"ids": user_ids, "contains": "CONTAINS", "status": "ALL"}
+        response = self.request(
+            "POST", f"/workspaces/{self.workspace_id}/reports/summary",
+            base_url=self.reports_url, json=body
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        """Release pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ClockifyCache:
+    """
+    JSON file cache shared by the Clockify commands
+    Holds the running timer and TTL-bound lookups such as project ids
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttl: float = 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self.data: Dict = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.data = json.load(f)
+            except ValueError:
+                self.data = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, key: str, fetch, refresh: bool = False):
+        """Return a cached value, calling fetch() when it is missing or stale"""
+        cached = self.data.get("lookups", {}).get(key)
+        if cached and not refresh and time.time() - cached["fetchedAt"] < self.ttl:
+            return cached["value"]
+        value = fetch()
+        self.data.setdefault("lookups", {})[key] = {"value": value, "fetchedAt": time.time()}
+        self.save()
+        return value
+
+    def project_id(self, client: ClockifyClient, name: str) -> Optional[str]:
+        """Resolve a project name, fetching the project list at most once per TTL"""
+        key = f"projects:{client.workspace_id}"
+        projects = self.lookup(key, lambda: {p["name"]: p["id"] for p in client.get_projects()})
+        if name not in projects:
+            projects = self.lookup(key, lambda: {p["name"]: p["id"] for p in client.get_projects()},
+                                   refresh=True)
+        return projects.get(name)
+
+    @property
+    def timer(self) -> Optional[Dict]:
+        """The running timer started by this machine, if any"""
+        timer = self.data.get("timer")
+        if timer is None and os.path.exists(LEGACY_TIMER_FILE):
+            with open(LEGACY_TIMER_FILE, "r") as f:
+                entry_id = f.read().strip()
+            if entry_id:
+                timer = {"id": entry_id}
+        return timer
+
+    @timer.setter
+    def timer(self, timer: Optional[Dict]):
+        if timer is None:
+            self.data.pop("timer", None)
+            if os.path.exists(LEGACY_TIMER_FILE):
+                os.remove(LEGACY_TIMER_FILE)
+        else:
+            self.data["timer"] = timer
+        self.save()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify time entry export
+Streams time entries page by page into CSV, JSONL or Parquet for the warehouse
+
+Usage:
+    python3 clockify_export.py entries.csv.gz --format csv --codec gzip
+    python3 clockify_export.py entries.jsonl --resume
+    python3 clockify_export.py entries_parquet/ --format parquet --codec zstd
+"""
+
+import argparse
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from clockify_client import ClockifyClient, parse_duration
+
+# Flat column layout shared by every output format
+FIELDS = [
+    "id", "description", "userId", "projectId", "taskId", "billable",
+    "tagIds", "start", "end", "duration", "hours"
+]
+
+# Each page is compressed as an independent member; gzip, bz2 and xz readers
+# all treat concatenated members as one stream, which keeps resume exact
+TEXT_CODECS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+PARQUET_CODECS = ["snappy", "gzip", "zstd", "brotli", "lz4"]
+
+CHECKPOINT_VERSION = 1
+
+
+def flatten_entry(entry: Dict) -> Dict:
+    """Flatten a Clockify time entry into the export row layout"""
+    interval = entry.get("timeInterval") or {}
+    duration = interval.get("duration")
+    return {
+        "id": entry.get("id"),
+        "description": entry.get("description") or "",
+        "userId": entry.get("userId"),
+        "projectId": entry.get("projectId"),
+        "taskId": entry.get("taskId"),
+        "billable": bool(entry.get("billable")),
+        "tagIds": ",".join(entry.get("tagIds") or []),
+        "start": interval.get("start"),
+        "end": interval.get("end"),
+        "duration": duration,
+        "hours": round(parse_duration(duration), 6),
+    }
+
+
+class TextSink:
+    """
+    Appends CSV or JSONL pages to a single file
+    The byte offset after each page is the resume point
+    """
+
+    def __init__(self, path: str, fmt: str, codec: Optional[str], offset: int = 0):
+        self.path = path
+        self.fmt = fmt
+        self.compress = TEXT_CODECS[codec] if codec else None
+        if offset and not os.path.exists(path):
+            raise SystemExit(f"❌ Cannot resume: {path} is missing")
+        self.file = open(path, "r+b" if offset else "wb")
+        if offset:
+            # Drop anything written after the last checkpoint
+            self.file.truncate(offset)
+            self.file.seek(offset)
+        self.header_written = offset > 0
+
+    def encode(self, rows: List[Dict]) -> bytes:
+        buffer = io.StringIO()
+        if self.fmt == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n")
+            if not self.header_written:
+                writer.writeheader()
+                self.header_written = True
+            writer.writerows(rows)
+        else:
+            for row in rows:
+                buffer.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                buffer.write("\n")
+        data = buffer.getvalue().encode("utf-8")
+        return self.compress(data) if self.compress else data
+
+    def write_page(self, rows: List[Dict]) -> bool:
+        """Write one page; returns True when the page is durable"""
+        self.file.write(self.encode(rows))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return True
+
+    def position(self) -> Dict:
+        return {"offset": self.file.tell()}
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    """
+    Writes Parquet part files into a directory, one row group per page
+    A part only counts once its footer is written, so parts are the resume unit
+    """
+
+    def __init__(self, path: str, codec: Optional[str], part: int = 0,
+                 rows_per_file: int = 1_000_000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ pyarrow not found\n💡 Install with: pip install pyarrow")
+
+        self.pa = pa
+        self.pq = pq
+        self.directory = path
+        self.codec = codec or "none"
+        self.rows_per_file = rows_per_file
+        self.schema = pa.schema([
+            ("id", pa.string()),
+            ("description", pa.string()),
+            ("userId", pa.string()),
+            ("projectId", pa.string()),
+            ("taskId", pa.string()),
+            ("billable", pa.bool_()),
+            ("tagIds", pa.string()),
+            ("start", pa.string()),
+            ("end", pa.string()),
+            ("duration", pa.string()),
+            ("hours", pa.float64()),
+        ])
+        os.makedirs(path, exist_ok=True)
+        self.part = part
+        self.writer = None
+        self.part_rows = 0
+        # Remove parts left unfinished by an interrupted run
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(".parquet"):
+                if int(name[5:10]) >= part:
+                    os.remove(os.path.join(path, name))
+
+    def part_path(self) -> str:
+        return os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+
+    def write_page(self, rows: List[Dict]) -> bool:
+        """Write one page as a row group; returns True when a part was closed"""
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.part_path(), self.schema,
+                                                compression=self.codec)
+        table = self.pa.Table.from_pylist(rows, schema=self.schema)
+        self.writer.write_table(table)
+        self.part_rows += len(rows)
+        if self.part_rows >= self.rows_per_file:
+            self.close()
+            return True
+        return False
+
+    def position(self) -> Dict:
+        return {"part": self.part}
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.part += 1
+            self.part_rows = 0
+
+
+def load_checkpoint(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, state: Dict):
+    """Write the checkpoint atomically so a crash never leaves it half-written"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def prefetch_pages(client: ClockifyClient, user_id: str, first_page: int, page_size: int,
+                   start: Optional[str], end: Optional[str],
+                   depth: int) -> Iterator[Tuple[int, List[Dict]]]:
+    """
+    Fetch pages on a background thread while the caller writes
+    At most `depth` pages wait in the queue, which bounds memory
+    """
+    pages: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def fetch():
+        try:
+            for offset, entries in enumerate(
+                    client.iter_time_entry_pages(user_id, page_size, first_page, start, end)):
+                if stop.is_set():
+                    return
+                pages.put((first_page + offset, entries))
+            pages.put(None)
+        except Exception as e:
+            pages.put(e)
+
+    worker = threading.Thread(target=fetch, name="clockify-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock the fetcher if it is waiting on a full queue
+        while worker.is_alive():
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                worker.join(0.05)
+
+
+def export(client: ClockifyClient, output: str, fmt: str, codec: Optional[str] = None,
+           page_size: int = 1000, start: Optional[str] = None, end: Optional[str] = None,
+           resume: bool = False, checkpoint_path: Optional[str] = None,
+           prefetch: int = 2, rows_per_file: int = 1_000_000) -> int:
+    """Export every time entry of the API key's user; returns rows written"""
+    checkpoint_path = checkpoint_path or f"{output.rstrip('/')}.checkpoint.json"
+    user_id = client.get_user()["id"]
+
+    state = load_checkpoint(checkpoint_path) if resume else None
+    if state:
+        query = state["query"]
+        if (query["format"], query["codec"], query["userId"]) != (fmt, codec, user_id):
+            raise SystemExit(f"❌ Checkpoint {checkpoint_path} belongs to a different export")
+        start, end = query["start"], query["end"]
+        print(f"↩️  Resuming at page {state['page']} ({state['rows']} rows already exported)")
+    else:
+        # Pin the end of the range so pages stay stable across resumes
+        end = end or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "query": {"format": fmt, "codec": codec, "userId": user_id,
+                      "start": start, "end": end},
+            "page": 1,
+            "rows": 0,
+            "position": {},
+        }
+
+    if fmt == "parquet":
+        sink = ParquetSink(output, codec, state["position"].get("part", 0), rows_per_file)
+    else:
+        sink = TextSink(output, fmt, codec, state["position"].get("offset", 0))
+
+    rows = resumed_rows = state["rows"]
+    pending_rows = 0
+    started = time.perf_counter()
+    try:
+        for page, entries in prefetch_pages(client, user_id, state["page"], page_size,
+                                            start, end, prefetch):
+            batch = [flatten_entry(entry) for entry in entries]
+            pending_rows += len(batch)
+            if sink.write_page(batch):
+                rows += pending_rows
+                pending_rows = 0
+                state.update(page=page + 1, rows=rows, position=sink.position())
+                save_checkpoint(checkpoint_path, state)
+                elapsed = time.perf_counter() - started
+                print(f"📦 {rows} rows through page {page} ({(rows - resumed_rows) / max(elapsed, 1e-9):.0f} rows/s)")
+        sink.close()
+    except BaseException:
+        # Leave the last checkpoint in place for --resume
+        if fmt != "parquet":
+            sink.close()
+        raise
+
+    rows += pending_rows
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream Clockify time entries to a file")
+    parser.add_argument("output", help="Output file (csv/jsonl) or directory (parquet)")
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"],
+                        help="Output format (default: inferred from the output name)")
+    parser.add_argument("--codec", help="gzip, bz2 or xz for csv/jsonl; "
+                                        f"{', '.join(PARQUET_CODECS)} for parquet")
+    parser.add_argument("--start", help="Only entries starting after this ISO timestamp")
+    parser.add_argument("--end", help="Only entries starting before this ISO timestamp")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--prefetch", type=int, default=2,
+                        help="Pages fetched ahead of the writer")
+    parser.add_argument("--rows-per-file", type=int, default=1_000_000,
+                        help="Rows per Parquet part file")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from the checkpoint of an interrupted export")
+    parser.add_argument("--checkpoint", help="Checkpoint path (default: <output>.checkpoint.json)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if not fmt:
+        name = args.output.rstrip("/").lower()
+        fmt = next((f for f in ("csv", "jsonl", "parquet") if f".{f}" in name), "jsonl")
+    if fmt == "parquet" and args.codec and args.codec not in PARQUET_CODECS:
+        parser.error(f"unsupported parquet codec: {args.codec}")
+    if fmt != "parquet" and args.codec and args.codec not in TEXT_CODECS:
+        parser.error(f"unsupported {fmt} codec: {args.codec}")
+
+    print(f"🚀 Exporting Clockify time entries to {args.output} ({fmt}, {args.codec or 'uncompressed'})")
+    started = time.perf_counter()
+    with ClockifyClient() as client:
+        rows = export(client, args.output, fmt, args.codec, args.page_size, args.start,
+                      args.end, args.resume, args.checkpoint, args.prefetch, args.rows_per_file)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Exported {rows} time entries in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Local Clockify mock server
+Serves a deterministic workspace so the Clockify tools can run offline
+
+Usage:
+    python3 clockify_mock_server.py --port 8765 --entries 100000
+    export CLOCKIFY_BASE_URL=http://127.0.0.1:8765/api/v1
+    export CLOCKIFY_REPORTS_URL=http://127.0.0.1:8765/reports/v1
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from clockify_client import WORKSPACE_ID
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+PROJECTS = [
+    "THE REAL CRYB",
+    "CRYB Backend Development",
+    "CRYB Frontend Development",
+    "CRYB Platform Infrastructure",
+    "CRYB Quality & Features",
+]
+
+USERS = ["mock-user", "mock-user-2", "mock-user-3"]
+
+TASKS = [
+    "Implementing Fastify API endpoints for communities",
+    "Optimizing PostgreSQL for 100k concurrent users",
+    "Building Next.js 14 app with server components",
+    "Developing React Native mobile app",
+    "Setting up Prometheus and Grafana",
+    "Writing comprehensive test suites",
+]
+
+
+def format_duration(seconds: int) -> str:
+    """Format seconds as an ISO 8601 duration the way Clockify does"""
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    text = "PT"
+    if hours:
+        text += f"{hours}H"
+    if minutes:
+        text += f"{minutes}M"
+    if secs or text == "PT":
+        text += f"{secs}S"
+    return text
+
+
+def parse_time(value: str) -> datetime:
+    return datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+
+
+class MockWorkspace:
+    """
+    Deterministic workspace data
+    Generated entries are computed from their index instead of being stored,
+    so a mock with millions of entries still starts instantly
+    """
+
+    def __init__(self, entries: int = 10000, seed: int = 42, workspace_id: str = WORKSPACE_ID,
+                 anchor: Optional[datetime] = None, spacing_minutes: int = 20):
+        self.entry_count = entries
+        self.seed = seed
+        self.workspace_id = workspace_id
+        self.anchor = anchor or datetime(2025, 9, 20, tzinfo=timezone.utc)
+        self.spacing = timedelta(minutes=spacing_minutes)
+        self.projects = [
+            {"id": f"mock-project-{i}", "name": name, "workspaceId": workspace_id}
+            for i, name in enumerate(PROJECTS)
+        ]
+        # Entries created or edited through the API, newest first
+        self.created: List[Dict] = []
+        self.lock = threading.Lock()
+
+    def generated_entry(self, index: int) -> Dict:
+        """Entry `index` of the generated set; higher indexes start earlier"""
+        rng = random.Random(self.seed * 1_000_003 + index)
+        start = self.anchor - self.spacing * index
+        seconds = rng.randint(15, 120) * 60 + rng.randint(0, 59)
+        project = self.projects[rng.randrange(len(self.projects))]
+        return {
+            "id": f"mock-entry-{index}",
+            "description": rng.choice(TASKS),
+            "userId": USERS[index % len(USERS)],
+            "projectId": project["id"],
+            "taskId": None,
+            "billable": True,
+            "tagIds": [],
+            "workspaceId": self.workspace_id,
+            "timeInterval": {
+                "start": start.strftime(TIME_FORMAT),
+                "end": (start + timedelta(seconds=seconds)).strftime(TIME_FORMAT),
+                "duration": format_duration(seconds),
+            },
+        }
+
+    def user_index_range(self, user_id: str, start: Optional[str],
+                         end: Optional[str]) -> Tuple[int, int, int]:
+        """Return (offset, first, last) so the user's entries are offset + len(USERS) * j"""
+        if user_id not in USERS:
+            return 0, 0, 0
+        offset, step = USERS.index(user_id), len(USERS)
+        total = max(0, (self.entry_count - offset + step - 1) // step)
+        first, last = 0, total
+        spacing = self.spacing.total_seconds() * step
+        base = self.anchor - self.spacing * offset
+        if end:
+            # Entries starting after `end` sit at the front of the listing
+            ahead = (base - parse_time(end)).total_seconds()
+            if ahead > 0:
+                first = min(total, int(-(-ahead // spacing)))
+        if start:
+            span = (base - parse_time(start)).total_seconds()
+            last = max(first, min(total, int(span // spacing) + 1)) if span >= 0 else first
+        return offset, first, last
+
+    def list_entries(self, user_id: str, page: int, page_size: int,
+                     start: Optional[str] = None, end: Optional[str] = None) -> List[Dict]:
+        with self.lock:
+            created = [e for e in self.created if e["userId"] == user_id
+                       and self.in_range(e, start, end)]
+        skip = (page - 1) * page_size
+        result = created[skip:skip + page_size]
+        skip = max(0, skip - len(created))
+        offset, first, last = self.user_index_range(user_id, start, end)
+        step = len(USERS)
+        j = first + skip
+        while len(result) < page_size and j < last:
+            result.append(self.generated_entry(offset + step * j))
+            j += 1
+        return result
+
+    @staticmethod
+    def in_range(entry: Dict, start: Optional[str], end: Optional[str]) -> bool:
+        entry_start = entry["timeInterval"]["start"]
+        if start and entry_start < start:
+            return False
+        if end and entry_start > end:
+            return False
+        return True
+
+    def iter_range(self, start: Optional[str], end: Optional[str], user_ids: Optional[List[str]]):
+        """Yield every completed entry in range, across users"""
+        for user_id in user_ids or USERS:
+            with self.lock:
+                created = [e for e in self.created if e["userId"] == user_id]
+            for entry in created:
+                if entry["timeInterval"].get("end") and self.in_range(entry, start, end):
+                    yield entry
+            offset, first, last = self.user_index_range(user_id, start, end)
+            for j in range(first, last):
+                yield self.generated_entry(offset + len(USERS) * j)
+
+    def summary_report(self, body: Dict) -> Dict:
+        """Aggregate like the reports API: totals plus nested groupOne/children"""
+        groups = body.get("summaryFilter", {}).get("groups") or ["PROJECT"]
+        user_ids = (body.get("users") or {}).get("ids")
+        fields = {"PROJECT": "projectId", "USER": "userId", "TASK": "taskId"}
+        names = {p["id"]: p["name"] for p in self.projects}
+        tree: Dict = {}
+        total = count = 0
+        for entry in self.iter_range(body.get("dateRangeStart"), body.get("dateRangeEnd"), user_ids):
+            interval = entry["timeInterval"]
+            seconds = int((parse_time(interval["end"]) - parse_time(interval["start"])).total_seconds())
+            total += seconds
+            count += 1
+            level = tree
+            for group in groups:
+                key = entry.get(fields.get(group, "")) or ""
+                node = level.setdefault(key, {"duration": 0, "children": {}})
+                node["duration"] += seconds
+                level = node["children"]
+
+        def render(level: Dict, depth: int) -> List[Dict]:
+            rows = []
+            for key, node in sorted(level.items()):
+                row = {"_id": key, "duration": node["duration"], "name": names.get(key, key)}
+                if depth + 1 < len(groups):
+                    row["children"] = render(node["children"], depth + 1)
+                rows.append(row)
+            return rows
+
+        return {
+            "totals": [{"_id": "", "totalTime": total, "entriesCount": count}],
+            "groupOne": render(tree, 0),
+        }
+
+    def create_entry(self, user_id: str, data: Dict) -> Dict:
+        entry = {
+            "id": uuid.uuid4().hex[:24],
+            "description": data.get("description", ""),
+            "userId": user_id,
+            "projectId": data.get("projectId"),
+            "taskId": data.get("taskId"),
+            "billable": data.get("billable", False),
+            "tagIds": data.get("tagIds") or [],
+            "workspaceId": self.workspace_id,
+            "timeInterval": {"start": data.get("start"), "end": None, "duration": None},
+        }
+        self.set_end(entry, data.get("end"))
+        with self.lock:
+            self.created.insert(0, entry)
+        return entry
+
+    def update_entry(self, entry_id: str, data: Dict) -> Optional[Dict]:
+        with self.lock:
+            entry = next((e for e in self.created if e["id"] == entry_id), None)
+        if entry is not None and "end" in data:
+            self.set_end(entry, data["end"])
+        return entry
+
+    @staticmethod
+    def set_end(entry: Dict, end: Optional[str]):
+        interval = entry["timeInterval"]
+        interval["end"] = end
+        if end and interval["start"]:
+            seconds = int((parse_time(end) - parse_time(interval["start"])).total_seconds())
+            interval["duration"] = format_duration(max(0, seconds))
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes the subset of the Clockify API the CRYB tools use"""
+
+    protocol_version = "HTTP/1.1"
+    workspace: MockWorkspace = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def route(self, method: str):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        path = url.path.rstrip("/")
+        ws = self.workspace
+        wid = re.escape(ws.workspace_id)
+
+        if not self.headers.get("X-Api-Key"):
+            return self.send_json(401, {"message": "Api key missing", "code": 4003})
+
+        if method == "GET" and path == "/api/v1/user":
+            return self.send_json(200, {"id": USERS[0], "name": "CRYB Mock User",
+                                        "email": "mock@cryb.local",
+                                        "defaultWorkspace": ws.workspace_id})
+        if method == "GET" and re.fullmatch(rf"/api/v1/workspaces/{wid}", path):
+            return self.send_json(200, {"id": ws.workspace_id, "name": "CRYB Mock Workspace"})
+        if method == "GET" and re.fullmatch(rf"/api/v1/workspaces/{wid}/projects", path):
+            return self.send_json(200, ws.projects)
+
+        match = re.fullmatch(rf"/api/v1/workspaces/{wid}/user/([^/]+)/time-entries", path)
+        if method == "GET" and match:
+            page = int(query.get("page", 1))
+            page_size = int(query.get("page-size", 50))
+            return self.send_json(200, ws.list_entries(match.group(1), page, page_size,
+                                                       query.get("start"), query.get("end")))
+        if method == "POST" and (match or re.fullmatch(rf"/api/v1/workspaces/{wid}/time-entries", path)):
+            user_id = match.group(1) if match else USERS[0]
+            return self.send_json(201, ws.create_entry(user_id, self.read_json()))
+
+        match = re.fullmatch(rf"/api/v1/workspaces/{wid}/(?:user/[^/]+/)?time-entries/([^/]+)", path)
+        if method in ("PATCH", "PUT") and match:
+            entry = ws.update_entry(match.group(1), self.read_json())
+            if entry is None:
+                return self.send_json(404, {"message": "Time entry not found", "code": 501})
+            return self.send_json(200, entry)
+
+        if method == "POST" and re.fullmatch(rf"/reports/v1/workspaces/{wid}/reports/summary", path):
+            return self.send_json(200, ws.summary_report(self.read_json()))
+
+        self.send_json(404, {"message": f"No mock route for {method} {path}", "code": 404})
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_PATCH(self):
+        self.route("PATCH")
+
+    def do_PUT(self):
+        self.route("PUT")
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, workspace: Optional[MockWorkspace] = None):
+    """Create the mock server; call serve_forever() or run it on a thread"""
+    handler = type("BoundMockHandler", (MockHandler,), {"workspace": workspace or MockWorkspace()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local Clockify mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--entries", type=int, default=10000, help="Generated time entries")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    server = serve(args.host, args.port, MockWorkspace(args.entries, args.seed))
+    print(f"🧪 Clockify mock serving {args.entries} entries on http://{args.host}:{args.port}")
+    print(f"   export CLOCKIFY_BASE_URL=http://{args.host}:{args.port}/api/v1")
+    print(f"   export CLOCKIFY_REPORTS_URL=http://{args.host}:{args.port}/reports/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Mock server stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
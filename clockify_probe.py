@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify connectivity and latency probe
+Runs the /user, workspace and project checks concurrently and times the DNS,
+connect, TLS and time-to-first-byte phases of every request
+
+Usage:
+    python3 clockify_probe.py
+    python3 clockify_probe.py --samples 50 --concurrency 8 --target-rps 20
+"""
+
+import argparse
+import json
+import math
+import socket
+import ssl
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from clockify_client import API_KEY, BASE_URL, WORKSPACE_ID
+
+PHASES = ["dns", "connect", "tls", "ttfb", "total"]
+
+
+def probe_once(url: str, api_key: str, timeout: float = 10.0) -> Dict:
+    """
+    Fetch one URL over a fresh connection, timing each phase in milliseconds
+    Uses raw sockets because requests/urllib3 do not expose per-phase timings
+    """
+    target = urlparse(url)
+    secure = target.scheme == "https"
+    port = target.port or (443 if secure else 80)
+    path = target.path + (f"?{target.query}" if target.query else "")
+    result: Dict = {"url": url, "ok": False}
+    sock = None
+    started = time.perf_counter()
+    try:
+        address = socket.getaddrinfo(target.hostname, port, type=socket.SOCK_STREAM)[0]
+        dns_done = time.perf_counter()
+
+        sock = socket.socket(address[0], address[1], address[2])
+        sock.settimeout(timeout)
+        sock.connect(address[4])
+        connect_done = time.perf_counter()
+
+        if secure:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=target.hostname)
+        tls_done = time.perf_counter()
+
+        sock.sendall(
+            (f"GET {path} HTTP/1.1\r\n"
+             f"Host: {target.netloc}\r\n"
+             f"X-Api-Key: {api_key}\r\n"
+             f"Accept: application/json\r\n"
+             f"Connection: close\r\n\r\n").encode("latin-1"))
+        chunks = [sock.recv(65536)]
+        first_byte = time.perf_counter()
+        while chunks[-1]:
+            chunks.append(sock.recv(65536))
+        finished = time.perf_counter()
+
+        raw = b"".join(chunks)
+        head, _, body = raw.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        if b"transfer-encoding: chunked" in head.lower():
+            body = dechunk(body)
+        result.update(
+            ok=200 <= status < 300,
+            status=status,
+            body=body,
+            dns=(dns_done - started) * 1000,
+            connect=(connect_done - dns_done) * 1000,
+            tls=(tls_done - connect_done) * 1000,
+            ttfb=(first_byte - tls_done) * 1000,
+            total=(finished - started) * 1000,
+        )
+    except (OSError, ValueError, IndexError) as e:
+        result["error"] = str(e) or e.__class__.__name__
+    finally:
+        if sock is not None:
+            sock.close()
+    return result
+
+
+def dechunk(body: bytes) -> bytes:
+    """Decode an HTTP/1.1 chunked body"""
+    out = []
+    while body:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line.split(b";")[0] or b"0", 16)
+        if size == 0:
+            break
+        out.append(body[:size])
+        body = body[size + 2:]
+    return b"".join(out)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_probes(endpoints: Dict[str, str], api_key: str, samples: int,
+               concurrency: int, timeout: float) -> Dict[str, List[Dict]]:
+    """Sample every endpoint `samples` times, all endpoints in flight together"""
+    jobs = [(name, url) for _ in range(samples) for name, url in endpoints.items()]
+    results: Dict[str, List[Dict]] = {name: [] for name in endpoints}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [(name, pool.submit(probe_once, url, api_key, timeout)) for name, url in jobs]
+        for name, future in futures:
+            results[name].append(future.result())
+    return results
+
+
+def summarize(samples: List[Dict]) -> Dict:
+    ok = [s for s in samples if s["ok"]]
+    summary = {"samples": len(samples), "errors": len(samples) - len(ok)}
+    for phase in PHASES:
+        values = [s[phase] for s in ok]
+        summary[phase] = {p: percentile(values, p) for p in (50, 90, 95, 99)}
+    return summary
+
+
+def print_identity(results: Dict[str, List[Dict]]):
+    """Show what the old serial test printed, using bodies already fetched"""
+    def body(name):
+        sample = next((s for s in results.get(name, []) if s["ok"]), None)
+        return json.loads(sample["body"]) if sample else None
+
+    user, workspace, projects = body("user"), body("workspace"), body("projects")
+    if user:
+        print(f"User: {user.get('name', 'Unknown')} <{user.get('email', 'Unknown')}>")
+    if workspace:
+        print(f"Workspace: {workspace.get('name', 'Unknown')} ({workspace.get('id')})")
+    if projects is not None:
+        print(f"Projects: {len(projects)}")
+        for project in projects[:5]:
+            print(f"  - {project.get('name')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Probe Clockify connectivity and latency")
+    parser.add_argument("--samples", type=int, default=5, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=6, help="Requests in flight")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--max-ttfb-p95", type=float, default=800.0,
+                        help="Fail when p95 time-to-first-byte exceeds this (ms)")
+    parser.add_argument("--max-total-p99", type=float, default=2000.0,
+                        help="Fail when p99 request time exceeds this (ms)")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Fail when the share of failed requests exceeds this")
+    parser.add_argument("--target-rps", type=float,
+                        help="Fail when --concurrency connections cannot sustain this rate")
+    args = parser.parse_args(argv)
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+
+    endpoints = {
+        "user": f"{BASE_URL}/user",
+        "workspace": f"{BASE_URL}/workspaces/{WORKSPACE_ID}",
+        "projects": f"{BASE_URL}/workspaces/{WORKSPACE_ID}/projects",
+    }
+
+    print(f"🔎 Probing {len(endpoints)} Clockify endpoints × {args.samples} samples "
+          f"({args.concurrency} concurrent)")
+    print("-" * 72)
+    started = time.perf_counter()
+    results = run_probes(endpoints, API_KEY, args.samples, args.concurrency, args.timeout)
+    wall = time.perf_counter() - started
+
+    print_identity(results)
+    print("-" * 72)
+    print(f"{'endpoint':<10} {'phase':<8} {'p50':>9} {'p90':>9} {'p95':>9} {'p99':>9}  (ms)")
+    failures = []
+    all_samples = []
+    for name, samples in results.items():
+        all_samples.extend(samples)
+        summary = summarize(samples)
+        for phase in PHASES:
+            row = summary[phase]
+            print(f"{name:<10} {phase:<8} " + " ".join(f"{row[p]:>9.1f}" for p in (50, 90, 95, 99)))
+        if summary["errors"]:
+            errors = {s.get("error") or f"HTTP {s.get('status')}" for s in samples if not s["ok"]}
+            print(f"{name:<10} ❌ {summary['errors']} failed: {', '.join(sorted(errors))}")
+        if summary["ttfb"][95] > args.max_ttfb_p95:
+            failures.append(f"{name} p95 TTFB {summary['ttfb'][95]:.0f}ms > {args.max_ttfb_p95:.0f}ms")
+        if summary["total"][99] > args.max_total_p99:
+            failures.append(f"{name} p99 total {summary['total'][99]:.0f}ms > {args.max_total_p99:.0f}ms")
+    print("-" * 72)
+
+    ok = [s for s in all_samples if s["ok"]]
+    error_rate = 1 - len(ok) / len(all_samples) if all_samples else 1.0
+    if error_rate > args.max_error_rate:
+        failures.append(f"error rate {error_rate:.1%} > {args.max_error_rate:.1%}")
+
+    # Little's law: each connection completes 1000 / mean-latency requests per second
+    mean_total = sum(s["total"] for s in ok) / len(ok) if ok else float("inf")
+    sustainable = args.concurrency * 1000 / mean_total if ok else 0.0
+    print(f"Observed {len(all_samples) / wall:.1f} req/s over {wall:.2f}s; "
+          f"estimated capacity {sustainable:.1f} req/s with {args.concurrency} connections")
+    if args.target_rps and sustainable < args.target_rps:
+        failures.append(f"estimated {sustainable:.1f} req/s < target {args.target_rps:.1f} req/s")
+
+    if failures:
+        print("\n❌ FAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n✅ PASS - Clockify API is reachable and within latency thresholds")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
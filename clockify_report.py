@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify summary reports
+Hours by project/user aggregated by the Clockify reports API (server mode)
+or from every downloaded time entry (client mode), plus a consistency check
+
+Usage:
+    python3 clockify_report.py --days 7 --group PROJECT,USER
+    python3 clockify_report.py --days 7 --mode client
+    python3 clockify_report.py --days 30 --check
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from clockify_client import ClockifyClient, parse_duration
+
+# Clockify summary group name -> time entry field used for client-side grouping
+GROUP_FIELDS = {
+    "PROJECT": "projectId",
+    "USER": "userId",
+    "TASK": "taskId",
+}
+
+Totals = Dict[Tuple[str, ...], float]
+
+
+def flatten_summary(report: Dict, depth: int) -> Totals:
+    """Flatten groupOne/children into {(group ids...): seconds} at the given depth"""
+    totals: Totals = {}
+
+    def walk(rows: List[Dict], prefix: Tuple[str, ...]):
+        for row in rows:
+            key = prefix + (row.get("_id") or "",)
+            if len(key) == depth:
+                totals[key] = totals.get(key, 0) + row.get("duration", 0)
+            else:
+                walk(row.get("children") or [], key)
+
+    walk(report.get("groupOne") or [], ())
+    return totals
+
+
+def server_totals(client: ClockifyClient, start: str, end: str, groups: List[str],
+                  user_ids: Optional[List[str]] = None) -> Totals:
+    """Let the reports API aggregate; only the totals cross the network"""
+    report = client.get_summary_report(start, end, groups, user_ids)
+    return flatten_summary(report, len(groups))
+
+
+def client_totals(client: ClockifyClient, user_id: str, start: str, end: str,
+                  groups: List[str], page_size: int = 1000) -> Totals:
+    """Download every completed entry in range and aggregate locally"""
+    fields = [GROUP_FIELDS[group] for group in groups]
+    totals: Totals = {}
+    for page in client.iter_time_entry_pages(user_id, page_size, start=start, end=end):
+        for entry in page:
+            interval = entry.get("timeInterval") or {}
+            if not interval.get("end"):
+                continue  # Running timers are not in the report yet
+            key = tuple(entry.get(field) or "" for field in fields)
+            totals[key] = totals.get(key, 0) + parse_duration(interval.get("duration")) * 3600
+    return totals
+
+
+def compare_totals(server: Totals, client: Totals, tolerance: float = 1.0) -> List[Tuple]:
+    """Return (key, server seconds, client seconds) for every group that disagrees"""
+    mismatches = []
+    for key in sorted(set(server) | set(client)):
+        server_seconds = server.get(key, 0)
+        client_seconds = client.get(key, 0)
+        if abs(server_seconds - client_seconds) > tolerance:
+            mismatches.append((key, server_seconds, client_seconds))
+    return mismatches
+
+
+def print_totals(totals: Totals, groups: List[str], names: Dict[str, str]):
+    print(" / ".join(group.title() for group in groups) + " : hours")
+    print("-" * 50)
+    for key, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+        label = " / ".join(names.get(part, part or "(none)") for part in key)
+        print(f"  {label}: {seconds / 3600:.2f}")
+    print("-" * 50)
+    print(f"Total Hours Tracked: {sum(totals.values()) / 3600:.1f} hours")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clockify hours by project/user")
+    parser.add_argument("--mode", choices=["server", "client"], default="server",
+                        help="Aggregate with the reports API or from downloaded entries")
+    parser.add_argument("--check", action="store_true",
+                        help="Run both modes and compare them (exit 1 on mismatch)")
+    parser.add_argument("--group", default="PROJECT",
+                        help=f"Comma separated groups: {', '.join(GROUP_FIELDS)}")
+    parser.add_argument("--days", type=int, default=7, help="Report window ending now")
+    parser.add_argument("--start", help="Range start (ISO timestamp), overrides --days")
+    parser.add_argument("--end", help="Range end (ISO timestamp)")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="Allowed difference in seconds per group for --check")
+    args = parser.parse_args(argv)
+
+    groups = [group.strip().upper() for group in args.group.split(",") if group.strip()]
+    unknown = [group for group in groups if group not in GROUP_FIELDS]
+    if unknown:
+        parser.error(f"unsupported group(s): {', '.join(unknown)}")
+
+    end = args.end or datetime.utcnow().strftime("%Y-%m-%dT23:59:59Z")
+    start = args.start or (datetime.utcnow() - timedelta(days=args.days)).strftime("%Y-%m-%dT00:00:00Z")
+
+    with ClockifyClient() as client:
+        names = {project["id"]: project["name"] for project in client.get_projects()}
+        user = client.get_user()
+        names[user["id"]] = user.get("name", user["id"])
+
+        print(f"\n📊 CLOCKIFY REPORT {start[:10]} → {end[:10]}")
+        print("=" * 50)
+
+        if args.check:
+            # The entry listing only covers the key's own user, so scope the report to match
+            before = client.bytes_received
+            started = time.perf_counter()
+            server = server_totals(client, start, end, groups, [user["id"]])
+            server_time, server_bytes = time.perf_counter() - started, client.bytes_received - before
+
+            before = client.bytes_received
+            started = time.perf_counter()
+            local = client_totals(client, user["id"], start, end, groups)
+            client_time, client_bytes = time.perf_counter() - started, client.bytes_received - before
+
+            print(f"Server mode: {len(server)} groups, {server_bytes / 1024:.1f} KB in {server_time:.2f}s")
+            print(f"Client mode: {len(local)} groups, {client_bytes / 1024:.1f} KB in {client_time:.2f}s")
+            mismatches = compare_totals(server, local, args.tolerance)
+            if mismatches:
+                print(f"\n❌ {len(mismatches)} group(s) disagree:")
+                for key, server_seconds, client_seconds in mismatches:
+                    label = " / ".join(names.get(part, part or "(none)") for part in key)
+                    print(f"  {label}: server {server_seconds / 3600:.2f}h, client {client_seconds / 3600:.2f}h")
+                return 1
+            print("\n✅ Server and client aggregation agree")
+            return 0
+
+        before = client.bytes_received
+        if args.mode == "server":
+            totals = server_totals(client, start, end, groups)
+        else:
+            totals = client_totals(client, user["id"], start, end, groups)
+        print_totals(totals, groups, names)
+        print(f"Transferred: {(client.bytes_received - before) / 1024:.1f} KB ({args.mode} mode)")
+        print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
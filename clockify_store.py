@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Local Clockify entry store
+Keeps one compact record per time entry and running totals by project and user,
+so report numbers update incrementally instead of being recomputed
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from clockify_client import parse_duration
+
+# entry id -> (projectId, userId, seconds)
+Record = Tuple[str, str, float]
+
+
+def entry_seconds(entry: Dict) -> float:
+    """Tracked seconds of a raw Clockify entry; running timers count as zero"""
+    interval = entry.get("timeInterval") or {}
+    if not interval.get("end"):
+        return 0.0
+    if interval.get("duration"):
+        return parse_duration(interval["duration"]) * 3600
+    start = datetime.strptime(interval["start"][:19], "%Y-%m-%dT%H:%M:%S")
+    end = datetime.strptime(interval["end"][:19], "%Y-%m-%dT%H:%M:%S")
+    return max(0.0, (end - start).total_seconds())
+
+
+class EntryStore:
+    """
+    In-memory entry store with incrementally maintained aggregates
+    Applying the same event twice leaves the totals unchanged
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, Record] = {}
+        self.by_project: Dict[str, float] = {}
+        self.by_user: Dict[str, float] = {}
+        self.total = 0.0
+        self.version = 0
+
+    def _add(self, record: Record, sign: int):
+        project_id, user_id, seconds = record
+        delta = sign * seconds
+        self.by_project[project_id] = self.by_project.get(project_id, 0.0) + delta
+        self.by_user[user_id] = self.by_user.get(user_id, 0.0) + delta
+        self.total += delta
+        if sign < 0:
+            # Drop groups that no longer have any time so the dicts stay small
+            if abs(self.by_project[project_id]) < 1e-6:
+                del self.by_project[project_id]
+            if abs(self.by_user[user_id]) < 1e-6:
+                del self.by_user[user_id]
+
+    def upsert(self, entry_id: str, project_id: Optional[str], user_id: Optional[str],
+               seconds: float):
+        """Insert or replace an entry, adjusting only the groups it touches"""
+        old = self.entries.get(entry_id)
+        if old is not None:
+            self._add(old, -1)
+        record = (project_id or "", user_id or "", seconds)
+        self.entries[entry_id] = record
+        self._add(record, +1)
+        self.version += 1
+
+    def delete(self, entry_id: str) -> bool:
+        old = self.entries.pop(entry_id, None)
+        if old is None:
+            return False
+        self._add(old, -1)
+        self.version += 1
+        return True
+
+    def apply_entry(self, entry: Dict, deleted: bool = False):
+        """Apply a raw Clockify time entry (webhook payload or API response)"""
+        if deleted:
+            self.delete(entry["id"])
+        else:
+            self.upsert(entry["id"], entry.get("projectId"), entry.get("userId"),
+                        entry_seconds(entry))
+
+    def aggregates(self) -> Dict:
+        return {
+            "entries": len(self.entries),
+            "totalHours": round(self.total / 3600, 4),
+            "byProject": {k: round(v / 3600, 4) for k, v in self.by_project.items()},
+            "byUser": {k: round(v / 3600, 4) for k, v in self.by_user.items()},
+            "version": self.version,
+        }
+
+    def load_export(self, path: str) -> int:
+        """Seed the store from a clockify_export.py JSONL file (optionally compressed)"""
+        opener = open
+        if path.endswith(".gz"):
+            import gzip
+            opener = gzip.open
+        elif path.endswith(".bz2"):
+            import bz2
+            opener = bz2.open
+        elif path.endswith(".xz"):
+            import lzma
+            opener = lzma.open
+        count = 0
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                row = json.loads(line)
+                seconds = row["hours"] * 3600 if row.get("end") else 0.0
+                self.upsert(row["id"], row.get("projectId"), row.get("userId"), seconds)
+                count += 1
+        return count
+
+    def save(self, path: str):
+        """Write a snapshot atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self.version,
+                       "entries": {k: list(v) for k, v in self.entries.items()}}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "EntryStore":
+        store = cls()
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                snapshot = json.load(f)
+            for entry_id, (project_id, user_id, seconds) in snapshot["entries"].items():
+                store.upsert(entry_id, project_id, user_id, seconds)
+            store.version = snapshot.get("version", store.version)
+        return store
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+CRYB Platform - Clockify webhook receiver
+Applies time entry created/updated/deleted events to the local entry store
+instead of polling /time-entries for fresh report numbers
+
+Usage:
+    python3 clockify_webhook.py serve --secret $CLOCKIFY_WEBHOOK_SECRET --store entries.json
+    python3 clockify_webhook.py fixtures events.jsonl --count 100000 --secret test-secret
+    python3 clockify_webhook.py replay events.jsonl --url http://127.0.0.1:8787/webhook
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import os
+import random
+import signal
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from clockify_store import EntryStore
+
+SIGNATURE_HEADER = "clockify-signature"
+EVENT_HEADER = "clockify-webhook-event-type"
+
+# Clockify event types that touch time entries, mapped to "is this a delete"
+EVENT_TYPES = {
+    "NEW_TIME_ENTRY": False,
+    "NEW_TIMER_STARTED": False,
+    "TIMER_STOPPED": False,
+    "TIME_ENTRY_UPDATED": False,
+    "TIME_ENTRY_DELETED": True,
+}
+
+MAX_BODY_BYTES = 1024 * 1024
+
+REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized",
+           404: "Not Found", 413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class WebhookReceiver:
+    """
+    Minimal asyncio HTTP/1.1 receiver
+    Requests are verified and queued; a single applier task drains the queue
+    into the store, so a burst costs queue slots rather than store contention
+    """
+
+    def __init__(self, store: EntryStore, secrets: List[str], queue_size: int = 10000,
+                 enqueue_timeout: float = 2.0, store_path: Optional[str] = None,
+                 snapshot_interval: float = 30.0):
+        self.store = store
+        self.secrets = [secret.encode("utf-8") for secret in secrets]
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.enqueue_timeout = enqueue_timeout
+        self.store_path = store_path
+        self.snapshot_interval = snapshot_interval
+        self.stats = {"accepted": 0, "applied": 0, "rejected": 0, "shed": 0}
+
+    def verify(self, signature: Optional[str]) -> bool:
+        """
+        Clockify sends the webhook's signing secret in Clockify-Signature;
+        compare in constant time against every configured webhook
+        """
+        if not signature:
+            return False
+        candidate = signature.encode("utf-8")
+        return any(hmac.compare_digest(candidate, secret) for secret in self.secrets)
+
+    async def apply_events(self):
+        while True:
+            deleted, entry = await self.queue.get()
+            self.store.apply_entry(entry, deleted)
+            self.stats["applied"] += 1
+            self.queue.task_done()
+
+    async def snapshot_loop(self):
+        saved_version = self.store.version
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            if self.store.version != saved_version:
+                saved_version = self.store.version
+                self.store.save(self.store_path)
+
+    async def handle_event(self, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict]:
+        if not self.verify(headers.get(SIGNATURE_HEADER)):
+            self.stats["rejected"] += 1
+            return 401, {"error": "invalid signature"}
+        event_type = headers.get(EVENT_HEADER, "")
+        if event_type not in EVENT_TYPES:
+            # Acknowledge events we do not track so Clockify does not retry them
+            return 200, {"ignored": event_type}
+        try:
+            entry = json.loads(body)
+            entry["id"]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": "invalid time entry payload"}
+        try:
+            await asyncio.wait_for(self.queue.put((EVENT_TYPES[event_type], entry)),
+                                   self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.stats["shed"] += 1
+            return 503, {"error": "queue full"}
+        self.stats["accepted"] += 1
+        return 202, {"queued": self.queue.qsize()}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {"error": "payload too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if method == "POST" and path.startswith("/webhook"):
+                    status, payload = await self.handle_event(headers, body)
+                elif method == "GET" and path == "/aggregates":
+                    status, payload = 200, self.store.aggregates()
+                elif method == "GET" and path == "/healthz":
+                    status, payload = 200, dict(self.stats, queueDepth=self.queue.qsize())
+                else:
+                    status, payload = 404, {"error": f"no route for {method} {path}"}
+
+                close = headers.get("connection", "").lower() == "close" or version.startswith("HTTP/1.0")
+                await self.respond(writer, status, payload, close=close)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer: asyncio.StreamWriter, status: int, payload: Dict, close: bool = False):
+        body = json.dumps(payload).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        if close:
+            head += "Connection: close\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        tasks = [asyncio.create_task(self.apply_events())]
+        if self.store_path:
+            tasks.append(asyncio.create_task(self.snapshot_loop()))
+        print(f"🪝 Clockify webhook receiver on http://{host}:{port}/webhook "
+              f"({len(self.store.entries)} entries loaded)")
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            # Let already accepted events reach the store before the final snapshot
+            try:
+                await asyncio.wait_for(self.queue.join(), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                print(f"⚠️  Shutdown timed out with {self.queue.qsize()} accepted events "
+                      f"not applied; they are dropped")
+            for task in tasks:
+                task.cancel()
+            if self.store_path:
+                self.store.save(self.store_path)
+                print(f"💾 Saved {len(self.store.entries)} entries to {self.store_path}")
+
+
+def generate_fixtures(path: str, count: int, secret: str, seed: int = 42,
+                      projects: int = 5, users: int = 3):
+    """
+    Write a replayable JSONL stream of signed webhook events
+    Roughly 60% creates, 30% updates of earlier entries and 10% deletes
+    """
+    rng = random.Random(seed)
+    anchor = datetime(2025, 9, 20)
+    live: List[str] = []
+    with open(path, "w") as f:
+        for i in range(count):
+            roll = rng.random()
+            if live and roll < 0.1:
+                entry_id = live.pop(rng.randrange(len(live)))
+                event_type = "TIME_ENTRY_DELETED"
+            elif live and roll < 0.4:
+                entry_id = live[rng.randrange(len(live))]
+                event_type = "TIME_ENTRY_UPDATED"
+            else:
+                entry_id = f"fixture-entry-{i}"
+                live.append(entry_id)
+                event_type = "NEW_TIME_ENTRY"
+            start = anchor - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+            minutes = rng.randint(15, 120)
+            entry = {
+                "id": entry_id,
+                "description": f"Fixture task {i}",
+                "projectId": f"mock-project-{rng.randrange(projects)}",
+                "userId": f"mock-user-{rng.randrange(users)}",
+                "timeInterval": {
+                    "start": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "end": (start + timedelta(minutes=minutes)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "duration": f"PT{minutes // 60}H{minutes % 60}M" if minutes >= 60 else f"PT{minutes}M",
+                },
+            }
+            f.write(json.dumps({"eventType": event_type, "signature": secret, "body": entry}))
+            f.write("\n")
+
+
+async def replay_fixtures(path: str, url: str, concurrency: int = 32) -> Dict:
+    """Post every fixture event over keep-alive connections and measure throughput"""
+    target = urlparse(url)
+    with open(path, "r") as f:
+        events = [json.loads(line) for line in f]
+
+    # Events for the same entry must arrive in order, so shard by entry id
+    shards: List[List[Dict]] = [[] for _ in range(concurrency)]
+    for event in events:
+        shards[hash(event["body"]["id"]) % concurrency].append(event)
+
+    statuses: Dict[int, int] = {}
+
+    async def worker(shard: List[Dict]):
+        reader, writer = await asyncio.open_connection(target.hostname, target.port or 80)
+        try:
+            for event in shard:
+                body = json.dumps(event["body"]).encode("utf-8")
+                while True:
+                    writer.write(
+                        (f"POST {target.path or '/'} HTTP/1.1\r\n"
+                         f"Host: {target.netloc}\r\n"
+                         f"Content-Type: application/json\r\n"
+                         f"Clockify-Signature: {event['signature']}\r\n"
+                         f"Clockify-Webhook-Event-Type: {event['eventType']}\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+                    await writer.drain()
+                    status = int((await reader.readline()).split()[1])
+                    length = 0
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b""):
+                            break
+                        if line.lower().startswith(b"content-length:"):
+                            length = int(line.split(b":", 1)[1])
+                    await reader.readexactly(length)
+                    statuses[status] = statuses.get(status, 0) + 1
+                    if status != 503:
+                        break
+                    await asyncio.sleep(0.05)  # Honour back-pressure and retry
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(shard) for shard in shards if shard))
+    elapsed = time.perf_counter() - started
+    return {"events": len(events), "seconds": elapsed,
+            "eventsPerSecond": len(events) / max(elapsed, 1e-9), "statuses": statuses}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clockify webhook ingestion")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the webhook receiver")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8787)
+    serve.add_argument("--secret", action="append",
+                       default=[s for s in os.environ.get("CLOCKIFY_WEBHOOK_SECRET", "").split(",") if s],
+                       help="Webhook signing secret (repeat for several webhooks)")
+    serve.add_argument("--store", help="Snapshot file to load on start and save periodically")
+    serve.add_argument("--seed-export", help="Seed the store from a clockify_export.py JSONL file")
+    serve.add_argument("--queue-size", type=int, default=10000)
+    serve.add_argument("--enqueue-timeout", type=float, default=2.0,
+                       help="Seconds to wait for queue space before answering 503")
+
+    fixtures = commands.add_parser("fixtures", help="Generate replayable signed events")
+    fixtures.add_argument("output")
+    fixtures.add_argument("--count", type=int, default=10000)
+    fixtures.add_argument("--secret", default="test-secret")
+    fixtures.add_argument("--seed", type=int, default=42)
+
+    replay = commands.add_parser("replay", help="Replay fixture events against a receiver")
+    replay.add_argument("fixtures")
+    replay.add_argument("--url", default="http://127.0.0.1:8787/webhook")
+    replay.add_argument("--concurrency", type=int, default=32)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "fixtures":
+        generate_fixtures(args.output, args.count, args.secret, args.seed)
+        print(f"✅ Wrote {args.count} webhook events to {args.output}")
+        return 0
+
+    if args.command == "replay":
+        result = asyncio.run(replay_fixtures(args.fixtures, args.url, args.concurrency))
+        print(f"📈 Replayed {result['events']} events in {result['seconds']:.2f}s "
+              f"({result['eventsPerSecond']:.0f} events/s)")
+        print(f"   Responses: {result['statuses']}")
+        return 0
+
+    if not args.secret:
+        parser.error("at least one --secret (or CLOCKIFY_WEBHOOK_SECRET) is required")
+    store = EntryStore.load(args.store) if args.store else EntryStore()
+    if args.seed_export:
+        print(f"🌱 Seeded {store.load_export(args.seed_export)} entries from {args.seed_export}")
+    receiver = WebhookReceiver(store, args.secret, args.queue_size, args.enqueue_timeout, args.store)
+    asyncio.run(receiver.serve(args.host, args.port))
+    print("👋 Webhook receiver stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())